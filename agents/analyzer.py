@@ -3,13 +3,20 @@ Analyzer Agent
 Extracts entities, events, and claims using LLM
 """
 
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
 from loguru import logger
 from agents.state import AgentState
-from models.llm_client import create_llm_client
+from models.llm_client import get_llm_client
 import json
 import time
 import hashlib
+import threading
+
+
+# Prefetched analyses kept at most; the oldest are dropped first, so
+# articles that never reach process() can't pile up
+MAX_PREFETCHED = 256
 
 
 class AnalyzerAgent:
@@ -42,12 +49,89 @@ Respond with valid JSON only:
   "summary": "Brief 2-sentence summary"
 }}"""
     
+    SYSTEM_PROMPT = "You are an expert OSINT analyst. Extract structured information from articles."
+    
+    # Same extraction as ANALYSIS_PROMPT, sent once as the system prompt of a
+    # batch so each query only carries its article text
+    BATCH_SYSTEM_PROMPT = """You are an expert OSINT analyst. Each query is an article. For each one extract:
+
+1. **Entities**: People, organizations, locations mentioned
+2. **Events**: Significant occurrences described
+3. **Claims**: Factual statements that can be verified
+
+Answer each query with a JSON object:
+{
+  "entities": [
+    {"name": "Entity Name", "type": "PERSON|ORGANIZATION|LOCATION|CONCEPT", "context": "brief context"}
+  ],
+  "events": [
+    {"description": "What happened", "type": "ANNOUNCEMENT|CONFLICT|MEETING|POLICY", "timestamp": "when or null", "location": "where or null"}
+  ],
+  "claims": [
+    {"text": "The claim", "context": "surrounding context", "confidence": 0.0-1.0}
+  ],
+  "sentiment": {"polarity": -1.0 to 1.0, "subjectivity": 0.0-1.0},
+  "summary": "Brief 2-sentence summary"
+}"""
+    
     def __init__(self):
         """Initialize Analyzer Agent"""
         self.name = "AnalyzerAgent"
-        self.llm = create_llm_client()
+        self.llm = get_llm_client()
+        
+        # Analyses fetched ahead by prefetch(), keyed by prepared article text
+        self._prefetched: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+        
         logger.info(f"{self.name} initialized")
         
+    @staticmethod
+    def _prepare_text(full_text: str) -> Optional[str]:
+        """Text sent to the LLM, or None if it's too short to analyze"""
+        if not full_text or len(full_text) < 50:
+            return None
+        
+        # Truncate if too long (LLM token limits)
+        if len(full_text) > 4000:
+            full_text = full_text[:4000] + "..."
+        return full_text
+        
+    def prefetch(self, texts: List[str]) -> None:
+        """
+        Analyze several articles with batched LLM requests ahead of process()
+        
+        process() uses a prefetched analysis for the same text instead of
+        making its own request; articles whose batch answer is missing fall
+        back to a single request.
+        
+        Args:
+            texts: Full article texts, as prepared by the collector
+        """
+        prepared = list(dict.fromkeys(t for t in map(self._prepare_text, texts) if t))
+        if not prepared:
+            return
+        
+        analyses = self.llm.generate_json_batch(
+            prompts=prepared,
+            system_prompt=self.BATCH_SYSTEM_PROMPT,
+            temperature=0.3,
+            max_tokens=2000,
+        )
+        
+        with self._prefetch_lock:
+            for text, analysis in zip(prepared, analyses):
+                if analysis is not None:
+                    self._prefetched[text] = analysis
+                    self._prefetched.move_to_end(text)
+            while len(self._prefetched) > MAX_PREFETCHED:
+                self._prefetched.popitem(last=False)
+        logger.info(f"[{self.name}] Prefetched {sum(a is not None for a in analyses)}/{len(prepared)} analyses")
+        
+    def clear_prefetched(self) -> None:
+        """Drop prefetched analyses that process() never used"""
+        with self._prefetch_lock:
+            self._prefetched.clear()
+        
     def process(self, state: AgentState) -> AgentState:
         """
         Analyze text and extract structured information
@@ -63,19 +147,18 @@ Respond with valid JSON only:
         try:
             logger.info(f"[{self.name}] Analyzing...")
             
-            full_text = state['raw_data'].get('full_text', '')
+            full_text = self._prepare_text(state['raw_data'].get('full_text', ''))
             
-            if not full_text or len(full_text) < 50:
+            if not full_text:
                 logger.warning(f"[{self.name}] Text too short, skipping")
                 state['next_agent'] = 'GraphBuilderAgent'
                 return state
             
-            # Truncate if too long (LLM token limits)
-            if len(full_text) > 4000:
-                full_text = full_text[:4000] + "..."
-            
-            # Use LLM to extract information
-            analysis = self._analyze_with_llm(full_text)
+            # Use a prefetched analysis if there is one, else ask the LLM
+            with self._prefetch_lock:
+                analysis = self._prefetched.pop(full_text, None)
+            if analysis is None:
+                analysis = self._analyze_with_llm(full_text)
             
             if analysis:
                 # Process entities
@@ -133,7 +216,7 @@ Respond with valid JSON only:
             
             response = self.llm.generate_json(
                 prompt=prompt,
-                system_prompt="You are an expert OSINT analyst. Extract structured information from articles.",
+                system_prompt=self.SYSTEM_PROMPT,
                 temperature=0.3,  # Lower temperature for structured output
                 max_tokens=2000,
             )
@@ -5,7 +5,7 @@ Uses NLI models to detect bias and verify claims
 
 from typing import Dict, Any, List
 from agents.state import AgentState
-from models.llm_client import create_llm_client
+from models.llm_client import get_llm_client
 from loguru import logger
 import time
 
@@ -39,7 +39,7 @@ class BiasDetectorAgent:
     
     def __init__(self):
         """Initialize bias detector"""
-        self.llm = create_llm_client()
+        self.llm = get_llm_client()
         logger.info("BiasDetectorAgent initialized")
         
     def process(self, state: AgentState) -> AgentState:
@@ -3,9 +3,10 @@ Cross-Reference Agent
 Queries Neo4j to find similar or contradictory claims
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from agents.state import AgentState
 from graph.neo4j_client import Neo4jClient
+from models.embeddings import get_embedding_model
 from loguru import logger
 import time
 
@@ -24,6 +25,7 @@ class CrossReferenceAgent:
     def __init__(self):
         """Initialize cross-reference agent"""
         self.neo4j = Neo4jClient()
+        self.embedder = get_embedding_model()
         logger.info("CrossReferenceAgent initialized")
         
     def process(self, state: AgentState) -> AgentState:
@@ -39,10 +41,12 @@ class CrossReferenceAgent:
         logger.info("[CrossReferenceAgent] Cross-referencing claims...")
         start_time = time.time()
         
+        self._embed_claims(state['claims'])
+        
         # Process each claim
         for claim in state['claims']:
             # Find similar existing claims
-            similar = self._find_similar_claims(claim['text'])
+            similar = self._find_similar_claims(claim['text'], claim.get('embedding'))
             claim['similar_claims'] = similar
             
             # Check for contradictions
@@ -74,18 +78,38 @@ class CrossReferenceAgent:
         
         return state
         
-    def _find_similar_claims(self, claim_text: str) -> list:
+    def _embed_claims(self, claims: list) -> None:
+        """
+        Attach an embedding to each claim, encoding them in one batch
+        
+        The graph builder stores the same vectors on the Claim nodes.
+        
+        Args:
+            claims: Claims to embed in place
+        """
+        if not self.embedder or not claims:
+            return
+        
+        try:
+            vectors = self.embedder.encode([claim['text'] for claim in claims])
+            for claim, vector in zip(claims, vectors):
+                claim['embedding'] = vector
+        except Exception as e:
+            logger.error(f"Error embedding claims: {e}")
+            
+    def _find_similar_claims(self, claim_text: str, embedding: Optional[List[float]] = None) -> list:
         """
         Find similar claims in graph
         
         Args:
             claim_text: Claim text
+            embedding: Claim vector, if one was computed
             
         Returns:
             List of similar claims
         """
         try:
-            similar = self.neo4j.find_similar_claims(claim_text, limit=5)
+            similar = self.neo4j.find_similar_claims(claim_text, limit=5, embedding=embedding)
             logger.debug(f"Found {len(similar)} similar claims")
             return similar
         except Exception as e:
@@ -6,6 +6,7 @@ Updates Neo4j knowledge graph with entities, events, claims
 from typing import Dict, Any, List
 from agents.state import AgentState, GraphOperation
 from graph.neo4j_client import Neo4jClient
+from graph.epoch import GraphEpoch
 from loguru import logger
 import time
 
@@ -25,6 +26,7 @@ class GraphBuilderAgent:
     def __init__(self):
         """Initialize graph builder"""
         self.neo4j = Neo4jClient()
+        self.epoch = GraphEpoch()
         logger.info("GraphBuilderAgent initialized")
         
     def process(self, state: AgentState) -> AgentState:
@@ -42,9 +44,9 @@ class GraphBuilderAgent:
         
         operations = []
         
+        # Everything below is collected and written in a single transaction
         # 1. Create source node
         if state.get('source'):
-            self._create_source(state['source'])
             operations.append(
                 GraphOperation(
                     operation_type='CREATE',
@@ -56,7 +58,6 @@ class GraphBuilderAgent:
             
         # 2. Create entities
         for entity in state['entities']:
-            self._create_entity(entity)
             operations.append(
                 GraphOperation(
                     operation_type='CREATE',
@@ -67,8 +68,9 @@ class GraphBuilderAgent:
             )
             
         # 3. Create claims and link to entities
+        entity_links = []
+        contradiction_links = []
         for claim in state['claims']:
-            self._create_claim(claim)
             operations.append(
                 GraphOperation(
                     operation_type='CREATE',
@@ -82,7 +84,7 @@ class GraphBuilderAgent:
             # Try both 'about_entities' (from analyzer) and 'mentioned_entities' (legacy)
             entity_ids = claim.get('about_entities', []) or claim.get('mentioned_entities', [])
             for entity_id in entity_ids:
-                self._link_claim_to_entity(claim['id'], entity_id)
+                entity_links.append({'claim_id': claim['id'], 'entity_id': entity_id})
                 operations.append(
                     GraphOperation(
                         operation_type='LINK',
@@ -98,7 +100,7 @@ class GraphBuilderAgent:
                 claim_source = claim.get('source_id', '')
                 for entity in state['entities']:
                     if entity.get('source_id', '') == claim_source:
-                        self._link_claim_to_entity(claim['id'], entity['id'])
+                        entity_links.append({'claim_id': claim['id'], 'entity_id': entity['id']})
                         operations.append(
                             GraphOperation(
                                 operation_type='LINK',
@@ -110,11 +112,11 @@ class GraphBuilderAgent:
                 
             # Link contradictions
             for contradiction in claim.get('contradictions', []):
-                self._link_contradiction(
-                    claim['id'],
-                    contradiction['claim_id'],
-                    contradiction['confidence']
-                )
+                contradiction_links.append({
+                    'claim1_id': claim['id'],
+                    'claim2_id': contradiction['claim_id'],
+                    'confidence': contradiction['confidence']
+                })
                 operations.append(
                     GraphOperation(
                         operation_type='LINK',
@@ -123,6 +125,8 @@ class GraphBuilderAgent:
                         properties={'relationship': 'CONTRADICTS'}
                     )
                 )
+        
+        written = self._write_graph(state, entity_links, contradiction_links)
                 
         # 4. Create events
         for event in state['events']:
@@ -147,6 +151,10 @@ class GraphBuilderAgent:
             'timestamp': time.time()
         })
         
+        # Invalidate analytics computed on the previous graph version
+        if operations and written:
+            self.epoch.bump()
+        
         # Mark as complete
         state['next_agent'] = 'COMPLETE'
         
@@ -155,56 +163,41 @@ class GraphBuilderAgent:
         
         return state
         
-    def _create_source(self, source: Dict[str, Any]) -> None:
-        """Create source node"""
-        try:
-            self.neo4j.create_source(source)
-            logger.debug(f"Created source: {source.get('source_name')}")
-        except Exception as e:
-            logger.error(f"Failed to create source: {e}")
-            
-    def _create_entity(self, entity: Dict[str, Any]) -> None:
-        """Create entity node"""
-        try:
-            self.neo4j.create_entity(entity)
-            logger.debug(f"Created entity: {entity['name']}")
-        except Exception as e:
-            logger.error(f"Failed to create entity: {e}")
-            
-    def _create_claim(self, claim: Dict[str, Any]) -> None:
-        """Create claim node"""
+    def _write_graph(
+        self,
+        state: AgentState,
+        entity_links: List[Dict[str, str]],
+        contradiction_links: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Write source, entities, claims and links in one transaction
+        
+        Returns:
+            True if the transaction committed; failures are added to state['errors']
+        """
         try:
-            self.neo4j.create_claim(claim)
-            logger.debug(f"Created claim: {claim['id']}")
+            self.neo4j.write_article(
+                state.get('source'),
+                state['entities'],
+                state['claims'],
+                entity_links,
+                contradiction_links
+            )
+            logger.debug(
+                f"Wrote {len(state['entities'])} entities, {len(state['claims'])} claims, "
+                f"{len(entity_links) + len(contradiction_links)} links"
+            )
+            return True
         except Exception as e:
-            logger.error(f"Failed to create claim: {e}")
+            logger.error(f"Failed to write graph: {e}")
+            state['errors'].append(f"GraphBuilderAgent: {str(e)}")
+            return False
             
     def _create_event(self, event: Dict[str, Any]) -> None:
         """Create event node"""
         # Note: Need to add create_event to Neo4jClient
         logger.debug(f"Event creation not yet implemented: {event['id']}")
         
-    def _link_claim_to_entity(self, claim_id: str, entity_id: str) -> None:
-        """Link claim to entity"""
-        try:
-            self.neo4j.link_claim_to_entity(claim_id, entity_id)
-            logger.debug(f"Linked claim {claim_id} to entity {entity_id}")
-        except Exception as e:
-            logger.error(f"Failed to link claim to entity: {e}")
-            
-    def _link_contradiction(
-        self,
-        claim1_id: str,
-        claim2_id: str,
-        confidence: float
-    ) -> None:
-        """Link contradictory claims"""
-        try:
-            self.neo4j.link_claim_contradiction(claim1_id, claim2_id, confidence)
-            logger.debug(f"Linked contradiction: {claim1_id} <-> {claim2_id}")
-        except Exception as e:
-            logger.error(f"Failed to link contradiction: {e}")
-            
     def get_graph_stats(self) -> Dict[str, int]:
         """Get current graph statistics"""
         return self.neo4j.get_stats()
@@ -212,6 +205,7 @@ class GraphBuilderAgent:
     def close(self):
         """Close connections"""
         self.neo4j.close()
+        self.epoch.close()
 
 
 if __name__ == "__main__":
@@ -10,7 +10,7 @@ from agents.analyzer import AnalyzerAgent
 from agents.cross_reference import CrossReferenceAgent
 from agents.bias_detector import BiasDetectorAgent
 from agents.graph_builder import GraphBuilderAgent
-from typing import Dict, Any
+from typing import Dict, Any, List
 from loguru import logger
 import time
 
@@ -191,6 +191,22 @@ class MultiAgentOrchestrator:
         logger.info(f"Agents: {' → '.join([log['agent'] for log in state['processing_log']])}")
         logger.info(f"{'='*60}\n")
         
+    def prefetch_analysis(self, articles: List[Dict[str, Any]]) -> None:
+        """
+        Batch the analyzer's LLM calls for articles about to be processed
+        
+        Args:
+            articles: Raw article data from Kafka
+        """
+        try:
+            self.analyzer.prefetch([self.collector._prepare_text(a) for a in articles])
+        except Exception as e:
+            logger.warning(f"Batch analysis failed, articles will be analyzed one by one: {e}")
+            
+    def clear_prefetched(self) -> None:
+        """Drop analyses prefetched for a batch once all its articles are handled"""
+        self.analyzer.clear_prefetched()
+        
     def close(self):
         """Close all agent connections"""
         self.cross_reference.close()
@@ -105,6 +105,32 @@ class CredibilityScorer:
         # Get source data
         source_data = self._get_source_data(source_name, days)
         
+        return self._score_from_data(source_name, source_data)
+    
+    def score_sources(self, source_names: List[str], days: int = 30) -> Dict[str, SourceCredibility]:
+        """
+        Score several sources, fetching their data in a single query.
+        
+        Args:
+            source_names: Names of the sources to evaluate
+            days: Number of days of history to consider
+        
+        Returns:
+            Mapping of source name to SourceCredibility
+        """
+        if not source_names:
+            return {}
+        
+        logger.info(f"Scoring {len(source_names)} sources")
+        sources_data = self._get_sources_data(source_names, days)
+        
+        return {
+            name: self._score_from_data(name, sources_data.get(name))
+            for name in source_names
+        }
+    
+    def _score_from_data(self, source_name: str, source_data: Optional[Dict]) -> SourceCredibility:
+        """Build a SourceCredibility from the raw graph metrics of a source"""
         if not source_data:
             logger.warning(f"No data found for source: {source_name}")
             return self._create_default_score(source_name)
@@ -158,9 +184,8 @@ class CredibilityScorer:
         """Score all sources in the database"""
         sources = self._get_all_sources()
         
-        credibility_scores = {}
-        for source in sources:
-            credibility_scores[source] = self.score_source(source, days)
+        # One batched metrics query for every source instead of one per source
+        credibility_scores = self.score_sources(sources, days)
         
         logger.info(f"Scored {len(credibility_scores)} sources")
         return credibility_scores
@@ -169,29 +194,36 @@ class CredibilityScorer:
     
     def _get_source_data(self, source_name: str, days: int) -> Optional[Dict]:
         """Get comprehensive data for an entity (treated as source)"""
+        return self._get_sources_data([source_name], days).get(source_name)
+    
+    def _get_sources_data(self, source_names: List[str], days: int) -> Dict[str, Dict]:
+        """Get comprehensive data for several entities (treated as sources) in one round trip"""
         cutoff = datetime.now() - timedelta(days=days)
         
         query = """
-        MATCH (e:Entity {name: $source_name})<-[:ABOUT]-(c:Claim)
+        UNWIND $source_names as source_name
+        MATCH (e:Entity {name: source_name})<-[:ABOUT]-(c:Claim)
         WHERE c.timestamp >= datetime($cutoff)
-        WITH count(c) as total_claims,
+        WITH source_name,
+             count(c) as total_claims,
              avg(c.confidence_score) as avg_confidence,
              collect(c) as claims
         
         // Find contradicted claims
         UNWIND claims as claim
         OPTIONAL MATCH (claim)-[:CONTRADICTS]-(other)
-        WITH total_claims, avg_confidence, claims,
+        WITH source_name, total_claims, avg_confidence, claims,
              count(DISTINCT other) as contradicted_claims
         
         // Count related entities (cross-validation proxy)
         UNWIND claims as c
         OPTIONAL MATCH (c)-[:ABOUT]->(e2:Entity)
-        WHERE e2.name <> $source_name
-        WITH total_claims, avg_confidence, contradicted_claims,
+        WHERE e2.name <> source_name
+        WITH source_name, total_claims, avg_confidence, contradicted_claims,
              count(DISTINCT e2) as cross_validated_claims
         
-        RETURN total_claims,
+        RETURN source_name,
+               total_claims,
                avg_confidence,
                contradicted_claims,
                cross_validated_claims
@@ -201,19 +233,20 @@ class CredibilityScorer:
             results = self.neo4j.execute_query(
                 query,
                 {
-                    "source_name": source_name,
+                    "source_names": list(source_names),
                     "cutoff": cutoff.isoformat()
                 }
             )
             
-            if results and results[0]['total_claims'] > 0:
-                return results[0]
-            
-            return None
+            return {
+                r['source_name']: r
+                for r in results
+                if r['total_claims'] > 0
+            }
             
         except Exception as e:
             logger.error(f"Failed to get source data: {e}")
-            return None
+            return {}
     
     def _get_all_sources(self) -> List[str]:
         """Get list of all entities with claims (treating them as sources)"""
@@ -458,12 +491,14 @@ class CredibilityScorer:
             all_claims = [claim for r in results for claim in r['claims']]
             agreement_score = self._calculate_agreement(all_claims)
             
-            # Get credibility scores for ranking
-            source_scores = {}
-            for source in sources:
-                if source not in self.source_cache:
-                    self.score_source(source, days)
-                source_scores[source] = self.source_cache[source].overall_score
+            # Get credibility scores for ranking, scoring uncached sources in one batch
+            new_scores = self.score_sources(
+                [s for s in sources if s not in self.source_cache], days
+            )
+            source_scores = {
+                source: (new_scores.get(source) or self.source_cache[source]).overall_score
+                for source in sources
+            }
             
             # Rank sources
             ranked_sources = sorted(source_scores.items(), key=lambda x: x[1], reverse=True)
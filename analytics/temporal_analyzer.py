@@ -6,15 +6,147 @@ Detects trends, anomalies, and significant changes in the knowledge graph.
 """
 
 import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from collections import defaultdict
 from dataclasses import dataclass, asdict
+import numpy as np
 from loguru import logger
 
 from graph.neo4j_client import Neo4jClient
 
 
+# ==================== Cypher Queries ====================
+# Kept at module scope so every call sends the identical query string and
+# Neo4j can reuse the cached execution plan.
+
+_TREND_QUERY = """
+MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
+WHERE c.timestamp >= datetime($cutoff)
+WITH e, 
+     count(c) as mention_count,
+     avg(c.confidence_score) as avg_confidence,
+     collect(c.confidence_score) as confidences,
+     min(c.timestamp) as first_seen,
+     max(c.timestamp) as last_seen
+WHERE mention_count > 0
+RETURN e.name as entity_name,
+       e.type as entity_type,
+       mention_count,
+       avg_confidence,
+       confidences,
+       first_seen,
+       last_seen
+ORDER BY mention_count DESC
+LIMIT 50
+"""
+
+_SPIKE_QUERY = """
+MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
+WHERE c.timestamp >= datetime($cutoff)
+WITH e, count(c) as recent_count
+WHERE recent_count >= 5
+MATCH (e)<-[:ABOUT]-(c2:Claim)
+WHERE c2.timestamp < datetime($cutoff)
+WITH e, recent_count, count(c2) as historical_count
+WHERE historical_count > 0 AND recent_count > historical_count * 3
+RETURN e.name as entity_name,
+       e.type as entity_type,
+       recent_count,
+       historical_count
+"""
+
+_CONFIDENCE_DROP_QUERY = """
+MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
+WHERE c.timestamp >= datetime($cutoff)
+WITH e, avg(c.confidence_score) as recent_confidence
+WHERE recent_confidence < 0.5
+MATCH (e)<-[:ABOUT]-(c2:Claim)
+WHERE c2.timestamp < datetime($cutoff)
+WITH e, recent_confidence, avg(c2.confidence_score) as historical_confidence
+WHERE historical_confidence > 0.7 AND recent_confidence < historical_confidence - 0.3
+RETURN e.name as entity_name,
+       e.type as entity_type,
+       recent_confidence,
+       historical_confidence
+"""
+
+_CLUSTER_QUERY = """
+MATCH (e1:Entity)<-[:ABOUT]-(c:Claim)-[:ABOUT]->(e2:Entity)
+WHERE c.timestamp >= datetime($cutoff) AND e1 <> e2
+WITH e1, count(DISTINCT e2) as new_connections
+WHERE new_connections >= 3
+RETURN e1.name as entity_name,
+       e1.type as entity_type,
+       new_connections
+ORDER BY new_connections DESC
+LIMIT 10
+"""
+
+_ENTITY_TIMELINE_QUERY = """
+MATCH (e:Entity {name: $entity_name})
+OPTIONAL MATCH (e)<-[:ABOUT]-(c:Claim)
+WHERE c.timestamp >= datetime($cutoff)
+WITH e, c
+ORDER BY c.timestamp
+RETURN e.name as entity_name,
+       e.type as entity_type,
+       toString(e.created_at) as created_at,
+       collect({
+           timestamp: toString(c.timestamp),
+           claim_text: c.text,
+           confidence: c.confidence_score
+       }) as mentions
+"""
+
+# Claims written by one article share a timestamp, so pages are keyed on
+# (timestamp, id) to avoid skipping the rest of an article at a page boundary
+_GLOBAL_TIMELINE_QUERY = """
+MATCH (c:Claim)
+WHERE c.timestamp >= datetime($cutoff)
+  AND ($before IS NULL
+       OR c.timestamp < datetime($before)
+       OR (c.timestamp = datetime($before) AND c.id < $before_id))
+WITH c
+ORDER BY c.timestamp DESC, c.id DESC
+LIMIT $limit
+OPTIONAL MATCH (c)-[:ABOUT]->(e:Entity)
+WITH c, collect(e.name) as entities
+RETURN toString(c.timestamp) as timestamp,
+       c.id as id,
+       c.text as claim_text,
+       c.confidence_score as confidence,
+       entities
+ORDER BY c.timestamp DESC, c.id DESC
+"""
+
+_TEMPORAL_STATS_QUERY = """
+CALL {
+    MATCH (c:Claim)
+    WHERE c.timestamp >= datetime($cutoff)
+    RETURN count(c) as total_claims
+}
+CALL {
+    MATCH (e:Entity)<-[:ABOUT]-(c2:Claim)
+    WHERE c2.timestamp >= datetime($cutoff)
+    RETURN count(DISTINCT e) as active_entities
+}
+CALL {
+    MATCH (e2:Entity)
+    WHERE e2.first_seen >= datetime($cutoff)
+    RETURN count(e2) as new_entities
+}
+RETURN total_claims, new_entities, active_entities
+"""
+
+# Spike ratio upper bounds for low/medium/high; anything above the last bound
+# is critical. Bucketed with searchsorted(side='left') so a ratio equal to a
+# bound falls in the lower bucket.
+_SPIKE_SEVERITY_BINS = np.array([1.5, 3.0, 5.0])
+_SEVERITY_LABELS = np.array(["low", "medium", "high", "critical"])
+
+
 @dataclass
 class TemporalEvent:
     """Represents a temporal event in the knowledge graph"""
@@ -84,10 +216,20 @@ class TemporalAnalyzer:
     - Compute temporal statistics
     """
     
-    def __init__(self, neo4j_client: Optional[Neo4jClient] = None):
-        """Initialize temporal analyzer"""
+    def __init__(self, neo4j_client: Optional[Neo4jClient] = None, cache_ttl: float = 60.0):
+        """
+        Initialize temporal analyzer
+        
+        Args:
+            neo4j_client: Shared Neo4j client (a new one is created if omitted)
+            cache_ttl: Seconds to keep trend/stats query results (0 disables caching)
+        """
         self.neo4j = neo4j_client or Neo4jClient()
         self.events: List[TemporalEvent] = []
+        self.cache_ttl = cache_ttl
+        self._query_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         logger.info("Temporal Analyzer initialized")
     
     # ==================== Event Tracking ====================
@@ -95,6 +237,7 @@ class TemporalAnalyzer:
     def record_event(self, event: TemporalEvent):
         """Record a temporal event"""
         self.events.append(event)
+        self.clear_cache()
     
     def get_recent_events(self, hours: int = 24) -> List[TemporalEvent]:
         """Get events from the last N hours"""
@@ -113,33 +256,16 @@ class TemporalAnalyzer:
         Returns:
             List of detected trends
         """
+        cached = self._cache_get("trends", time_period)
+        if cached is not None:
+            return cached
+        
         hours = self._parse_time_period(time_period)
         cutoff = datetime.now() - timedelta(hours=hours)
         
-        query = """
-        MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        WITH e, 
-             count(c) as mention_count,
-             avg(c.confidence_score) as avg_confidence,
-             collect(c.confidence_score) as confidences,
-             min(c.timestamp) as first_seen,
-             max(c.timestamp) as last_seen
-        WHERE mention_count > 0
-        RETURN e.name as entity_name,
-               e.type as entity_type,
-               mention_count,
-               avg_confidence,
-               confidences,
-               toString(first_seen) as first_seen,
-               toString(last_seen) as last_seen
-        ORDER BY mention_count DESC
-        LIMIT 50
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _TREND_QUERY,
                 {"cutoff": cutoff.isoformat()}
             )
             
@@ -164,13 +290,14 @@ class TemporalAnalyzer:
                     mention_count=record['mention_count'],
                     confidence_avg=record['avg_confidence'],
                     confidence_trend=confidence_trend,
-                    first_seen=datetime.fromisoformat(record['first_seen']),
-                    last_seen=datetime.fromisoformat(record['last_seen']),
+                    first_seen=record['first_seen'].to_native(),
+                    last_seen=record['last_seen'].to_native(),
                     sources=['Neo4j']  # Placeholder since source not in schema
                 )
                 trends.append(trend)
             
             logger.info(f"Detected {len(trends)} trends in {time_period}")
+            self._cache_set("trends", time_period, trends)
             return trends
             
         except Exception as e:
@@ -245,32 +372,26 @@ class TemporalAnalyzer:
     
     def _detect_mention_spikes(self, cutoff: datetime) -> List[AnomalyDetection]:
         """Detect sudden spikes in entity mentions"""
-        query = """
-        MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        WITH e, count(c) as recent_count
-        WHERE recent_count >= 5
-        MATCH (e)<-[:ABOUT]-(c2:Claim)
-        WHERE c2.timestamp < datetime($cutoff)
-        WITH e, recent_count, count(c2) as historical_count
-        WHERE historical_count > 0 AND recent_count > historical_count * 3
-        RETURN e.name as entity_name,
-               e.type as entity_type,
-               recent_count,
-               historical_count
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _SPIKE_QUERY,
                 {"cutoff": cutoff.isoformat()}
             )
             
+            if not results:
+                return []
+            
+            ratios = np.fromiter(
+                (r['recent_count'] / r['historical_count'] for r in results),
+                dtype=np.float64,
+                count=len(results)
+            )
+            severities = _SEVERITY_LABELS[
+                np.searchsorted(_SPIKE_SEVERITY_BINS, ratios, side='left')
+            ]
+            
             anomalies = []
-            for record in results:
-                spike_ratio = record['recent_count'] / record['historical_count']
-                severity = "critical" if spike_ratio > 5 else "high"
-                
+            for record, spike_ratio, severity in zip(results, ratios.tolist(), severities.tolist()):
                 anomaly = AnomalyDetection(
                     anomaly_type="sudden_spike",
                     entity_name=record['entity_name'],
@@ -294,24 +415,9 @@ class TemporalAnalyzer:
     
     def _detect_confidence_drops(self, cutoff: datetime) -> List[AnomalyDetection]:
         """Detect sudden drops in confidence scores"""
-        query = """
-        MATCH (e:Entity)<-[:ABOUT]-(c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        WITH e, avg(c.confidence_score) as recent_confidence
-        WHERE recent_confidence < 0.5
-        MATCH (e)<-[:ABOUT]-(c2:Claim)
-        WHERE c2.timestamp < datetime($cutoff)
-        WITH e, recent_confidence, avg(c2.confidence_score) as historical_confidence
-        WHERE historical_confidence > 0.7 AND recent_confidence < historical_confidence - 0.3
-        RETURN e.name as entity_name,
-               e.type as entity_type,
-               recent_confidence,
-               historical_confidence
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _CONFIDENCE_DROP_QUERY,
                 {"cutoff": cutoff.isoformat()}
             )
             
@@ -342,21 +448,9 @@ class TemporalAnalyzer:
     
     def _detect_entity_clusters(self, cutoff: datetime) -> List[AnomalyDetection]:
         """Detect new clusters of related entities"""
-        query = """
-        MATCH (e1:Entity)<-[:ABOUT]-(c:Claim)-[:ABOUT]->(e2:Entity)
-        WHERE c.timestamp >= datetime($cutoff) AND e1 <> e2
-        WITH e1, count(DISTINCT e2) as new_connections
-        WHERE new_connections >= 3
-        RETURN e1.name as entity_name,
-               e1.type as entity_type,
-               new_connections
-        ORDER BY new_connections DESC
-        LIMIT 10
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _CLUSTER_QUERY,
                 {"cutoff": cutoff.isoformat()}
             )
             
@@ -398,25 +492,9 @@ class TemporalAnalyzer:
         """
         cutoff = datetime.now() - timedelta(days=days)
         
-        query = """
-        MATCH (e:Entity {name: $entity_name})
-        OPTIONAL MATCH (e)<-[:ABOUT]-(c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        WITH e, c
-        ORDER BY c.timestamp
-        RETURN e.name as entity_name,
-               e.type as entity_type,
-               toString(e.created_at) as created_at,
-               collect({
-                   timestamp: toString(c.timestamp),
-                   claim_text: c.text,
-                   confidence: c.confidence_score
-               }) as mentions
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _ENTITY_TIMELINE_QUERY,
                 {
                     "entity_name": entity_name,
                     "cutoff": cutoff.isoformat()
@@ -452,83 +530,91 @@ class TemporalAnalyzer:
             logger.error(f"Timeline analysis failed: {e}")
             return {}
     
-    def get_global_timeline(self, hours: int = 24) -> List[Dict[str, Any]]:
+    def get_global_timeline(
+        self,
+        hours: int = 24,
+        limit: int = 500,
+        before: Optional[Union[Dict[str, str], datetime, str]] = None
+    ) -> Dict[str, Any]:
         """
-        Get global timeline of all activity.
+        Get global timeline of all activity, one page at a time.
         
         Args:
             hours: Time window
+            limit: Maximum number of claims per page
+            before: Cursor - pass the previous page's ``next_cursor``
+                    ({"timestamp", "id"}); a bare timestamp returns only
+                    claims strictly older than it
         
         Returns:
-            Chronological list of all events
+            Dict with ``rows`` (newest first) and ``next_cursor``
+            (None when there are no further pages)
         """
         cutoff = datetime.now() - timedelta(hours=hours)
-        
-        query = """
-        MATCH (c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        OPTIONAL MATCH (c)-[:ABOUT]->(e:Entity)
-        RETURN toString(c.timestamp) as timestamp,
-               c.text as claim_text,
-               c.confidence_score as confidence,
-               collect(e.name) as entities
-        ORDER BY c.timestamp DESC
-        """
+        before_id = None
+        if isinstance(before, dict):
+            before, before_id = before.get('timestamp'), before.get('id')
+        if isinstance(before, datetime):
+            before = before.isoformat()
         
         try:
-            results = self.neo4j.execute_query(
-                query,
-                {"cutoff": cutoff.isoformat()}
+            results = self.neo4j.stream_read(
+                _GLOBAL_TIMELINE_QUERY,
+                {
+                    "cutoff": cutoff.isoformat(),
+                    "before": before,
+                    "before_id": before_id,
+                    "limit": limit
+                }
             )
             
             timeline = []
             for record in results:
                 timeline.append({
                     "timestamp": record['timestamp'],
+                    "id": record['id'],
                     "claim_text": record['claim_text'],
                     "confidence": record['confidence'],
                     "entities": record['entities']
                 })
             
-            return timeline
+            next_cursor = None
+            if len(timeline) == limit:
+                next_cursor = {"timestamp": timeline[-1]['timestamp'], "id": timeline[-1]['id']}
+            return {"rows": timeline, "next_cursor": next_cursor}
             
         except Exception as e:
             logger.error(f"Global timeline failed: {e}")
-            return []
+            return {"rows": [], "next_cursor": None}
     
     # ==================== Statistics ====================
     
     def get_temporal_stats(self, time_period: str = "24h") -> Dict[str, Any]:
         """Get comprehensive temporal statistics"""
+        cached = self._cache_get("stats", time_period)
+        if cached is not None:
+            return cached
+        
         hours = self._parse_time_period(time_period)
         cutoff = datetime.now() - timedelta(hours=hours)
         
-        query = """
-        MATCH (c:Claim)
-        WHERE c.timestamp >= datetime($cutoff)
-        WITH count(c) as total_claims
-        MATCH (e:Entity)<-[:ABOUT]-(c2:Claim)
-        WHERE c2.timestamp >= datetime($cutoff)
-        RETURN total_claims,
-               0 as new_entities,
-               count(DISTINCT e) as active_entities
-        """
-        
         try:
-            results = self.neo4j.execute_query(
-                query,
+            results = self.neo4j.execute_read(
+                _TEMPORAL_STATS_QUERY,
                 {"cutoff": cutoff.isoformat()}
             )
             
             if results:
                 record = results[0]
-                return {
+                stats = {
                     "time_period": time_period,
                     "total_claims": record['total_claims'],
                     "new_entities": record['new_entities'],
                     "active_entities": record['active_entities'],
                     "claims_per_hour": record['total_claims'] / hours if hours > 0 else 0
                 }
+                self._cache_set("stats", time_period, stats)
+                return stats
             
             return {}
             
@@ -536,6 +622,38 @@ class TemporalAnalyzer:
             logger.error(f"Temporal stats failed: {e}")
             return {}
     
+    # ==================== Caching ====================
+    
+    def _cache_get(self, kind: str, time_period: str) -> Optional[Any]:
+        """Return a cached result if it is still fresh"""
+        entry = self._query_cache.get((kind, time_period))
+        if entry is not None and time.monotonic() - entry[0] < self.cache_ttl:
+            self._cache_hits += 1
+            return entry[1]
+        
+        self._cache_misses += 1
+        return None
+    
+    def _cache_set(self, kind: str, time_period: str, value: Any):
+        """Store a query result in the TTL cache"""
+        if self.cache_ttl > 0:
+            self._query_cache[(kind, time_period)] = (time.monotonic(), value)
+    
+    def clear_cache(self):
+        """Drop all cached query results"""
+        self._query_cache.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for the query result cache"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_ratio": self._cache_hits / lookups if lookups else 0.0,
+            "entries": len(self._query_cache),
+            "ttl_seconds": self.cache_ttl
+        }
+    
     # ==================== Utilities ====================
     
     def _parse_time_period(self, time_period: str) -> int:
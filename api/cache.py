@@ -0,0 +1,117 @@
+"""
+Response Cache
+Redis cache-aside layer for hot read-only API endpoints
+"""
+
+import functools
+import hashlib
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from graph.epoch import GRAPH_EPOCH_KEY
+
+KEY_PREFIX = "api-cache:"
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def init_cache(host: str = "localhost", port: int = 6379, db: int = 0) -> aioredis.Redis:
+    """
+    Create the shared Redis client used by @cached endpoints
+    
+    Args:
+        host: Redis host
+        port: Redis port
+        db: Redis database number
+        
+    Returns:
+        Redis client
+    """
+    global _redis
+    _redis = aioredis.Redis(host=host, port=port, db=db)
+    logger.info(f"Response cache enabled: redis://{host}:{port}/{db}")
+    return _redis
+
+
+async def close_cache():
+    """Close the shared Redis client"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+def make_key(name: str, params: Dict[str, Any]) -> str:
+    """Build a compact cache key from an endpoint name and its parameters"""
+    raw = name.encode() + orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+    return KEY_PREFIX + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def cached(ttl: int, per_epoch: bool = False) -> Callable:
+    """
+    Cache-aside decorator for async FastAPI endpoints
+    
+    The response is stored as JSON under a key derived from the endpoint
+    name and its query/path parameters. Redis errors are logged and the
+    endpoint is served uncached, so the cache can never take the API down.
+    Exceptions (including HTTPException) are never cached.
+    
+    Args:
+        ttl: Seconds to keep the cached response
+        per_epoch: Also key on the current graph epoch, so the entry is
+            superseded as soon as the ingest pipeline writes to the graph
+            and the TTL only needs to bound memory
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if _redis is None:
+                return await func(*args, **kwargs)
+            
+            try:
+                params = dict(kwargs)
+                if per_epoch:
+                    epoch = await _redis.get(GRAPH_EPOCH_KEY)
+                    params["__epoch__"] = int(epoch or 0)
+                key = make_key(func.__qualname__, params)
+                
+                hit = await _redis.get(key)
+                if hit is not None:
+                    return orjson.loads(hit)
+            except RedisError as e:
+                logger.warning(f"Cache read failed for {func.__name__}: {e}")
+                return await func(*args, **kwargs)
+            
+            result = await func(*args, **kwargs)
+            
+            try:
+                await _redis.setex(key, ttl, orjson.dumps(jsonable_encoder(result)))
+            except RedisError as e:
+                logger.warning(f"Cache write failed for {func.__name__}: {e}")
+            
+            return result
+        
+        return wrapper
+    return decorator
+
+
+async def cache_stats() -> Dict[str, Any]:
+    """Get Redis keyspace hit/miss counters"""
+    if _redis is None:
+        return {"enabled": False}
+    
+    info = await _redis.info("stats")
+    hits = info.get("keyspace_hits", 0)
+    misses = info.get("keyspace_misses", 0)
+    lookups = hits + misses
+    return {
+        "enabled": True,
+        "keyspace_hits": hits,
+        "keyspace_misses": misses,
+        "hit_ratio": hits / lookups if lookups else 0.0
+    }
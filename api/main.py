@@ -3,23 +3,57 @@ REST API for OSINT Knowledge Graph
 Query entities, claims, sources, and relationships
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from typing import List, Optional, Dict, Any, Literal
+from dataclasses import dataclass
+import orjson
 from dotenv import load_dotenv
 load_dotenv()
 
-from graph.neo4j_client import Neo4jClient
-from analytics.temporal_analyzer import TemporalAnalyzer
-from analytics.contradiction_detector import ContradictionDetector
-from analytics.credibility_scorer import CredibilityScorer
+from config.settings import REDIS_HOST, REDIS_PORT, MAX_CONCURRENT_TASKS, ENABLE_ANALYTICS_ENDPOINTS
+from graph.neo4j_client import Neo4jClient, AsyncNeo4jClient, escape_fulltext
 from loguru import logger
 
+from api.cache import cached, init_cache, close_cache, cache_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Manage driver and cache lifetime
+    
+    Startup opens the async Neo4j driver on the server's event loop,
+    pre-opens its connections, creates the search indexes and connects
+    the response cache, so the first requests don't pay those costs.
+    """
+    global async_neo4j_client
+    async_neo4j_client = AsyncNeo4jClient()
+    await async_neo4j_client.warm_up(MAX_CONCURRENT_TASKS)
+    await async_neo4j_client.ensure_indexes()
+    
+    app.state.neo4j = async_neo4j_client
+    app.state.redis = init_cache(REDIS_HOST, REDIS_PORT)
+    
+    try:
+        yield
+    finally:
+        await async_neo4j_client.close()
+        await close_cache()
+        neo4j_client.close()
+
+
 app = FastAPI(
     title="OSINT Knowledge Graph API",
     description="Query and explore the temporal OSINT knowledge graph",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS
@@ -31,39 +65,195 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Neo4j client
-neo4j_client = Neo4jClient()
+# JSON lists of entities/claims compress several-fold; tiny bodies aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
-# Analytics components (Phase 4B)
-temporal_analyzer = TemporalAnalyzer(neo4j_client)
-contradiction_detector = ContradictionDetector(neo4j_client)
-credibility_scorer = CredibilityScorer(neo4j_client)
+# Neo4j clients: async driver for request handlers, sync driver for analytics
+neo4j_client = Neo4jClient()
+async_neo4j_client: Optional[AsyncNeo4jClient] = None
+
+# Back-pressure for Neo4j calls from request handlers: at most
+# max_concurrent_tasks queries in flight, and a bounded queue behind them
+neo4j_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+MAX_QUEUED_NEO4J_CALLS = MAX_CONCURRENT_TASKS * 4
+_queued_neo4j_calls = 0
+
+# Phase 4B analytics endpoints live in their own router so the heavy
+# analytics modules are only imported when the feature is enabled
+if ENABLE_ANALYTICS_ENDPOINTS:
+    from api.analytics_router import router as analytics_router, init_analytics
+    
+    init_analytics(neo4j_client)
+    app.include_router(analytics_router)
 
 
-# Response models
-class Entity(BaseModel):
+# Response models: plain dataclasses used only to document response
+# schemas in OpenAPI; handlers return driver records without building them
+@dataclass(slots=True)
+class Entity:
     id: str
     name: str
     type: str
     confidence: float
 
-class Claim(BaseModel):
+@dataclass(slots=True)
+class Claim:
     id: str
     text: str
     confidence: float
     
-class Source(BaseModel):
+@dataclass(slots=True)
+class Source:
     domain: str
     credibility: float
     url: Optional[str]
 
-class GraphStats(BaseModel):
+@dataclass(slots=True)
+class GraphStats:
     entities: int
     claims: int
     sources: int
     events: int
 
 
+# ==================== Cypher Queries ====================
+# Static query text only: optional filters pick one of a fixed set of
+# templates and every value travels as a parameter, so Neo4j plans each
+# template once and reuses it.
+
+_ENTITY_RETURN = """
+RETURN e.id as id, e.name as name, e.type as type, e.confidence as confidence
+ORDER BY e.confidence DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+# Keyed by (name filter given, type filter given). The unfiltered and
+# type-only variants walk entity_confidence_idx / entity_type_confidence_idx
+# in descending order and stop at LIMIT instead of sorting every entity.
+ENTITY_SEARCH_QUERIES = {
+    (False, False): "MATCH (e:Entity)\nUSING INDEX e:Entity(confidence)\nWHERE e.confidence IS NOT NULL" + _ENTITY_RETURN,
+    (True, False): "MATCH (e:Entity)\nWHERE e.name_lower CONTAINS $name" + _ENTITY_RETURN,
+    (False, True): "MATCH (e:Entity)\nWHERE e.type = $type AND e.confidence IS NOT NULL" + _ENTITY_RETURN,
+    (True, True): "MATCH (e:Entity)\nWHERE e.name_lower CONTAINS $name AND e.type = $type" + _ENTITY_RETURN,
+}
+
+_CLAIM_RETURN = """
+RETURN c.id as id, c.text as text, c.confidence_score as confidence
+ORDER BY c.confidence_score DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+# Keyed by whether a text filter was given. Without one, the confidence
+# range seek on claim_confidence_idx already yields rows in sorted order.
+CLAIM_SEARCH_QUERIES = {
+    False: "MATCH (c:Claim)\nUSING INDEX c:Claim(confidence_score)\nWHERE c.confidence_score >= $min_confidence" + _CLAIM_RETURN,
+    True: "MATCH (c:Claim)\nWHERE c.text_lower CONTAINS $text AND c.confidence_score >= $min_confidence" + _CLAIM_RETURN,
+}
+
+ENTITY_CLAIMS_QUERY = """
+MATCH (e:Entity {id: $entity_id})<-[:ABOUT|MENTIONS]-(c:Claim)
+RETURN c.id as id, c.text as text, c.confidence_score as confidence
+ORDER BY c.confidence_score DESC
+"""
+
+CLAIM_ENTITIES_QUERY = """
+MATCH (c:Claim {id: $claim_id})-[:ABOUT|MENTIONS]->(e:Entity)
+RETURN e.id as id, e.name as name, e.type as type, e.confidence as confidence
+"""
+
+SOURCES_QUERY = """
+MATCH (s:Source)
+RETURN s.domain as domain, s.credibility_score as credibility,
+       s.url as url, s.title as title
+ORDER BY s.credibility_score DESC
+LIMIT $limit
+"""
+
+# Cypher cannot take the variable-length bound as a parameter, so build one
+# fixed query per allowed depth up front. Each entity->claim->entity step is
+# two relationship hops. The network is seeded from the fulltext index and
+# only the best matches are expanded.
+_NETWORK_QUERY_TEMPLATE = """
+CALL db.index.fulltext.queryNodes('entity_search_idx', $search) YIELD node AS e1
+WITH e1 LIMIT 5
+MATCH path = (e1)-[:ABOUT|MENTIONS*1..{hops}]-(e2:Entity)
+RETURN DISTINCT e2.id as id, e2.name as name, e2.type as type
+LIMIT 20
+"""
+NETWORK_QUERIES = {
+    depth: _NETWORK_QUERY_TEMPLATE.replace("{hops}", str(depth * 2))
+    for depth in (1, 2, 3)
+}
+
+
+def check_neo4j_capacity():
+    """Reject the request with 503 when every slot is busy and the wait queue is full"""
+    if neo4j_semaphore.locked() and _queued_neo4j_calls >= MAX_QUEUED_NEO4J_CALLS:
+        raise HTTPException(
+            status_code=503,
+            detail="Graph database busy, retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+
+# "records" is a list of row objects; "split" is pandas' orient='split'
+# layout ({"columns": [...], "data": [[...], ...]}), which drops the repeated
+# keys and lets clients build a DataFrame straight from the row arrays
+TableFormat = Literal["records", "split"]
+
+
+async def table_payload(result, format: TableFormat) -> Any:
+    """
+    Drain a query result in the requested table layout
+    
+    Args:
+        result: Async driver result
+        format: "records" or "split"
+        
+    Returns:
+        List of dicts, or a {"columns", "data"} dict
+    """
+    if format == "split":
+        return {"columns": list(await result.keys()), "data": await result.values()}
+    return await result.data()
+
+
+async def acquire_neo4j_slot():
+    """
+    Wait for one Neo4j concurrency slot; the caller must release it
+    
+    Raises:
+        HTTPException: 503 with Retry-After when every slot is busy and
+            the wait queue is full
+    """
+    global _queued_neo4j_calls
+    check_neo4j_capacity()
+    
+    _queued_neo4j_calls += 1
+    try:
+        await neo4j_semaphore.acquire()
+    finally:
+        _queued_neo4j_calls -= 1
+
+
+@asynccontextmanager
+async def neo4j_slot():
+    """
+    Hold one Neo4j concurrency slot for the duration of the block
+    
+    Raises:
+        HTTPException: 503 with Retry-After when every slot is busy and
+            the wait queue is full
+    """
+    await acquire_neo4j_slot()
+    try:
+        yield
+    finally:
+        neo4j_semaphore.release()
+
+
 @app.get("/", tags=["Status"])
 async def root():
     """API status"""
@@ -74,76 +264,93 @@ async def root():
     }
 
 
-@app.get("/stats", response_model=GraphStats, tags=["Analytics"])
+@app.get(
+    "/stats",
+    response_model=None,
+    responses={200: {"model": GraphStats}},
+    tags=["Analytics"]
+)
+@cached(ttl=60)
 async def get_stats():
     """Get knowledge graph statistics"""
     try:
-        stats = neo4j_client.get_stats()
-        return GraphStats(**stats)
+        async with neo4j_slot():
+            stats = await async_neo4j_client.get_stats()
+        return stats
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Stats error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/entities", response_model=List[Entity], tags=["Entities"])
+# List endpoints return driver records as-is: the data is already typed by
+# Neo4j, so re-validating every row through Pydantic is pure overhead. The
+# models are still published in the OpenAPI schema via `responses`.
+@app.get(
+    "/entities",
+    response_model=None,
+    responses={200: {"model": List[Entity]}},
+    tags=["Entities"]
+)
+@cached(ttl=120)
 async def search_entities(
     name: Optional[str] = Query(None, description="Search by name"),
     type: Optional[str] = Query(None, description="Filter by type"),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0, description="Rows to skip, for paging"),
+    format: TableFormat = Query("records", description="records or split")
 ):
     """Search entities in knowledge graph"""
     try:
-        query = "MATCH (e:Entity) "
-        params = {}
-        
-        conditions = []
-        if name:
-            conditions.append("toLower(e.name) CONTAINS toLower($name)")
-            params['name'] = name
-        if type:
-            conditions.append("e.type = $type")
-            params['type'] = type
-            
-        if conditions:
-            query += "WHERE " + " AND ".join(conditions) + " "
-            
-        query += "RETURN e.id as id, e.name as name, e.type as type, e.confidence as confidence "
-        query += "ORDER BY e.confidence DESC LIMIT $limit"
-        params['limit'] = limit
+        query = ENTITY_SEARCH_QUERIES[(bool(name), bool(type))]
+        params = {
+            'name': (name or '').lower(),
+            'type': type or '',
+            'limit': limit,
+            'offset': offset
+        }
         
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, **params)
-            return [Entity(**dict(r)) for r in result]
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(query, **params)
+            return await table_payload(result, format)
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Entity search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/claims", response_model=List[Claim], tags=["Claims"])
+@app.get(
+    "/claims",
+    response_model=None,
+    responses={200: {"model": List[Claim]}},
+    tags=["Claims"]
+)
 async def search_claims(
     text: Optional[str] = Query(None, description="Search claim text"),
     min_confidence: float = Query(0.0, ge=0.0, le=1.0),
-    limit: int = Query(50, ge=1, le=500)
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0, description="Rows to skip, for paging"),
+    format: TableFormat = Query("records", description="records or split")
 ):
     """Search claims in knowledge graph"""
     try:
-        query = "MATCH (c:Claim) "
-        params = {'min_confidence': min_confidence, 'limit': limit}
-        
-        if text:
-            query += "WHERE toLower(c.text) CONTAINS toLower($text) AND c.confidence_score >= $min_confidence "
-            params['text'] = text
-        else:
-            query += "WHERE c.confidence_score >= $min_confidence "
-            
-        query += "RETURN c.id as id, c.text as text, c.confidence_score as confidence "
-        query += "ORDER BY c.confidence_score DESC LIMIT $limit"
+        query = CLAIM_SEARCH_QUERIES[bool(text)]
+        params = {
+            'text': (text or '').lower(),
+            'min_confidence': min_confidence,
+            'limit': limit,
+            'offset': offset
+        }
         
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, **params)
-            return [Claim(**dict(r)) for r in result]
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(query, **params)
+            return await table_payload(result, format)
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Claim search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -153,20 +360,14 @@ async def search_claims(
 async def get_entity_claims(entity_id: str):
     """Get all claims about an entity"""
     try:
-        query = """
-        MATCH (e:Entity {id: $entity_id})<-[:ABOUT|MENTIONS]-(c:Claim)
-        RETURN c.id as id, c.text as text, c.confidence_score as confidence
-        ORDER BY c.confidence_score DESC
-        """
-        
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, entity_id=entity_id)
-            claims = [dict(r) for r in result]
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(ENTITY_CLAIMS_QUERY, entity_id=entity_id)
+            claims = await result.data()
             
-            if not claims:
-                raise HTTPException(status_code=404, detail="Entity not found or no claims")
-                
-            return {"entity_id": entity_id, "claims": claims}
+        if not claims:
+            raise HTTPException(status_code=404, detail="Entity not found or no claims")
+            
+        return {"entity_id": entity_id, "claims": claims}
             
     except HTTPException:
         raise
@@ -179,19 +380,14 @@ async def get_entity_claims(entity_id: str):
 async def get_claim_entities(claim_id: str):
     """Get all entities mentioned in a claim"""
     try:
-        query = """
-        MATCH (c:Claim {id: $claim_id})-[:ABOUT|MENTIONS]->(e:Entity)
-        RETURN e.id as id, e.name as name, e.type as type, e.confidence as confidence
-        """
-        
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, claim_id=claim_id)
-            entities = [dict(r) for r in result]
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(CLAIM_ENTITIES_QUERY, claim_id=claim_id)
+            entities = await result.data()
             
-            if not entities:
-                raise HTTPException(status_code=404, detail="Claim not found or no entities")
-                
-            return {"claim_id": claim_id, "entities": entities}
+        if not entities:
+            raise HTTPException(status_code=404, detail="Claim not found or no entities")
+            
+        return {"claim_id": claim_id, "entities": entities}
             
     except HTTPException:
         raise
@@ -200,276 +396,158 @@ async def get_claim_entities(claim_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/sources", response_model=List[Dict[str, Any]], tags=["Sources"])
-async def get_sources(limit: int = Query(50, ge=1, le=500)):
+@app.get(
+    "/sources",
+    response_model=None,
+    responses={200: {"model": List[Source]}},
+    tags=["Sources"]
+)
+@cached(ttl=120)
+async def get_sources(
+    limit: int = Query(50, ge=1, le=500),
+    format: TableFormat = Query("records", description="records or split")
+):
     """Get all sources"""
     try:
-        query = """
-        MATCH (s:Source)
-        RETURN s.domain as domain, s.credibility_score as credibility, 
-               s.url as url, s.title as title
-        ORDER BY s.credibility_score DESC
-        LIMIT $limit
-        """
-        
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, limit=limit)
-            return [dict(r) for r in result]
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(SOURCES_QUERY, limit=limit)
+            return await table_payload(result, format)
             
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Sources error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/network/{entity_name}", tags=["Analytics"])
-async def get_entity_network(entity_name: str, depth: int = Query(2, ge=1, le=3)):
-    """Get entity network (related entities through claims)"""
+# ==================== Dashboard ====================
+
+@app.get("/dashboard/bulk", tags=["Analytics"])
+@cached(ttl=30)
+async def get_dashboard_bulk(
+    entity_limit: int = Query(50, ge=1, le=500),
+    source_limit: int = Query(50, ge=1, le=500)
+):
+    """Stats, top entities and sources for the dashboard overview in one round trip"""
     try:
-        query = """
-        MATCH path = (e1:Entity)-[:ABOUT|MENTIONS*1..{depth}]-(e2:Entity)
-        WHERE toLower(e1.name) CONTAINS toLower($name)
-        RETURN DISTINCT e2.id as id, e2.name as name, e2.type as type
-        LIMIT 20
-        """.replace("{depth}", str(depth * 2))
+        async with neo4j_slot():
+            stats = await async_neo4j_client.get_stats()
+            async with async_neo4j_client.driver.session() as session:
+                result = await session.run(
+                    ENTITY_SEARCH_QUERIES[(False, False)],
+                    name='', type='', limit=entity_limit, offset=0
+                )
+                entities = await result.data()
+                
+                result = await session.run(SOURCES_QUERY, limit=source_limit)
+                sources = await result.data()
         
-        with neo4j_client.driver.session() as session:
-            result = session.run(query, name=entity_name)
-            return [dict(r) for r in result]
-            
+        return {"stats": stats, "entities": entities, "sources": sources}
+        
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Network error: {e}")
+        logger.error(f"Dashboard bulk error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    neo4j_client.close()
-
-
-# ==================== Phase 4B: Enhanced Analytics Endpoints ====================
+# ==================== Streaming Endpoints ====================
 
-@app.get("/analytics/trends", tags=["Analytics"])
-async def get_trends(time_period: str = Query("24h", regex="^(24h|7d|30d)$")):
-    """
-    Get temporal trends for entities
-    
-    Args:
-        time_period: Time window (24h, 7d, 30d)
+class SlotStreamingResponse(StreamingResponse):
+    """StreamingResponse that releases a held Neo4j slot once it has been sent"""
     
-    Returns:
-        List of detected trends with metrics
-    """
-    try:
-        trends = temporal_analyzer.detect_trends(time_period=time_period)
-        return {
-            "time_period": time_period,
-            "trend_count": len(trends),
-            "trends": [t.to_dict() for t in trends]
-        }
-    except Exception as e:
-        logger.error(f"Trends endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            neo4j_semaphore.release()
 
 
-@app.get("/analytics/anomalies", tags=["Analytics"])
-async def get_anomalies(hours: int = Query(24, ge=1, le=168)):
+async def ndjson_stream(query: str, **params) -> StreamingResponse:
     """
-    Get detected anomalies in temporal patterns
-    
-    Args:
-        hours: Time window in hours (1-168)
+    Stream query records as newline-delimited JSON
     
-    Returns:
-        List of detected anomalies
-    """
-    try:
-        anomalies = temporal_analyzer.detect_anomalies(hours=hours)
-        return {
-            "time_window_hours": hours,
-            "anomaly_count": len(anomalies),
-            "anomalies": [a.to_dict() for a in anomalies]
-        }
-    except Exception as e:
-        logger.error(f"Anomalies endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/analytics/entity-timeline/{entity_name}", tags=["Analytics"])
-async def get_entity_timeline(entity_name: str, days: int = Query(30, ge=1, le=365)):
+    Records are encoded and sent as the driver pulls them, so the response
+    starts immediately and memory stays flat regardless of the row count.
+    The Neo4j slot is acquired before the response is returned, because a
+    503 cannot be sent once the body has started; it is released when the
+    response finishes, even if the client disconnects before the first row.
     """
-    Get complete timeline of an entity's evolution
+    await acquire_neo4j_slot()
     
-    Args:
-        entity_name: Name of entity
-        days: Number of days to look back
+    async def rows():
+        async with async_neo4j_client.driver.session() as session:
+            result = await session.run(query, **params)
+            async for record in result:
+                yield orjson.dumps(record.data()) + b"\n"
     
-    Returns:
-        Timeline data with mentions and metrics
-    """
-    try:
-        timeline = temporal_analyzer.get_entity_timeline(entity_name, days)
-        if not timeline:
-            raise HTTPException(status_code=404, detail="Entity not found or no timeline data")
-        return timeline
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Entity timeline endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return SlotStreamingResponse(rows(), media_type="application/x-ndjson")
 
 
-@app.get("/analytics/contradictions", tags=["Analytics"])
-async def get_contradictions(
-    entity_name: Optional[str] = None,
-    days: int = Query(7, ge=1, le=90)
+@app.get("/entities/stream", tags=["Entities"])
+async def stream_entities(
+    name: Optional[str] = Query(None, description="Search by name"),
+    type: Optional[str] = Query(None, description="Filter by type"),
+    limit: int = Query(5000, ge=1, le=50000)
 ):
-    """
-    Get detected contradictions between claims
-    
-    Args:
-        entity_name: Optional - filter by entity
-        days: Number of days to analyze
-    
-    Returns:
-        List of contradictions with severity scores
-    """
-    try:
-        contradictions = contradiction_detector.detect_contradictions(
-            entity_name=entity_name,
-            days=days
-        )
-        return {
-            "days_analyzed": days,
-            "entity_filter": entity_name,
-            "contradiction_count": len(contradictions),
-            "contradictions": [c.to_dict() for c in contradictions[:50]]  # Limit to 50
-        }
-    except Exception as e:
-        logger.error(f"Contradictions endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/analytics/contradiction-report", tags=["Analytics"])
-async def get_contradiction_report(days: int = Query(7, ge=1, le=90)):
-    """
-    Get comprehensive contradiction report with clustering
-    
-    Args:
-        days: Number of days to analyze
-    
-    Returns:
-        Detailed contradiction report with clusters
-    """
-    try:
-        report = contradiction_detector.generate_contradiction_report(days)
-        return report
-    except Exception as e:
-        logger.error(f"Contradiction report endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/analytics/credibility", tags=["Analytics"])
-async def get_source_credibility(
-    source_name: Optional[str] = None,
-    days: int = Query(30, ge=1, le=365)
+    """Stream entity search results as NDJSON"""
+    return await ndjson_stream(
+        ENTITY_SEARCH_QUERIES[(bool(name), bool(type))],
+        name=(name or '').lower(),
+        type=type or '',
+        limit=limit,
+        offset=0
+    )
+
+
+@app.get("/claims/stream", tags=["Claims"])
+async def stream_claims(
+    text: Optional[str] = Query(None, description="Search claim text"),
+    min_confidence: float = Query(0.0, ge=0.0, le=1.0),
+    limit: int = Query(5000, ge=1, le=50000)
 ):
-    """
-    Get source credibility scores
-    
-    Args:
-        source_name: Optional - specific source to score
-        days: Number of days of history to consider
-    
-    Returns:
-        Credibility scores for source(s)
-    """
-    try:
-        if source_name:
-            # Single source
-            score = credibility_scorer.score_source(source_name, days)
-            return {
-                "source": source_name,
-                "score": score.to_dict()
-            }
-        else:
-            # All sources
-            scores = credibility_scorer.score_all_sources(days)
-            return {
-                "days_analyzed": days,
-                "source_count": len(scores),
-                "sources": {name: score.to_dict() for name, score in scores.items()}
-            }
-    except Exception as e:
-        logger.error(f"Credibility endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Stream claim search results as NDJSON"""
+    return await ndjson_stream(
+        CLAIM_SEARCH_QUERIES[bool(text)],
+        text=(text or '').lower(),
+        min_confidence=min_confidence,
+        limit=limit,
+        offset=0
+    )
 
 
-@app.get("/analytics/credibility-report", tags=["Analytics"])
-async def get_credibility_report(days: int = Query(30, ge=1, le=365)):
-    """
-    Get comprehensive source credibility report
-    
-    Args:
-        days: Number of days to analyze
-    
-    Returns:
-        Detailed credibility report with categorization
-    """
-    try:
-        report = credibility_scorer.generate_credibility_report(days)
-        return report
-    except Exception as e:
-        logger.error(f"Credibility report endpoint error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+@app.get("/sources/stream", tags=["Sources"])
+async def stream_sources(limit: int = Query(5000, ge=1, le=50000)):
+    """Stream sources as NDJSON"""
+    return await ndjson_stream(SOURCES_QUERY, limit=limit)
 
 
-@app.get("/analytics/temporal-stats", tags=["Analytics"])
-async def get_temporal_stats(time_period: str = Query("24h", regex="^(24h|7d|30d)$")):
-    """
-    Get temporal statistics for the knowledge graph
-    
-    Args:
-        time_period: Time window (24h, 7d, 30d)
-    
-    Returns:
-        Comprehensive temporal statistics
-    """
+@app.get("/network/{entity_name}", tags=["Analytics"])
+async def get_entity_network(entity_name: str, depth: int = Query(2, ge=1, le=3)):
+    """Get entity network (related entities through claims)"""
     try:
-        stats = temporal_analyzer.get_temporal_stats(time_period)
-        return stats
+        terms = escape_fulltext(entity_name).strip()
+        if not terms:
+            return []
+        
+        async with neo4j_slot(), async_neo4j_client.driver.session() as session:
+            result = await session.run(NETWORK_QUERIES[depth], search=f"name:({terms})")
+            return await result.data()
+            
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Temporal stats endpoint error: {e}")
+        logger.error(f"Network error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/analytics/source-comparison/{entity_name}", tags=["Analytics"])
-async def compare_sources_on_entity(
-    entity_name: str,
-    days: int = Query(30, ge=1, le=365)
-):
-    """
-    Compare how different sources report on the same entity
-    
-    Args:
-        entity_name: Entity to analyze
-        days: Time window
-    
-    Returns:
-        Source comparison with agreement scores
-    """
+@app.get("/meta/cache-stats", tags=["Status"])
+async def get_cache_stats():
+    """Response cache hit/miss statistics"""
     try:
-        comparison = credibility_scorer.compare_sources(entity_name, days)
-        if not comparison:
-            raise HTTPException(
-                status_code=404,
-                detail="Not enough sources found for comparison"
-            )
-        return comparison.to_dict()
-    except HTTPException:
-        raise
+        return await cache_stats()
     except Exception as e:
-        logger.error(f"Source comparison endpoint error: {e}")
+        logger.error(f"Cache stats error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -2,9 +2,10 @@
 Configuration Management
 """
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_settings, SETTINGS
 
 __all__ = [
     "Settings",
     "get_settings",
+    "SETTINGS",
 ]
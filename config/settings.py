@@ -3,9 +3,10 @@ Configuration Management
 Load settings from YAML and environment variables
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, validator
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
+from collections import deque
 from functools import lru_cache
 import yaml
 from pathlib import Path
@@ -13,15 +14,19 @@ from pathlib import Path
 
 class Neo4jSettings(BaseSettings):
     """Neo4j database configuration"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     uri: str = Field(default="bolt://localhost:7687", env="NEO4J_URI")
     username: str = Field(default="neo4j", env="NEO4J_USERNAME")
     password: str = Field(default="osint_password_2026", env="NEO4J_PASSWORD")
     database: str = Field(default="neo4j", env="NEO4J_DATABASE")
-    max_connections: int = 50
+    max_connections: int = Field(default=50, env="NEO4J_MAX_CONNECTIONS")
     
 
 class KafkaSettings(BaseSettings):
     """Kafka streaming configuration"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     bootstrap_servers: str = Field(default="localhost:29092", env="KAFKA_BOOTSTRAP_SERVERS")
     consumer_group: str = "osint-processors"
     auto_offset_reset: str = "earliest"
@@ -29,12 +34,15 @@ class KafkaSettings(BaseSettings):
     # Topics
     topic_raw_feeds: str = "raw-feeds"
     topic_processed_articles: str = "processed-articles"
+    topic_analyzed_articles: str = "analyzed-articles"
     topic_extracted_claims: str = "extracted-claims"
     topic_graph_updates: str = "graph-updates"
     
 
 class OllamaSettings(BaseSettings):
     """Ollama LLM configuration"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     base_url: str = Field(default="http://localhost:11434", env="OLLAMA_BASE_URL")
     model: str = Field(default="deepseek-v3", env="OLLAMA_MODEL")
     timeout: int = 120
@@ -44,6 +52,8 @@ class OllamaSettings(BaseSettings):
 
 class ModelSettings(BaseSettings):
     """ML model configurations"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     nli_model_name: str = "microsoft/deberta-v3-base"
     embedding_model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
     spacy_model: str = "en_core_web_sm"
@@ -52,6 +62,8 @@ class ModelSettings(BaseSettings):
 
 class APISettings(BaseSettings):
     """API server configuration"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     host: str = Field(default="0.0.0.0", env="API_HOST")
     port: int = Field(default=8000, env="API_PORT")
     workers: int = 4
@@ -61,6 +73,8 @@ class APISettings(BaseSettings):
 
 class ProcessingSettings(BaseSettings):
     """Processing and threshold configuration"""
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+    
     min_claim_confidence: float = 0.6
     min_entity_confidence: float = 0.7
     min_nli_confidence: float = 0.75
@@ -71,6 +85,14 @@ class ProcessingSettings(BaseSettings):
 class Settings(BaseSettings):
     """Main application settings"""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+        extra="ignore",
+    )
+    
     # Application
     app_name: str = "Agentic OSINT Analyst"
     app_version: str = "0.1.0"
@@ -94,12 +116,8 @@ class Settings(BaseSettings):
     enable_reddit_crawler: bool = True
     enable_rss_crawler: bool = True
     enable_bias_detection: bool = True
+    enable_analytics_endpoints: bool = Field(default=True, env="ENABLE_ANALYTICS_ENDPOINTS")
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-        
     @classmethod
     def load_from_yaml(cls, yaml_path: str = "config/settings.yaml"):
         """Load settings from YAML file"""
@@ -116,14 +134,17 @@ class Settings(BaseSettings):
     @staticmethod
     def _flatten_dict(d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
         """Flatten nested dictionary for Pydantic"""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(Settings._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        flat: Dict[str, Any] = {}
+        pending = deque([(parent_key, d)])
+        while pending:
+            prefix, current = pending.popleft()
+            for k, v in current.items():
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    pending.append((new_key, v))
+                else:
+                    flat[new_key] = v
+        return flat
 
 
 @lru_cache()
@@ -135,6 +156,19 @@ def get_settings() -> Settings:
         return Settings()
 
 
+# Resolved once at import; read these instead of walking the settings
+# models on hot paths
+SETTINGS = get_settings()
+NEO4J_URI = SETTINGS.neo4j.uri
+NEO4J_USERNAME = SETTINGS.neo4j.username
+NEO4J_PASSWORD = SETTINGS.neo4j.password
+NEO4J_MAX_CONNECTIONS = SETTINGS.neo4j.max_connections
+REDIS_HOST = SETTINGS.redis_host
+REDIS_PORT = SETTINGS.redis_port
+MAX_CONCURRENT_TASKS = SETTINGS.processing.max_concurrent_tasks
+ENABLE_ANALYTICS_ENDPOINTS = SETTINGS.enable_analytics_endpoints
+
+
 if __name__ == "__main__":
     # Test configuration loading
     settings = get_settings()
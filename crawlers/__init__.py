@@ -6,9 +6,15 @@ RSS, Reddit, Web Scrapers
 from .rss_crawler import RSSCrawler
 from .reddit_crawler import RedditCrawler
 from .web_scraper import WebScraper
+from .schema import Article, Post
+from .http_session import get_session, close_session
 
 __all__ = [
     "RSSCrawler",
     "RedditCrawler",
     "WebScraper",
+    "Article",
+    "Post",
+    "get_session",
+    "close_session",
 ]
@@ -0,0 +1,227 @@
+"""
+Seen-Item Filter
+Persistent scalable Bloom filter used by the crawlers to skip items from earlier polls
+"""
+
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+from loguru import logger
+import hashlib
+import math
+import struct
+import threading
+
+
+# File layout: magic and slice count, then per slice a header and its bits
+_MAGIC = b"SBF1"
+_FILE_HEADER = struct.Struct("<4sI")
+# capacity, num_bits, num_hashes, count
+_SLICE_HEADER = struct.Struct("<QQII")
+# Files written before slices existed: num_bits, num_hashes, count
+_LEGACY_HEADER = struct.Struct("<QII")
+
+# Each new slice holds GROWTH times the items of the one before at TIGHTENING
+# times its error rate, so the compound false-positive rate stays below the
+# target however many slices are chained
+GROWTH = 2
+TIGHTENING = 0.5
+
+
+class _Slice:
+    """One fixed-size Bloom filter in the chain"""
+
+    def __init__(self, capacity: int, num_bits: int, num_hashes: int, count: int = 0, bits: Optional[bytearray] = None):
+        self.capacity = capacity
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+
+    @classmethod
+    def sized(cls, capacity: int, error_rate: float) -> "_Slice":
+        """Empty slice with the optimal bit and hash counts for capacity items"""
+        num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(capacity, num_bits, num_hashes)
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def _positions(self, hashes: Tuple[int, int]) -> List[int]:
+        """Bit positions for an item (double hashing)"""
+        h1, h2 = hashes
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def contains(self, hashes: Tuple[int, int]) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(hashes))
+
+    def add(self, hashes: Tuple[int, int]) -> None:
+        for p in self._positions(hashes):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+def _hashes(item: str) -> Tuple[int, int]:
+    """Two 64-bit hashes of an item from one 128-bit digest"""
+    digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class SeenFilter:
+    """
+    Scalable Bloom filter of item IDs already emitted by a crawler
+
+    Starts with one slice sized for capacity items; when the newest slice
+    fills up another, larger one is chained on, so the false-positive rate
+    stays near error_rate as the crawl history grows.
+
+    Crawlers stage() IDs while parsing and commit() them once the items have
+    been delivered downstream, so a failed publish doesn't mark them seen.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize filter, loading it from disk if a saved copy exists
+
+        Args:
+            capacity: Items held by the first slice
+            error_rate: Target false-positive rate for the whole filter
+            path: File to persist the filter to, or None for in-memory only
+        """
+        self.path = Path(path) if path else None
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+
+        self._slices = [_Slice.sized(capacity, error_rate * (1 - TIGHTENING))]
+        self._staged = set()
+
+        if self.path and self.path.exists():
+            self._load()
+
+    @property
+    def count(self) -> int:
+        """Distinct items added"""
+        return sum(s.count for s in self._slices)
+
+    def __contains__(self, item: str) -> bool:
+        hashes = _hashes(item)
+        return any(s.contains(hashes) for s in self._slices)
+
+    def add(self, item: str) -> bool:
+        """
+        Add an item
+
+        Args:
+            item: Item ID
+
+        Returns:
+            True if the item was (probably) already present
+        """
+        hashes = _hashes(item)
+        with self._lock:
+            if any(s.contains(hashes) for s in self._slices):
+                return True
+            if self._slices[-1].full:
+                self._grow()
+            self._slices[-1].add(hashes)
+        return False
+
+    def _grow(self):
+        """Chain on a larger, stricter slice (caller holds the lock)"""
+        last = self._slices[-1]
+        error_rate = self.error_rate * (1 - TIGHTENING) * TIGHTENING ** len(self._slices)
+        self._slices.append(_Slice.sized(last.capacity * GROWTH, error_rate))
+        logger.info(
+            f"Seen filter {self.path or '(memory)'} passed {self.count} items, "
+            f"added slice {len(self._slices)} for {last.capacity * GROWTH} more"
+        )
+
+    def stage(self, item: str) -> bool:
+        """
+        Hold an item to be added by the next commit()
+
+        Args:
+            item: Item ID
+
+        Returns:
+            True if the item was (probably) emitted before or is already staged
+        """
+        if item in self:
+            return True
+        with self._lock:
+            if item in self._staged:
+                return True
+            self._staged.add(item)
+        return False
+
+    def discard_staged(self):
+        """Forget staged items that were never delivered"""
+        with self._lock:
+            self._staged.clear()
+
+    def commit(self):
+        """Add every staged item and persist the filter"""
+        with self._lock:
+            staged, self._staged = self._staged, set()
+        for item in staged:
+            self.add(item)
+        self.save()
+
+    def _load(self):
+        """Load filter state from disk"""
+        try:
+            data = self.path.read_bytes()
+            slices = self._parse(data) if data.startswith(_MAGIC) else self._parse_legacy(data)
+            self._slices = slices
+            logger.debug(f"Loaded seen filter with {self.count} items in {len(slices)} slices from {self.path}")
+        except (OSError, ValueError, struct.error) as e:
+            logger.warning(f"Ignoring unreadable seen filter {self.path}: {e}")
+
+    @staticmethod
+    def _parse(data: bytes) -> List[_Slice]:
+        """Slices from a saved filter file"""
+        _, num_slices = _FILE_HEADER.unpack_from(data)
+        offset = _FILE_HEADER.size
+        slices = []
+        for _ in range(num_slices):
+            capacity, num_bits, num_hashes, count = _SLICE_HEADER.unpack_from(data, offset)
+            offset += _SLICE_HEADER.size
+            size = (num_bits + 7) // 8
+            bits = bytearray(data[offset:offset + size])
+            if len(bits) != size:
+                raise ValueError("truncated filter file")
+            offset += size
+            slices.append(_Slice(capacity, num_bits, num_hashes, count, bits))
+        if not slices or offset != len(data):
+            raise ValueError("malformed filter file")
+        return slices
+
+    def _parse_legacy(self, data: bytes) -> List[_Slice]:
+        """Single slice from a file saved before the filter was scalable"""
+        num_bits, num_hashes, count = _LEGACY_HEADER.unpack_from(data)
+        bits = bytearray(data[_LEGACY_HEADER.size:])
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError("truncated filter file")
+        return [_Slice(self.capacity, num_bits, num_hashes, count, bits)]
+
+    def save(self):
+        """Persist filter state to disk"""
+        if not self.path:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                parts = [_FILE_HEADER.pack(_MAGIC, len(self._slices))]
+                for s in self._slices:
+                    parts.append(_SLICE_HEADER.pack(s.capacity, s.num_bits, s.num_hashes, s.count))
+                    parts.append(bytes(s.bits))
+            self.path.write_bytes(b"".join(parts))
+        except OSError as e:
+            logger.warning(f"Failed to save seen filter: {e}")
@@ -0,0 +1,53 @@
+"""
+Shared HTTP Session
+One aiohttp connection pool for all async crawlers, so DNS lookups, TCP
+connections and TLS sessions to the same host are reused across them
+"""
+
+import asyncio
+import aiohttp
+from typing import Optional
+from loguru import logger
+
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared session for the running event loop
+
+    A session is bound to the loop it was created on, so a new one is
+    created when called from a different loop (e.g. a later asyncio.run).
+
+    Returns:
+        Shared aiohttp ClientSession
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=6,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=60,
+            )
+        )
+        _session_loop = loop
+        logger.debug("Created shared HTTP session")
+
+    return _session
+
+
+async def close_session():
+    """Close the shared session (call before the event loop shuts down)"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -3,12 +3,32 @@ Reddit Crawler
 Fetches posts from specified subreddits using PRAW
 """
 
+import asyncio
+import asyncpraw
 import praw
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Optional
 from loguru import logger
 from datetime import datetime
 import os
 import hashlib
+import threading
+
+from crawlers.dedupe import SeenFilter
+from crawlers.schema import Post
+
+
+# Submission attributes read by _parse_submission. Listing responses normally
+# include all of them; touching one that is missing makes PRAW lazily fetch
+# the whole submission, so any gaps are filled by one batched info() call.
+LISTING_FIELDS = (
+    "id", "title", "url", "permalink", "selftext", "is_self", "created_utc",
+    "author", "score", "upvote_ratio", "num_comments", "is_video", "over_18",
+    "link_flair_text", "domain",
+)
+
+# reddit.info() accepts at most 100 fullnames per request
+INFO_BATCH_SIZE = 100
 
 
 class RedditCrawler:
@@ -30,6 +50,8 @@ class RedditCrawler:
         user_agent: Optional[str] = None,
         subreddits: Optional[List[str]] = None,
         max_posts_per_subreddit: int = 50,
+        max_workers: int = 4,
+        seen_path: Optional[str] = ".cache/reddit_seen.bloom",
     ):
         """
         Initialize Reddit crawler
@@ -40,6 +62,8 @@ class RedditCrawler:
             user_agent: User agent string
             subreddits: List of subreddit names
             max_posts_per_subreddit: Max posts to fetch per subreddit
+            max_workers: Max subreddits fetched in parallel
+            seen_path: File persisting IDs of already-emitted posts, or None to disable
         """
         self.client_id = client_id or os.getenv("REDDIT_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("REDDIT_CLIENT_SECRET")
@@ -49,24 +73,44 @@ class RedditCrawler:
         
         self.subreddits = subreddits or self.DEFAULT_SUBREDDITS
         self.max_posts = max_posts_per_subreddit
+        self.max_workers = max_workers
+        
+        # Posts delivered by earlier polls are skipped before full parsing
+        self._seen = SeenFilter(path=seen_path) if seen_path else None
+        
+        # PRAW instances are not thread-safe, so each worker thread gets its own
+        self._local = threading.local()
         
         # Initialize Reddit client
         if self.client_id and self.client_secret:
-            self.reddit = praw.Reddit(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-                user_agent=self.user_agent,
-            )
+            self.reddit = self._new_client()
+            self._local.reddit = self.reddit
             logger.info("Reddit crawler initialized with API credentials")
         else:
             logger.warning("Reddit API credentials not found - using read-only mode")
             self.reddit = None
             
+    def _new_client(self) -> praw.Reddit:
+        """Create a PRAW client from the configured credentials"""
+        return praw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent,
+        )
+        
+    def _thread_client(self) -> praw.Reddit:
+        """Get the PRAW client owned by the current thread"""
+        reddit = getattr(self._local, "reddit", None)
+        if reddit is None:
+            reddit = self._new_client()
+            self._local.reddit = reddit
+        return reddit
+        
     def fetch_subreddit(
         self,
         subreddit_name: str,
         sort: str = "hot"
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Post]:
         """
         Fetch posts from a single subreddit
         
@@ -75,7 +119,7 @@ class RedditCrawler:
             sort: Sort method (hot, new, top, rising)
             
         Returns:
-            List of post dicts
+            List of posts
         """
         if not self.reddit:
             logger.error("Reddit API not initialized")
@@ -85,21 +129,13 @@ class RedditCrawler:
         
         try:
             logger.info(f"Fetching r/{subreddit_name}")
-            subreddit = self.reddit.subreddit(subreddit_name)
-            
-            # Get posts based on sort method
-            if sort == "hot":
-                submissions = subreddit.hot(limit=self.max_posts)
-            elif sort == "new":
-                submissions = subreddit.new(limit=self.max_posts)
-            elif sort == "top":
-                submissions = subreddit.top(limit=self.max_posts, time_filter="day")
-            else:
-                submissions = subreddit.rising(limit=self.max_posts)
+            subreddit = self._thread_client().subreddit(subreddit_name)
             
             # Process submissions
+            submissions = self._hydrate(list(self._listing(subreddit, sort)))
+            scraped_at = datetime.utcnow().isoformat()
             for submission in submissions:
-                post = self._parse_submission(submission, subreddit_name)
+                post = self._parse_submission(submission, subreddit_name, scraped_at)
                 if post:
                     posts.append(post)
             
@@ -110,24 +146,69 @@ class RedditCrawler:
             
         return posts
         
+    def _listing(self, subreddit: Any, sort: str) -> Any:
+        """Get a subreddit listing for a sort method (praw or asyncpraw)"""
+        if sort == "hot":
+            return subreddit.hot(limit=self.max_posts)
+        elif sort == "new":
+            return subreddit.new(limit=self.max_posts)
+        elif sort == "top":
+            return subreddit.top(limit=self.max_posts, time_filter="day")
+        else:
+            return subreddit.rising(limit=self.max_posts)
+        
+    def _hydrate(self, submissions: List[Any]) -> List[Any]:
+        """
+        Replace partially-populated submissions with fully-fetched ones
+        
+        Args:
+            submissions: Submissions from a listing
+            
+        Returns:
+            Submissions whose LISTING_FIELDS are all populated
+        """
+        incomplete = [
+            s for s in submissions
+            if not all(field in vars(s) for field in LISTING_FIELDS)
+        ]
+        if not incomplete:
+            return submissions
+        
+        logger.debug(f"Hydrating {len(incomplete)} partial submissions")
+        reddit = self._thread_client()
+        hydrated = {}
+        for i in range(0, len(incomplete), INFO_BATCH_SIZE):
+            batch = incomplete[i:i + INFO_BATCH_SIZE]
+            for s in reddit.info(fullnames=[f"t3_{s.id}" for s in batch]):
+                hydrated[s.id] = s
+        
+        return [hydrated.get(s.id, s) for s in submissions]
+        
     def _parse_submission(
         self,
         submission: Any,
-        subreddit_name: str
-    ) -> Optional[Dict[str, Any]]:
+        subreddit_name: str,
+        scraped_at: str
+    ) -> Optional[Post]:
         """
         Parse a Reddit submission
         
+        Only LISTING_FIELDS may be read here; anything else triggers a
+        per-submission API round trip.
+        
         Args:
             submission: PRAW submission object
             subreddit_name: Name of subreddit
+            scraped_at: ISO timestamp of the fetch
             
         Returns:
-            Normalized post dict
+            Normalized post
         """
         try:
             # Generate unique ID
             post_id = self._generate_id(submission.id)
+            if self._seen is not None and self._seen.stage(post_id):
+                return None
             
             # Parse timestamp
             created_at = datetime.fromtimestamp(
@@ -137,34 +218,34 @@ class RedditCrawler:
             # Extract post content
             content = submission.selftext if submission.is_self else ""
             
-            post = {
-                "id": post_id,
-                "source_type": "reddit",
-                "source_name": f"r/{subreddit_name}",
-                "source_url": f"https://reddit.com/r/{subreddit_name}",
-                "category": "social_media",
-                "language": "en",
+            post = Post(
+                id=post_id,
+                source_type="reddit",
+                source_name=f"r/{subreddit_name}",
+                source_url=f"https://reddit.com/r/{subreddit_name}",
+                category="social_media",
+                language="en",
                 
-                "title": submission.title,
-                "url": submission.url,
-                "permalink": f"https://reddit.com{submission.permalink}",
-                "content": content,
-                "author": str(submission.author) if submission.author else "[deleted]",
+                title=submission.title,
+                url=submission.url,
+                permalink=f"https://reddit.com{submission.permalink}",
+                content=content,
+                author=submission.author.name if submission.author else "[deleted]",
                 
-                "published_at": created_at,
-                "scraped_at": datetime.utcnow().isoformat(),
+                published_at=created_at,
+                scraped_at=scraped_at,
                 
-                "score": submission.score,
-                "upvote_ratio": submission.upvote_ratio,
-                "num_comments": submission.num_comments,
+                score=submission.score,
+                upvote_ratio=submission.upvote_ratio,
+                num_comments=submission.num_comments,
                 
-                "is_self_post": submission.is_self,
-                "is_video": submission.is_video,
-                "over_18": submission.over_18,
+                is_self_post=submission.is_self,
+                is_video=submission.is_video,
+                over_18=submission.over_18,
                 
-                "flair": submission.link_flair_text,
-                "domain": submission.domain,
-            }
+                flair=submission.link_flair_text,
+                domain=submission.domain,
+            )
             
             return post
             
@@ -174,9 +255,14 @@ class RedditCrawler:
             
     def _generate_id(self, reddit_id: str) -> str:
         """Generate unique ID from Reddit ID"""
-        return hashlib.md5(f"reddit_{reddit_id}".encode()).hexdigest()[:16]
+        return hashlib.blake2b(f"reddit_{reddit_id}".encode(), digest_size=8).hexdigest()
         
-    def fetch_all(self, sort: str = "hot") -> List[Dict[str, Any]]:
+    def commit_seen(self):
+        """Mark the last fetch's posts as seen; call once they are published"""
+        if self._seen is not None:
+            self._seen.commit()
+            
+    def fetch_all(self, sort: str = "hot") -> List[Post]:
         """
         Fetch posts from all subreddits
         
@@ -190,14 +276,101 @@ class RedditCrawler:
             logger.warning("Reddit crawler not initialized - skipping")
             return []
         
-        all_posts = []
+        if not self.subreddits:
+            return []
+        
+        # Posts from a fetch that was never committed are emitted again
+        if self._seen is not None:
+            self._seen.discard_staged()
+        
+        # Bounded fan-out keeps us well under Reddit's API rate limit
+        workers = min(len(self.subreddits), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                lambda name: self.fetch_subreddit(name, sort=sort),
+                self.subreddits,
+            ))
+        
+        all_posts = [post for posts in results for post in posts]
+        
+        logger.info(f"Total Reddit posts fetched: {len(all_posts)}")
+        return all_posts
+
+        
+    # ==================== Async Fetching ====================
+    
+    async def fetch_all_async(self, sort: str = "hot") -> List[Post]:
+        """
+        Fetch posts from all subreddits concurrently with asyncpraw
+        
+        Args:
+            sort: Sort method for posts
+            
+        Returns:
+            List of all posts
+        """
+        if not self.reddit:
+            logger.warning("Reddit crawler not initialized - skipping")
+            return []
+        
+        if self._seen is not None:
+            self._seen.discard_staged()
         
-        for subreddit in self.subreddits:
-            posts = self.fetch_subreddit(subreddit, sort=sort)
-            all_posts.extend(posts)
+        # Same cap as the threaded path to stay under Reddit's rate limit
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async with asyncpraw.Reddit(
+            client_id=self.client_id,
+            client_secret=self.client_secret,
+            user_agent=self.user_agent,
+        ) as reddit:
+            
+            async def fetch_one(name: str) -> List[Post]:
+                async with semaphore:
+                    return await self._fetch_subreddit_async(reddit, name, sort)
+            
+            results = await asyncio.gather(*(fetch_one(name) for name in self.subreddits))
+        
+        all_posts = [post for posts in results for post in posts]
         
         logger.info(f"Total Reddit posts fetched: {len(all_posts)}")
         return all_posts
+        
+    async def _fetch_subreddit_async(
+        self,
+        reddit: asyncpraw.Reddit,
+        subreddit_name: str,
+        sort: str
+    ) -> List[Post]:
+        """
+        Fetch posts from a single subreddit with asyncpraw
+        
+        Args:
+            reddit: Shared asyncpraw client
+            subreddit_name: Name of subreddit
+            sort: Sort method (hot, new, top, rising)
+            
+        Returns:
+            List of posts
+        """
+        posts = []
+        
+        try:
+            logger.info(f"Fetching r/{subreddit_name}")
+            subreddit = await reddit.subreddit(subreddit_name)
+            scraped_at = datetime.utcnow().isoformat()
+            
+            async for submission in self._listing(subreddit, sort):
+                post = self._parse_submission(submission, subreddit_name, scraped_at)
+                if post:
+                    posts.append(post)
+            
+            logger.info(f"✓ r/{subreddit_name}: {len(posts)} posts")
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch r/{subreddit_name}: {e}")
+            
+        return posts
 
 
 if __name__ == "__main__":
@@ -215,10 +388,10 @@ if __name__ == "__main__":
         if posts:
             print(f"\nSample post:")
             post = posts[0]
-            print(f"  Title: {post['title']}")
-            print(f"  Subreddit: {post['source_name']}")
-            print(f"  Score: {post['score']}")
-            print(f"  Comments: {post['num_comments']}")
+            print(f"  Title: {post.title}")
+            print(f"  Subreddit: {post.source_name}")
+            print(f"  Score: {post.score}")
+            print(f"  Comments: {post.num_comments}")
     else:
         print("Reddit API credentials not configured")
         print("Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in .env")
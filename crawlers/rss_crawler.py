@@ -3,13 +3,38 @@ RSS Feed Crawler
 Fetches and parses RSS feeds from news sources
 """
 
+import aiohttp
+import asyncio
 import feedparser
+import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from lxml import etree
 from typing import List, Dict, Any, Optional
+from urllib.parse import urlparse
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 import hashlib
+import json
+import threading
 import time
 
+from crawlers.dedupe import SeenFilter
+from crawlers.schema import Article
+from crawlers.http_session import get_session
+
+
+# RSS <item> and Atom <entry> elements, in any namespace
+ENTRY_TAGS = ('{*}item', '{*}entry')
+
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+# Same shape as datetime.isoformat() for whole seconds
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
 
 class RSSCrawler:
     """Crawl RSS feeds from news sources"""
@@ -52,6 +77,11 @@ class RSSCrawler:
         self,
         feeds: Optional[List[Dict[str, str]]] = None,
         max_articles_per_feed: int = 50,
+        max_workers: int = 8,
+        host_delay: float = 2.0,
+        timeout: int = 30,
+        state_path: Optional[str] = ".cache/rss_feed_state.json",
+        seen_path: Optional[str] = ".cache/rss_seen.bloom",
     ):
         """
         Initialize RSS crawler
@@ -59,12 +89,38 @@ class RSSCrawler:
         Args:
             feeds: List of feed configs, or use defaults
             max_articles_per_feed: Max articles to fetch per feed
+            max_workers: Max feeds fetched in parallel
+            host_delay: Minimum delay between requests to the same host (seconds)
+            timeout: HTTP timeout per feed (seconds)
+            state_path: File persisting per-feed ETag/Last-Modified, or None to disable
+            seen_path: File persisting IDs of already-emitted articles, or None to disable
         """
         self.feeds = feeds or self.DEFAULT_FEEDS
         self.max_articles = max_articles_per_feed
+        self.max_workers = max_workers
+        self.host_delay = host_delay
+        self.timeout = timeout
+        
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'OSINT-Analyst/0.1.0'})
+        
+        # Conditional GET validators: url -> {"etag": ..., "modified": ...}.
+        # Ones from the current fetch wait in _pending_validators until its
+        # articles are delivered, so a failed publish doesn't 304 them away
+        self.state_path = Path(state_path) if state_path else None
+        self._validators = self._load_validators()
+        self._pending_validators: Dict[str, Optional[Dict[str, str]]] = {}
+        self._validators_lock = threading.Lock()
+        
+        # Articles delivered by earlier polls are skipped before full parsing
+        self._seen = SeenFilter(path=seen_path) if seen_path else None
+        
+        # Per-host politeness gate shared by worker threads
+        self._host_locks = defaultdict(threading.Lock)
+        self._host_last_fetch: Dict[str, float] = {}
         logger.info(f"RSS Crawler initialized with {len(self.feeds)} feeds")
         
-    def fetch_feed(self, feed_config: Dict[str, str]) -> List[Dict[str, Any]]:
+    def fetch_feed(self, feed_config: Dict[str, str]) -> List[Article]:
         """
         Fetch articles from a single RSS feed
         
@@ -72,24 +128,68 @@ class RSSCrawler:
             feed_config: Feed configuration dict
             
         Returns:
-            List of article dicts
+            List of articles
         """
         url = feed_config["url"]
         articles = []
         
         try:
             logger.info(f"Fetching: {feed_config['name']}")
-            feed = feedparser.parse(url)
+            response = self.session.get(
+                url,
+                timeout=self.timeout,
+                headers=self._conditional_headers(url),
+            )
             
-            if feed.bozo:
-                logger.warning(f"Feed parsing issue: {feed.bozo_exception}")
+            if response.status_code == 304:
+                logger.info(f"✓ {feed_config['name']}: not modified")
+                return articles
             
-            # Process entries
-            for entry in feed.entries[:self.max_articles]:
-                article = self._parse_entry(entry, feed_config)
-                if article:
-                    articles.append(article)
+            response.raise_for_status()
+            self._store_validators(url, response.headers)
+            
+            articles = self._parse_feed_bytes(response.content, feed_config)
+            logger.info(f"✓ {feed_config['name']}: {len(articles)} articles")
+            
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            
+        return articles
+        
+    async def fetch_feed_async(
+        self,
+        feed_config: Dict[str, str],
+        session: aiohttp.ClientSession
+    ) -> List[Article]:
+        """
+        Fetch articles from a single RSS feed over a shared aiohttp session
+        
+        Args:
+            feed_config: Feed configuration dict
+            session: Shared aiohttp session
+            
+        Returns:
+            List of articles
+        """
+        url = feed_config["url"]
+        articles = []
+        
+        try:
+            logger.info(f"Fetching: {feed_config['name']}")
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={**self.session.headers, **self._conditional_headers(url)},
+            ) as response:
+                if response.status == 304:
+                    logger.info(f"✓ {feed_config['name']}: not modified")
+                    return articles
+                
+                response.raise_for_status()
+                raw = await response.read()
+                self._store_validators(url, response.headers)
             
+            articles = self._parse_feed_bytes(raw, feed_config)
             logger.info(f"✓ {feed_config['name']}: {len(articles)} articles")
             
         except Exception as e:
@@ -97,35 +197,222 @@ class RSSCrawler:
             
         return articles
         
+    def _parse_feed_bytes(
+        self,
+        raw: bytes,
+        feed_config: Dict[str, str]
+    ) -> List[Article]:
+        """
+        Parse a downloaded feed, falling back to feedparser for malformed XML
+        
+        Args:
+            raw: Raw feed bytes
+            feed_config: Feed configuration
+            
+        Returns:
+            List of articles
+        """
+        # One timestamp for the whole batch - every entry was fetched together
+        scraped_at = datetime.utcnow().isoformat()
+        
+        try:
+            articles = self._parse_feed_xml(raw, feed_config, scraped_at)
+        except etree.XMLSyntaxError as e:
+            # Malformed feed - let feedparser's lenient parser deal with it
+            logger.warning(f"Feed parsing issue: {e}")
+            articles = []
+            feed = feedparser.parse(raw)
+            for entry in feed.entries[:self.max_articles]:
+                article = self._parse_entry(entry, feed_config, scraped_at)
+                if article:
+                    articles.append(article)
+        
+        # Stage only once a parser has finished, so entries read by an
+        # lxml pass that later failed are still emitted by the fallback
+        return [article for article in articles if not self._already_seen(article.id)]
+        
+    def _parse_feed_xml(
+        self,
+        raw: bytes,
+        feed_config: Dict[str, str],
+        scraped_at: str
+    ) -> List[Article]:
+        """
+        Stream-parse RSS/Atom entries with lxml
+        
+        Args:
+            raw: Raw feed bytes
+            feed_config: Feed configuration
+            scraped_at: ISO timestamp of the fetch
+            
+        Returns:
+            List of articles
+            
+        Raises:
+            etree.XMLSyntaxError: If the feed is not well-formed XML
+        """
+        articles = []
+        processed = 0
+        
+        for _, elem in etree.iterparse(BytesIO(raw), tag=ENTRY_TAGS):
+            processed += 1
+            article = self._parse_element(elem, feed_config, scraped_at)
+            if article:
+                articles.append(article)
+            
+            # Free processed entries so memory stays flat on large feeds
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+            
+            if processed >= self.max_articles:
+                break
+        
+        return articles
+        
+    def _parse_element(
+        self,
+        elem: Any,
+        feed_config: Dict[str, str],
+        scraped_at: str
+    ) -> Optional[Article]:
+        """
+        Parse a single RSS <item> or Atom <entry> element
+        
+        Args:
+            elem: lxml element
+            feed_config: Feed configuration
+            scraped_at: ISO timestamp of the fetch
+            
+        Returns:
+            Normalized article
+        """
+        try:
+            link = elem.findtext('{*}link') or ""
+            if not link:
+                # Atom: <link rel="alternate" href="..."/>
+                for link_elem in elem.iterfind('{*}link'):
+                    if link_elem.get('rel', 'alternate') == 'alternate':
+                        link = link_elem.get('href', '')
+                        break
+            link = link.strip()
+            guid = elem.findtext('{*}guid') or elem.findtext('{*}id') or ""
+            
+            article_id = self._generate_id(link or guid.strip())
+            if self._emitted_before(article_id):
+                return None
+            
+            # Parse published date
+            published = self._parse_date(
+                elem.findtext('{*}pubDate')
+                or elem.findtext('{*}published')
+                or elem.findtext('{*}updated')
+                or elem.findtext('{*}date'),
+                default=scraped_at,
+            )
+            
+            # Extract content (content:encoded / Atom content, then summary)
+            content = (
+                elem.findtext('{*}encoded')
+                or elem.findtext('{*}content')
+                or elem.findtext('{*}summary')
+                or elem.findtext('{*}description')
+                or ""
+            )
+            
+            author = (
+                elem.findtext('{*}author/{*}name')
+                or elem.findtext('{*}author')
+                or elem.findtext('{*}creator')
+                or ""
+            )
+            
+            tags = [
+                cat.get('term') or (cat.text or "").strip()
+                for cat in elem.iterfind('{*}category')
+            ]
+            
+            media = [
+                {"type": m.get('type', ''), "url": m.get('url', '')}
+                for m in elem.iterfind(f'{{{MEDIA_NS}}}content')
+            ]
+            media.extend(
+                {"type": enc.get('type', ''), "url": enc.get('url', '')}
+                for enc in elem.iterfind('{*}enclosure')
+            )
+            
+            return Article(
+                id=article_id,
+                source_type="rss",
+                source_name=feed_config["name"],
+                source_url=feed_config["url"],
+                category=feed_config["category"],
+                language=feed_config.get("language", "en"),
+                
+                title=(elem.findtext('{*}title') or "").strip(),
+                url=link,
+                content=content.strip(),
+                author=author.strip(),
+                
+                published_at=published,
+                scraped_at=scraped_at,
+                
+                tags=[tag for tag in tags if tag],
+                media=media,
+            )
+            
+        except Exception as e:
+            logger.debug(f"Failed to parse entry: {e}")
+            return None
+            
+    def _parse_date(self, value: Optional[str], default: str) -> str:
+        """Parse an RFC 822 or ISO 8601 date into a naive UTC ISO string"""
+        if value:
+            value = value.strip()
+            for parser in (parsedate_to_datetime, datetime.fromisoformat):
+                try:
+                    parsed = parser(value)
+                except (TypeError, ValueError):
+                    continue
+                if parsed.tzinfo is not None:
+                    parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+                return parsed.isoformat()
+        
+        return default
+        
     def _parse_entry(
         self,
         entry: Any,
-        feed_config: Dict[str, str]
-    ) -> Optional[Dict[str, Any]]:
+        feed_config: Dict[str, str],
+        scraped_at: str
+    ) -> Optional[Article]:
         """
         Parse a single RSS entry
         
         Args:
             entry: Feedparser entry
             feed_config: Feed configuration
+            scraped_at: ISO timestamp of the fetch
             
         Returns:
-            Normalized article dict
+            Normalized article
         """
         try:
             # Generate unique ID
             article_id = self._generate_id(
                 entry.get('link', '') or entry.get('id', '')
             )
+            if self._emitted_before(article_id):
+                return None
             
             # Parse published date
             published = None
             if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime(*entry.published_parsed[:6]).isoformat()
+                published = time.strftime(ISO_FORMAT, entry.published_parsed)
             elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                published = datetime(*entry.updated_parsed[:6]).isoformat()
+                published = time.strftime(ISO_FORMAT, entry.updated_parsed)
             else:
-                published = datetime.utcnow().isoformat()
+                published = scraped_at
             
             # Extract content
             content = ""
@@ -136,25 +423,25 @@ class RSSCrawler:
             elif hasattr(entry, 'description'):
                 content = entry.description
             
-            article = {
-                "id": article_id,
-                "source_type": "rss",
-                "source_name": feed_config["name"],
-                "source_url": feed_config["url"],
-                "category": feed_config["category"],
-                "language": feed_config.get("language", "en"),
+            article = Article(
+                id=article_id,
+                source_type="rss",
+                source_name=feed_config["name"],
+                source_url=feed_config["url"],
+                category=feed_config["category"],
+                language=feed_config.get("language", "en"),
                 
-                "title": entry.get('title', ''),
-                "url": entry.get('link', ''),
-                "content": content,
-                "author": entry.get('author', ''),
+                title=entry.get('title', ''),
+                url=entry.get('link', ''),
+                content=content,
+                author=entry.get('author', ''),
                 
-                "published_at": published,
-                "scraped_at": datetime.utcnow().isoformat(),
+                published_at=published,
+                scraped_at=scraped_at,
                 
-                "tags": [tag.term for tag in entry.get('tags', [])],
-                "media": self._extract_media(entry),
-            }
+                tags=[tag.term for tag in entry.get('tags', [])],
+                media=self._extract_media(entry),
+            )
             
             return article
             
@@ -162,9 +449,22 @@ class RSSCrawler:
             logger.debug(f"Failed to parse entry: {e}")
             return None
             
+    def _emitted_before(self, article_id: str) -> bool:
+        """Whether an earlier, committed fetch emitted the article (skips parsing it)"""
+        return self._seen is not None and article_id in self._seen
+        
+    def _already_seen(self, article_id: str) -> bool:
+        """Stage an article ID, returning True if it was already emitted or staged"""
+        return self._seen is not None and self._seen.stage(article_id)
+        
+    def commit_seen(self):
+        """Mark the last fetch's articles as seen; call once they are published"""
+        if self._seen is not None:
+            self._seen.commit()
+        
     def _generate_id(self, url: str) -> str:
         """Generate unique ID from URL"""
-        return hashlib.md5(url.encode()).hexdigest()[:16]
+        return hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
         
     def _extract_media(self, entry: Any) -> List[Dict[str, str]]:
         """Extract media URLs from entry"""
@@ -188,21 +488,131 @@ class RSSCrawler:
         
         return media
         
-    def fetch_all(self) -> List[Dict[str, Any]]:
+    # ==================== Conditional GET ====================
+    
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        """Load persisted ETag/Last-Modified values"""
+        if not self.state_path or not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed state {self.state_path}: {e}")
+            return {}
+            
+    def save_validators(self):
+        """Apply and persist the last fetch's ETag/Last-Modified values; call once its articles are published"""
+        with self._validators_lock:
+            for url, validators in self._pending_validators.items():
+                if validators:
+                    self._validators[url] = validators
+                else:
+                    self._validators.pop(url, None)
+            self._pending_validators.clear()
+            
+        if not self.state_path:
+            return
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._validators_lock:
+                data = json.dumps(self._validators)
+            with open(self.state_path, 'w') as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning(f"Failed to save feed state: {e}")
+            
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a feed"""
+        with self._validators_lock:
+            cached = self._validators.get(url, {})
+        headers = {}
+        if cached.get("etag"):
+            headers['If-None-Match'] = cached["etag"]
+        if cached.get("modified"):
+            headers['If-Modified-Since'] = cached["modified"]
+        return headers
+        
+    def _store_validators(self, url: str, response_headers: Any):
+        """Hold a feed's ETag/Last-Modified from a 200 response until save_validators()"""
+        etag = response_headers.get('ETag')
+        modified = response_headers.get('Last-Modified')
+        with self._validators_lock:
+            self._pending_validators[url] = {"etag": etag, "modified": modified} if etag or modified else None
+        
+    def _discard_pending(self):
+        """Drop seen IDs and validators from a fetch whose articles were never published"""
+        if self._seen is not None:
+            self._seen.discard_staged()
+        with self._validators_lock:
+            self._pending_validators.clear()
+            
+    def _fetch_feed_polite(self, feed_config: Dict[str, str]) -> List[Article]:
+        """Fetch a feed, waiting out host_delay since the last request to its host"""
+        host = urlparse(feed_config["url"]).netloc
+        
+        with self._host_locks[host]:
+            wait = self._host_last_fetch.get(host, 0.0) + self.host_delay - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._host_last_fetch[host] = time.monotonic()
+        
+        return self.fetch_feed(feed_config)
+        
+    def fetch_all(self) -> List[Article]:
         """
         Fetch articles from all feeds
         
         Returns:
             List of all articles
         """
-        all_articles = []
+        if not self.feeds:
+            return []
         
-        for feed_config in self.feeds:
-            articles = self.fetch_feed(feed_config)
-            all_articles.extend(articles)
+        # Articles from a fetch that was never committed are emitted again
+        self._discard_pending()
+        
+        # Feeds on different hosts are independent, so fetch them in parallel
+        workers = min(len(self.feeds), self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._fetch_feed_polite, self.feeds))
+        
+        all_articles = [article for articles in results for article in articles]
+        
+        logger.info(f"Total articles fetched: {len(all_articles)}")
+        return all_articles
+        
+    async def fetch_all_async(
+        self,
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Article]:
+        """
+        Fetch articles from all feeds on the event loop
+        
+        Args:
+            session: aiohttp session to use (default: the shared crawler session)
             
-            # Rate limiting
-            time.sleep(2)
+        Returns:
+            List of all articles
+        """
+        session = session or get_session()
+        self._discard_pending()
+        host_locks = defaultdict(asyncio.Lock)
+        host_last_fetch: Dict[str, float] = {}
+        
+        async def fetch_one(feed_config: Dict[str, str]) -> List[Article]:
+            host = urlparse(feed_config["url"]).netloc
+            async with host_locks[host]:
+                loop = asyncio.get_running_loop()
+                wait = host_last_fetch.get(host, 0.0) + self.host_delay - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                host_last_fetch[host] = loop.time()
+            return await self.fetch_feed_async(feed_config, session)
+        
+        results = await asyncio.gather(*(fetch_one(feed) for feed in self.feeds))
+        
+        all_articles = [article for articles in results for article in articles]
         
         logger.info(f"Total articles fetched: {len(all_articles)}")
         return all_articles
@@ -218,7 +628,7 @@ if __name__ == "__main__":
     if articles:
         print(f"\nSample article:")
         article = articles[0]
-        print(f"  Title: {article['title']}")
-        print(f"  Source: {article['source_name']}")
-        print(f"  URL: {article['url']}")
-        print(f"  Published: {article['published_at']}")
+        print(f"  Title: {article.title}")
+        print(f"  Source: {article.source_name}")
+        print(f"  URL: {article.url}")
+        print(f"  Published: {article.published_at}")
@@ -0,0 +1,68 @@
+"""
+Crawler Item Schema
+Slotted records for collected articles and posts
+"""
+
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional
+
+
+@dataclass(slots=True)
+class Article:
+    """News article collected from an RSS/Atom feed"""
+    id: str
+    source_type: str
+    source_name: str
+    source_url: str
+    category: str
+    language: str
+
+    title: str
+    url: str
+    content: str
+    author: str
+
+    published_at: str
+    scraped_at: str
+
+    tags: List[str]
+    media: List[Dict[str, str]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON/Kafka boundaries"""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class Post:
+    """Reddit submission"""
+    id: str
+    source_type: str
+    source_name: str
+    source_url: str
+    category: str
+    language: str
+
+    title: str
+    url: str
+    permalink: str
+    content: str
+    author: str
+
+    published_at: str
+    scraped_at: str
+
+    score: int
+    upvote_ratio: float
+    num_comments: int
+
+    is_self_post: bool
+    is_video: bool
+    over_18: bool
+
+    flair: Optional[str]
+    domain: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for JSON/Kafka boundaries"""
+        return asdict(self)
@@ -3,13 +3,124 @@ Web Scraper
 Scrapes full article content from news websites
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Dict, Any
+import asyncio
+import aiohttp
+import hishel
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
 from loguru import logger
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
+import atexit
+import io
+import os
 import time
 
+from crawlers.http_session import get_session
+
+
+# Combined selectors: soupsieve matches all alternatives in one tree walk
+ARTICLE_SELECTOR = (
+    "article, .article, .post-content, .entry-content, .article-body, "
+    "[itemprop='articleBody']"
+)
+AUTHOR_SELECTOR = "[itemprop='author'], .author, author, [rel~='author']"
+STRIP_SELECTOR = "script, style, nav, footer, iframe, aside, noscript, svg"
+META_SELECTOR = "meta[property^='og:'], meta[name^='twitter:']"
+
+# Known publishers (the RSSCrawler defaults): CSS selectors for their body
+# paragraphs and byline. Selectors are scoped under <article> so they survive
+# the parse-time strainer. Pages where a rule misses fall back to the generic
+# selectors.
+SITE_RULES: Dict[str, Dict[str, str]] = {
+    'bbc.com': {
+        'content': "article [data-component='text-block'] p",
+        'author': "article [data-testid='byline-new-contributors'] span",
+    },
+    'bbc.co.uk': {
+        'content': "article [data-component='text-block'] p",
+        'author': "article [data-testid='byline-new-contributors'] span",
+    },
+    'reuters.com': {
+        'content': "article [data-testid^='paragraph-']",
+        'author': "article [rel~='author']",
+    },
+    'nytimes.com': {
+        'content': "article section[name='articleBody'] p",
+        'author': "article [itemprop='author'] [itemprop='name']",
+    },
+    'washingtonpost.com': {
+        'content': "article p[data-el='text']",
+        'author': "article [data-qa='author-name']",
+    },
+    'aljazeera.com': {
+        'content': "article .wysiwyg p",
+        'author': "article .author-link",
+    },
+}
+
+# Article text sits well within the first couple of MB; anything past that
+# (inline video manifests, infinite-scroll payloads) is not read
+MAX_BODY_BYTES = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+# Upper bound on <p> tags scanned by the whole-page fallback
+MAX_FALLBACK_PARAGRAPHS = 500
+
+# Tags and attribute values the extractors look at; everything else is
+# skipped at parse time so script/style/adtech subtrees are never built
+RELEVANT_TAGS = frozenset(['article', 'h1', 'title', 'p', 'meta', 'time', 'author'])
+RELEVANT_CLASSES = frozenset(['article', 'post-content', 'entry-content', 'article-body', 'author'])
+RELEVANT_ITEMPROPS = frozenset(['articleBody', 'author', 'datePublished'])
+
+
+def _is_relevant_tag(name: str, attrs: Dict[str, Any]) -> bool:
+    """SoupStrainer filter: keep tags matched by the article/author/date selectors"""
+    if name in RELEVANT_TAGS:
+        return True
+    if not attrs:
+        return False
+    if attrs.get('itemprop') in RELEVANT_ITEMPROPS:
+        return True
+    classes = attrs.get('class') or ''
+    if isinstance(classes, str):
+        classes = classes.split()
+    if not RELEVANT_CLASSES.isdisjoint(classes):
+        return True
+    rel = attrs.get('rel') or ''
+    if isinstance(rel, str):
+        rel = rel.split()
+    return 'author' in rel
+
+
+RELEVANT = SoupStrainer(_is_relevant_tag)
+
+
+def _parse_html_worker(html: bytes, url: str) -> Dict[str, Any]:
+    """Parse raw HTML into an article dict (module-level so it pickles)"""
+    soup = BeautifulSoup(html, 'lxml', parse_only=RELEVANT)
+    return WebScraper._extract_content(soup, url)
+
+
+@lru_cache(maxsize=1)
+def get_parse_pool() -> ProcessPoolExecutor:
+    """
+    Process-wide HTML parse pool, created on first use and shut down at exit
+    
+    Returns:
+        Shared pool sized by SCRAPER_PARSE_WORKERS (default: CPU count)
+    """
+    workers = int(os.getenv("SCRAPER_PARSE_WORKERS", "0")) or os.cpu_count()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    atexit.register(pool.shutdown)
+    logger.debug(f"Created HTML parse pool with {workers} workers")
+    return pool
+
 
 class WebScraper:
     """Scrape full article content from web pages"""
@@ -20,6 +131,10 @@ class WebScraper:
         timeout: int = 30,
         max_retries: int = 3,
         rate_limit_delay: float = 2.0,
+        max_concurrency: int = 20,
+        max_body_bytes: int = MAX_BODY_BYTES,
+        cache_dir: Optional[str] = ".cache/http",
+        cache_ttl: timedelta = timedelta(hours=6),
     ):
         """
         Initialize web scraper
@@ -28,7 +143,11 @@ class WebScraper:
             user_agent: User agent string
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
-            rate_limit_delay: Delay between requests (seconds)
+            rate_limit_delay: Delay between requests to the same host (seconds)
+            max_concurrency: Max in-flight requests for scrape_articles
+            max_body_bytes: Response bytes read per page; the rest is dropped
+            cache_dir: On-disk HTTP cache for scrape_article, or None to disable
+            cache_ttl: Maximum age of cached responses
         """
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -38,51 +157,179 @@ class WebScraper:
         self.timeout = timeout
         self.max_retries = max_retries
         self.rate_limit_delay = rate_limit_delay
+        self.max_concurrency = max_concurrency
+        self.max_body_bytes = max_body_bytes
         
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             'User-Agent': self.user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-        })
+        }
+        # HTTP/2 lets same-host article fetches share one multiplexed connection.
+        # With a cache_dir, responses are cached on disk and revalidated with
+        # ETag/Last-Modified, so re-scraping the same URLs costs little or nothing.
+        client_cls = httpx.Client
+        cache_kwargs = {}
+        if cache_dir:
+            client_cls = hishel.CacheClient
+            cache_kwargs = {
+                "storage": hishel.FileStorage(
+                    base_path=Path(cache_dir),
+                    ttl=cache_ttl.total_seconds(),
+                ),
+                "controller": hishel.Controller(allow_heuristics=True),
+            }
+        self.client = client_cls(
+            **cache_kwargs,
+            http2=True,
+            timeout=self.timeout,
+            headers=self.headers,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=90,
+            ),
+        )
         
         logger.info("Web scraper initialized")
         
-    def scrape_article(self, url: str) -> Optional[Dict[str, Any]]:
+    def scrape_article(self, url: str, bypass_cache: bool = False) -> Optional[Dict[str, Any]]:
         """
         Scrape a single article
         
         Args:
             url: Article URL
+            bypass_cache: Revalidate with the origin instead of serving from cache
             
         Returns:
             Article dict with extracted content
         """
+        headers = {'Cache-Control': 'no-cache'} if bypass_cache else None
+        
         for attempt in range(self.max_retries):
             try:
                 logger.debug(f"Scraping: {url} (attempt {attempt + 1})")
                 
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.content, 'lxml')
+                with self.client.stream('GET', url, headers=headers) as response:
+                    response.raise_for_status()
+                    if not self._is_html(response.headers.get('Content-Type', ''), url):
+                        return None
+                    html = self._read_capped(response.iter_bytes(CHUNK_SIZE))
+                    from_cache = response.extensions.get("from_cache", False)
                 
-                # Extract content
-                article = self._extract_content(soup, url)
+                # Parse HTML and extract content
+                article = self._parse_html(html, url)
                 
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
+                # Rate limiting (cache hits never reached the site)
+                if not from_cache:
+                    time.sleep(self.rate_limit_delay)
                 
                 return article
                 
-            except requests.Timeout:
+            except httpx.TimeoutException:
                 logger.warning(f"Timeout on attempt {attempt + 1}: {url}")
                 if attempt == self.max_retries - 1:
                     return None
                 time.sleep(2 ** attempt)  # Exponential backoff
                 
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
+                logger.error(f"Request failed: {e}")
+                return None
+                
+            except Exception as e:
+                logger.error(f"Scraping failed: {e}")
+                return None
+        
+        return None
+        
+    # ==================== Async Batch Scraping ====================
+    
+    async def scrape_articles(
+        self,
+        urls: List[str],
+        session: Optional[aiohttp.ClientSession] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Scrape many articles concurrently
+        
+        Requests to different hosts run in parallel; requests to the same
+        host are still spaced by rate_limit_delay.
+        
+        Args:
+            urls: Article URLs
+            session: aiohttp session to use (default: the shared crawler session)
+            
+        Returns:
+            One article dict (or None on failure) per URL, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        host_locks = defaultdict(asyncio.Lock)
+        host_last_fetch: Dict[str, float] = {}
+        session = session or get_session()
+        
+        async def scrape_one(url: str) -> Optional[Dict[str, Any]]:
+            host = urlparse(url).netloc
+            async with semaphore:
+                # Per-host politeness: space out request start times
+                async with host_locks[host]:
+                    loop = asyncio.get_running_loop()
+                    wait = host_last_fetch.get(host, 0.0) + self.rate_limit_delay - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    host_last_fetch[host] = loop.time()
+                return await self._fetch_and_parse(session, url)
+        
+        results = await asyncio.gather(*(scrape_one(url) for url in urls))
+        
+        logger.info(f"Scraped {sum(1 for r in results if r)}/{len(urls)} articles")
+        return results
+        
+    async def _fetch_and_parse(
+        self,
+        session: aiohttp.ClientSession,
+        url: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a URL with retries and parse it off the event loop
+        
+        Args:
+            session: Shared aiohttp session
+            url: Article URL
+            
+        Returns:
+            Article dict with extracted content
+        """
+        for attempt in range(self.max_retries):
+            try:
+                logger.debug(f"Scraping: {url} (attempt {attempt + 1})")
+                
+                async with session.get(
+                    url,
+                    headers=self.headers,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                ) as response:
+                    response.raise_for_status()
+                    if not self._is_html(response.headers.get('Content-Type', ''), url):
+                        return None
+                    html = await self._read_capped_async(
+                        response.content.iter_chunked(CHUNK_SIZE)
+                    )
+                
+                # HTML parsing is CPU-bound; run it in the shared process
+                # pool so fetches keep flowing meanwhile
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    get_parse_pool(), _parse_html_worker, html, url
+                )
+                
+            except asyncio.TimeoutError:
+                logger.warning(f"Timeout on attempt {attempt + 1}: {url}")
+                if attempt == self.max_retries - 1:
+                    return None
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                
+            except aiohttp.ClientError as e:
                 logger.error(f"Request failed: {e}")
                 return None
                 
@@ -92,7 +339,39 @@ class WebScraper:
         
         return None
         
-    def _extract_content(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    @staticmethod
+    def _is_html(content_type: str, url: str) -> bool:
+        """Check a response is markup worth parsing (PDFs, images, video are not)"""
+        content_type = content_type.lower()
+        if not content_type or 'html' in content_type or 'xml' in content_type:
+            return True
+        logger.debug(f"Skipping non-HTML {content_type}: {url}")
+        return False
+        
+    def _read_capped(self, chunks: Any) -> bytes:
+        """Read a streamed body up to max_body_bytes"""
+        buf = bytearray()
+        for chunk in chunks:
+            buf.extend(chunk)
+            if len(buf) >= self.max_body_bytes:
+                break
+        return bytes(buf[:self.max_body_bytes])
+        
+    async def _read_capped_async(self, chunks: Any) -> bytes:
+        """Read a streamed body up to max_body_bytes (async iterator)"""
+        buf = bytearray()
+        async for chunk in chunks:
+            buf.extend(chunk)
+            if len(buf) >= self.max_body_bytes:
+                break
+        return bytes(buf[:self.max_body_bytes])
+        
+    def _parse_html(self, html: bytes, url: str) -> Dict[str, Any]:
+        """Parse raw HTML and extract article content"""
+        return _parse_html_worker(html, url)
+        
+    @staticmethod
+    def _extract_content(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
         """
         Extract article content from HTML
         
@@ -103,8 +382,8 @@ class WebScraper:
         Returns:
             Dict with extracted fields
         """
-        # Remove scripts, styles, nav, footer
-        for tag in soup(['script', 'style', 'nav', 'footer', 'iframe', 'aside']):
+        # Remove scripts, styles, nav, footer nested inside kept containers
+        for tag in soup.select(STRIP_SELECTOR):
             tag.decompose()
         
         # Extract title
@@ -114,50 +393,38 @@ class WebScraper:
         elif soup.find('title'):
             title = soup.find('title').get_text(strip=True)
         
+        # Publisher-specific rule, if we have one for this host
+        host = (urlparse(url).hostname or '').removeprefix('www.')
+        rule = SITE_RULES.get(host)
+        
         # Extract article content
         content = ""
+        if rule:
+            content = WebScraper._join_paragraphs(soup.select(rule['content']))
         
-        # Try common article selectors
-        article_selectors = [
-            {'name': 'article'},
-            {'class_': 'article'},
-            {'class_': 'post-content'},
-            {'class_': 'entry-content'},
-            {'class_': 'article-body'},
-            {'itemprop': 'articleBody'},
-        ]
-        
-        for selector in article_selectors:
-            article_tag = soup.find(**selector)
-            if article_tag:
+        # Try common article containers, in document order
+        if len(content) <= 200:
+            for article_tag in soup.select(ARTICLE_SELECTOR):
                 # Get all paragraphs
-                paragraphs = article_tag.find_all('p')
-                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+                content = WebScraper._join_paragraphs(article_tag.find_all('p'))
                 if len(content) > 200:  # Minimum content length
                     break
         
         # Fallback: get all paragraphs
         if not content or len(content) < 200:
-            paragraphs = soup.find_all('p')
-            content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+            paragraphs = soup.find_all('p', limit=MAX_FALLBACK_PARAGRAPHS)
+            content = WebScraper._join_paragraphs(paragraphs)
         
         # Extract metadata
-        metadata = self._extract_metadata(soup)
+        metadata = WebScraper._extract_metadata(soup)
         
         # Extract author
         author = ""
-        author_selectors = [
-            {'itemprop': 'author'},
-            {'class_': 'author'},
-            {'name': 'author'},
-            {'rel': 'author'},
-        ]
-        
-        for selector in author_selectors:
-            author_tag = soup.find(**selector)
-            if author_tag:
-                author = author_tag.get_text(strip=True)
-                break
+        author_tag = rule and soup.select_one(rule['author'])
+        if not author_tag:
+            author_tag = soup.select_one(AUTHOR_SELECTOR)
+        if author_tag:
+            author = author_tag.get_text(strip=True)
         
         # Extract published date
         published_at = None
@@ -188,31 +455,42 @@ class WebScraper:
             "metadata": metadata,
         }
         
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, str]:
+    @staticmethod
+    def _join_paragraphs(paragraphs: List[Any]) -> str:
+        """Join non-empty paragraph texts with blank lines, without a temp list"""
+        buf = io.StringIO()
+        for p in paragraphs:
+            text = p.get_text(strip=True)
+            if text:
+                if buf.tell():
+                    buf.write('\n\n')
+                buf.write(text)
+        return buf.getvalue()
+        
+    @staticmethod
+    def _extract_metadata(soup: BeautifulSoup) -> Dict[str, str]:
         """Extract Open Graph and meta tags"""
         metadata = {}
         
-        # Open Graph tags
-        og_tags = soup.find_all('meta', property=lambda x: x and x.startswith('og:'))
-        for tag in og_tags:
-            key = tag.get('property', '').replace('og:', '')
+        # Open Graph and Twitter Card tags in one pass
+        for tag in soup.select(META_SELECTOR):
             value = tag.get('content', '')
-            if key and value:
-                metadata[key] = value
-        
-        # Twitter Card tags
-        twitter_tags = soup.find_all('meta', attrs={'name': lambda x: x and x.startswith('twitter:')})
-        for tag in twitter_tags:
-            key = tag.get('name', '').replace('twitter:', '')
-            value = tag.get('content', '')
-            if key and value:
-                metadata[f'twitter_{key}'] = value
+            if not value:
+                continue
+            
+            prop = tag.get('property', '')
+            if prop.startswith('og:') and prop[3:]:
+                metadata[prop[3:]] = value
+            
+            name = tag.get('name', '')
+            if name.startswith('twitter:') and name[8:]:
+                metadata[f'twitter_{name[8:]}'] = value
         
         return metadata
         
     def close(self):
-        """Close session"""
-        self.session.close()
+        """Close HTTP client"""
+        self.client.close()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,80 @@ OSINT Intelligence Dashboard
 Interactive Gradio interface for exploring the knowledge graph
 """
 
+import asyncio
+import atexit
 import gradio as gr
+import html
+import httpx
+import orjson
+import re
 import requests
-import json
+import time
+from collections import Counter, OrderedDict
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
 import plotly.graph_objects as go
-import plotly.express as px
 
 # API Configuration
 API_BASE_URL = "http://localhost:8000"
 
+# One pooled keep-alive session for every API call, instead of a new
+# connection per requests.get
+SESSION = requests.Session()
+SESSION.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    ),
+)
+atexit.register(SESSION.close)
+
+# Analytics responses are reused for this many seconds per (endpoint, params)
+ANALYTICS_TTL = 30
+ANALYTICS_CACHE_SIZE = 256
+
+# Past this many nodes the network graph shows names on hover only
+LABEL_NODE_LIMIT = 200
+
+# (connect, read) timeout for every API call, so a hung API can't pin a worker
+REQUEST_TIMEOUT = (2, 10)
+
+# Circuit breaker: after more than BREAKER_THRESHOLD failures in a row, each
+# within BREAKER_WINDOW seconds of the last, calls to that endpoint fail fast
+# until BREAKER_WINDOW seconds pass without a new failure
+BREAKER_THRESHOLD = 3
+BREAKER_WINDOW = 30
+
+# Simultaneous runs allowed per network/analytics event; Gradio defaults to one
+EVENT_CONCURRENCY = 4
+
+# Async client for fanning out independent analytics requests on the event
+# loop. HTTP/2 is negotiated over TLS, so it takes effect when the API sits
+# behind an https proxy; plain http:// stays on pooled HTTP/1.1 keep-alive.
+ASYNC_CLIENT = httpx.AsyncClient(
+    http2=True,
+    headers={"Accept": "application/json"},
+    timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+)
+
+# Overview payload (stats + entities + sources) is reused for this many seconds
+BULK_TTL = 30
+
+# Rows per page for entity and claim tables
+PAGE_SIZE = 200
+
+# Browse-style /entities results (no name query) are reused for this many seconds
+ENTITIES_TTL = 15
+
 # Custom CSS for professional styling
 CUSTOM_CSS = """
 @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
@@ -401,90 +464,452 @@ input[type="range"]::-webkit-slider-thumb {
 }
 """
 
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,])\s*", r"\1", css).strip()
+
+CUSTOM_CSS = _minify_css(CUSTOM_CSS)
+
+# endpoint key -> (consecutive failures, time of last failure)
+_breaker: Dict[str, tuple] = {}
+
+def _breaker_key(url: str) -> str:
+    """Endpoint a URL belongs to, e.g. 'analytics/trends' or 'network/Venezuela'"""
+    return "/".join(urlsplit(url).path.strip("/").split("/")[:2])
+
+def _record_failure(key: str, now: float):
+    """Count a failed call against an endpoint"""
+    failures, last = _breaker.get(key, (0, now))
+    if now - last > BREAKER_WINDOW:
+        failures = 0
+    _breaker[key] = (failures + 1, now)
+
+def _check_circuit(key: str, now: float):
+    """Fail fast if an endpoint's circuit is open"""
+    failures, last = _breaker.get(key, (0, 0.0))
+    if failures > BREAKER_THRESHOLD and now - last < BREAKER_WINDOW:
+        raise requests.ConnectionError(f"API endpoint {key} is failing, retry in a few seconds")
+
+def _record_status(key: str, now: float, status_code: int):
+    """Count a 5xx against an endpoint, or reset it on any other response"""
+    if status_code >= 500:
+        _record_failure(key, now)
+    else:
+        _breaker.pop(key, None)
+
+def _get(url: str, **kwargs) -> requests.Response:
+    """
+    GET through the shared session with a timeout and circuit breaker
+    
+    Args:
+        url: Full API URL
+        **kwargs: Passed through to requests (e.g. params)
+        
+    Returns:
+        Response
+        
+    Raises:
+        requests.ConnectionError: The endpoint's circuit is open
+        requests.RequestException: The request itself failed
+    """
+    key = _breaker_key(url)
+    now = time.monotonic()
+    _check_circuit(key, now)
+    
+    try:
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+    except requests.RequestException:
+        _record_failure(key, now)
+        raise
+    
+    _record_status(key, now, response.status_code)
+    return response
+
+async def _aget(url: str, **kwargs) -> httpx.Response:
+    """
+    GET through the async client, sharing _get's circuit breaker
+    
+    Args:
+        url: Full API URL
+        **kwargs: Passed through to httpx (e.g. params)
+        
+    Returns:
+        Response
+        
+    Raises:
+        requests.ConnectionError: The endpoint's circuit is open
+        httpx.HTTPError: The request itself failed
+    """
+    key = _breaker_key(url)
+    now = time.monotonic()
+    _check_circuit(key, now)
+    
+    try:
+        response = await ASYNC_CLIENT.get(url, **kwargs)
+    except httpx.HTTPError:
+        _record_failure(key, now)
+        raise
+    
+    _record_status(key, now, response.status_code)
+    return response
+
+def _json(response: Union[requests.Response, httpx.Response]) -> Any:
+    """Decode a JSON response body with orjson"""
+    return orjson.loads(response.content)
+
+def _frame(payload: Any, columns: List[str]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a table payload
+    
+    Args:
+        payload: orient='split' dict from the API, or a list of records
+        columns: Columns to keep, in display order
+        
+    Returns:
+        DataFrame with just those columns
+    """
+    if isinstance(payload, dict):
+        df = pd.DataFrame(payload['data'], columns=payload['columns'])
+        return df[columns]
+    return pd.DataFrame.from_records(payload, columns=columns)
+
+_analytics_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def fetch_analytics(url: str, what: str) -> Dict[str, Any]:
+    """
+    GET an analytics endpoint, reusing successful responses for ANALYTICS_TTL
+    
+    Args:
+        url: Full endpoint URL including query string
+        what: Name used in the error message
+        
+    Returns:
+        Decoded JSON, or {"error": ...} on a non-200 response
+    """
+    now = time.monotonic()
+    hit = _analytics_cache.get(url)
+    if hit and now - hit[0] < ANALYTICS_TTL:
+        return hit[1]
+    
+    response = _get(url)
+    if response.status_code != 200:
+        return {"error": f"Failed to get {what}: {response.status_code}"}
+    
+    return _store_analytics(url, now, _json(response))
+
+async def fetch_analytics_async(url: str, what: str, cached: bool = True) -> Dict[str, Any]:
+    """
+    Async fetch_analytics for fan-out on the event loop
+    
+    Args:
+        url: Full endpoint URL including query string
+        what: Name used in the error message
+        cached: Read and fill the shared analytics cache
+        
+    Returns:
+        Decoded JSON, or {"error": ...} on failure
+    """
+    now = time.monotonic()
+    hit = _analytics_cache.get(url) if cached else None
+    if hit and now - hit[0] < ANALYTICS_TTL:
+        return hit[1]
+    
+    try:
+        response = await _aget(url)
+    except Exception as e:
+        return {"error": str(e)}
+    if response.status_code != 200:
+        return {"error": f"Failed to get {what}: {response.status_code}"}
+    
+    data = _json(response)
+    return _store_analytics(url, now, data) if cached else data
+
+def _store_analytics(url: str, now: float, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache an analytics response, evicting the least recently stored"""
+    _analytics_cache[url] = (now, data)
+    _analytics_cache.move_to_end(url)
+    if len(_analytics_cache) > ANALYTICS_CACHE_SIZE:
+        _analytics_cache.popitem(last=False)
+    return data
+
+def trends_url(period: str) -> str:
+    return f"{API_BASE_URL}/analytics/trends?time_period={period}"
+
+def anomalies_url(hours: float) -> str:
+    return f"{API_BASE_URL}/analytics/anomalies?hours={int(hours)}"
+
+def contradictions_url(days: float, entity: str) -> str:
+    url = f"{API_BASE_URL}/analytics/contradictions?days={int(days)}"
+    if entity:
+        url += f"&entity_name={entity}"
+    return url
+
+def credibility_url(days: float, source: str) -> str:
+    url = f"{API_BASE_URL}/analytics/credibility?days={int(days)}"
+    if source:
+        url += f"&source_name={source}"
+    return url
+
+def clear_analytics_cache():
+    """Drop cached analytics responses so the next query goes to the API"""
+    _analytics_cache.clear()
+    return "Analytics cache cleared."
+
+@lru_cache(maxsize=1)
+def _fetch_bulk(time_bucket: int) -> Dict[str, Any]:
+    """Fetch the overview payload; memoized per BULK_TTL time bucket"""
+    response = _get(
+        f"{API_BASE_URL}/dashboard/bulk",
+        params={'entity_limit': PAGE_SIZE}
+    )
+    response.raise_for_status()
+    return _json(response)
+
+def fetch_bulk() -> Dict[str, Any]:
+    """Get stats, entities and sources from a single API round trip"""
+    return _fetch_bulk(int(time.time() // BULK_TTL))
+
+_entity_cache: Dict[tuple, tuple] = {}
+
+def _get_entities(params: Dict[str, Any]) -> Any:
+    """
+    Fetch /entities for browse-style params, reusing recent responses
+    
+    Args:
+        params: Query params (no name filter)
+        
+    Returns:
+        Entity table payload, as records or orient='split'
+    """
+    # The unfiltered first page is exactly what the bulk payload carries
+    if 'type' not in params and not params.get('offset'):
+        return fetch_bulk()['entities']
+    
+    key = tuple(sorted(params.items()))
+    now = time.monotonic()
+    hit = _entity_cache.get(key)
+    if hit and now - hit[0] < ENTITIES_TTL:
+        return hit[1]
+    
+    response = _get(f"{API_BASE_URL}/entities", params=params)
+    response.raise_for_status()
+    entities = _json(response)
+    _entity_cache[key] = (now, entities)
+    return entities
+
 def get_stats() -> Dict[str, int]:
     """Get knowledge graph statistics"""
     try:
-        response = requests.get(f"{API_BASE_URL}/stats")
-        return response.json()
+        return fetch_bulk()['stats']
     except Exception as e:
         return {"error": str(e)}
 
-def search_entities(query: str = "", entity_type: str = "ALL") -> pd.DataFrame:
-    """Search for entities"""
+def search_entities(query: str = "", entity_type: str = "ALL", offset: int = 0) -> pd.DataFrame:
+    """Search for entities, one page of PAGE_SIZE rows starting at offset"""
     try:
-        params = {}
+        params = {'limit': PAGE_SIZE, 'offset': int(offset), 'format': 'split'}
         if query:
             params['name'] = query
         if entity_type != "ALL":
             params['type'] = entity_type
             
-        response = requests.get(f"{API_BASE_URL}/entities", params=params)
-        entities = response.json()
+        if query:
+            # Free-text searches are one-offs; always hit the API
+            response = _get(f"{API_BASE_URL}/entities", params=params)
+            entities = _json(response)
+        else:
+            entities = _get_entities(params)
         
-        if not entities:
+        if not entities or (isinstance(entities, dict) and not entities['data']):
             return pd.DataFrame(columns=['Name', 'Type', 'Confidence', 'ID'])
         
-        df = pd.DataFrame([
-            {
-                'Name': e['name'],
-                'Type': e['type'],
-                'Confidence': f"{e['confidence']:.2f}",
-                'ID': e['id']
-            }
-            for e in entities
-        ])
-        return df
+        df = _frame(entities, ['name', 'type', 'confidence', 'id'])
+        df['confidence'] = df['confidence'].map('{:.2f}'.format)
+        return df.rename(columns={'name': 'Name', 'type': 'Type', 'confidence': 'Confidence', 'id': 'ID'})
     except Exception as e:
         return pd.DataFrame({'Error': [str(e)]})
 
-def search_claims(min_confidence: float = 0.0) -> pd.DataFrame:
-    """Search for claims"""
+def search_claims(min_confidence: float = 0.0, offset: int = 0) -> pd.DataFrame:
+    """Search for claims, one page of PAGE_SIZE rows starting at offset"""
     try:
-        response = requests.get(
+        response = _get(
             f"{API_BASE_URL}/claims",
-            params={'min_confidence': min_confidence}
+            params={
+                'min_confidence': min_confidence,
+                'limit': PAGE_SIZE,
+                'offset': int(offset),
+                'format': 'split'
+            }
         )
-        claims = response.json()
+        claims = _json(response)
         
-        if not claims:
+        if not claims or not claims['data']:
             return pd.DataFrame(columns=['Claim', 'Confidence', 'ID'])
         
-        df = pd.DataFrame([
-            {
-                'Claim': c['text'][:100] + ('...' if len(c['text']) > 100 else ''),
-                'Confidence': f"{c['confidence']:.2f}",
-                'ID': c['id']
-            }
-            for c in claims
-        ])
-        return df
+        df = _frame(claims, ['text', 'confidence', 'id'])
+        text = df['text']
+        truncated = text.str.slice(0, 100)
+        df['text'] = truncated.where(text.str.len() <= 100, truncated + '...')
+        df['confidence'] = df['confidence'].map('{:.2f}'.format)
+        return df.rename(columns={'text': 'Claim', 'confidence': 'Confidence', 'id': 'ID'})
     except Exception as e:
         return pd.DataFrame({'Error': [str(e)]})
 
+def _append_page(shown: pd.DataFrame, page: pd.DataFrame, offset: int):
+    """
+    Append a fetched page to the rows already on screen
+    
+    Args:
+        shown: DataFrame currently displayed
+        page: Next page of results
+        offset: Offset the page was fetched from
+        
+    Returns:
+        Tuple of (combined DataFrame, offset of the following page)
+    """
+    if 'Error' in page.columns or page.empty:
+        return shown, offset
+    if shown is None or shown.empty or 'Error' in shown.columns:
+        return page, offset + PAGE_SIZE
+    return pd.concat([shown, page], ignore_index=True), offset + PAGE_SIZE
+
+def first_entities_page(query: str, entity_type: str):
+    """Run a fresh entity search and reset paging"""
+    return search_entities(query, entity_type), PAGE_SIZE
+
+def more_entities(query: str, entity_type: str, shown: pd.DataFrame, offset: int):
+    """Load the next page of entity search results"""
+    return _append_page(shown, search_entities(query, entity_type, offset), offset)
+
+def first_claims_page(min_confidence: float):
+    """Run a fresh claim search and reset paging"""
+    return search_claims(min_confidence), PAGE_SIZE
+
+def more_claims(min_confidence: float, shown: pd.DataFrame, offset: int):
+    """Load the next page of claim search results"""
+    return _append_page(shown, search_claims(min_confidence, offset), offset)
+
 def get_entity_claims(entity_id: str) -> str:
     """Get claims about a specific entity"""
     try:
-        response = requests.get(f"{API_BASE_URL}/entity/{entity_id}/claims")
-        data = response.json()
+        response = _get(f"{API_BASE_URL}/entity/{entity_id}/claims")
+        data = _json(response)
         
         if 'claims' not in data or not data['claims']:
             return "No claims found for this entity."
         
-        output = f"**Entity ID:** {data['entity_id']}\n\n"
-        output += f"**Total Claims:** {len(data['claims'])}\n\n"
-        
-        for i, claim in enumerate(data['claims'], 1):
-            output += f"{i}. **[Confidence: {claim['confidence']:.2f}]** {claim['text']}\n\n"
+        parts = [
+            f"**Entity ID:** {data['entity_id']}",
+            f"**Total Claims:** {len(data['claims'])}",
+        ]
+        parts.extend(
+            f"{i}. **[Confidence: {claim['confidence']:.2f}]** {claim['text']}"
+            for i, claim in enumerate(data['claims'], 1)
+        )
         
-        return output
+        return "\n\n".join(parts) + "\n\n"
     except Exception as e:
         return f"Error: {str(e)}"
 
-def get_entity_network(entity_name: str) -> go.Figure:
-    """Get entity network visualization"""
+# Network graph styling
+_COLOR_MAP = {
+    'central': '#FF4444',
+    'PERSON': '#4444FF',
+    'LOCATION': '#44FF44',
+    'ORGANIZATION': '#FF44FF',
+    'CONCEPT': '#FFAA44'
+}
+_DEFAULT_COLOR = '#888888'
+_CENTRAL_SIZE = 30
+_NEIGHBOR_SIZE = 15
+_EDGE_STYLE = dict(width=1, color='#888')
+_NODE_OUTLINE = dict(width=2, color='white')
+
+# Networks with at least this many nodes are drawn by sigma.js instead of Plotly
+SIGMA_NODE_THRESHOLD = 50
+
+# Standalone page for the sigma.js renderer. gr.HTML does not run inline
+# scripts, so the page is embedded through an iframe srcdoc.
+SIGMA_TEMPLATE = """<!DOCTYPE html>
+<html><head>
+<script src="https://cdnjs.cloudflare.com/ajax/libs/graphology/0.25.4/graphology.umd.min.js"></script>
+<script src="https://cdnjs.cloudflare.com/ajax/libs/sigma.js/2.4.0/sigma.min.js"></script>
+<style>html, body, #net { margin: 0; width: 100%; height: 100%; background: #141829; }</style>
+</head><body>
+<div id="net"></div>
+<script>
+const data = JSON.parse(__GRAPH__);
+const graph = new graphology.Graph();
+data.nodes.forEach(n => graph.addNode(n.key, n));
+data.edges.forEach(([s, t]) => graph.mergeEdge(s, t, { color: '#888' }));
+new Sigma(graph, document.getElementById('net'), { labelColor: { color: '#FFFFFF' } });
+</script>
+</body></html>"""
+
+_nx = None
+
+def _get_nx():
+    """Import networkx on first use; only the network tab needs it"""
+    global _nx
+    if _nx is None:
+        import networkx
+        _nx = networkx
+    return _nx
+
+def _star_layout(n: int):
+    """
+    Positions and edge segments for a star of n neighbors around the origin
+    
+    Args:
+        n: Number of neighbor nodes
+        
+    Returns:
+        Tuple of (neighbor x, neighbor y, edge x, edge y) arrays; edge arrays
+        hold (center, neighbor, NaN) triples, NaN breaking the line in Plotly
+    """
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    xs, ys = np.cos(angles), np.sin(angles)
+    
+    edge_x = np.zeros(3 * n)
+    edge_y = np.zeros(3 * n)
+    edge_x[1::3], edge_y[1::3] = xs, ys
+    edge_x[2::3] = edge_y[2::3] = np.nan
+    return xs, ys, edge_x, edge_y
+
+def render_sigma_html(nodes: List[Dict[str, Any]], edges: List[Tuple[str, str]]) -> str:
+    """
+    Render a network with the sigma.js WebGL renderer
+    
+    Args:
+        nodes: Node dicts with key, label, x, y, size and color
+        edges: (source key, target key) pairs
+        
+    Returns:
+        HTML snippet for a gr.HTML component
+    """
+    graph = orjson.dumps({'nodes': nodes, 'edges': edges}).decode()
+    # Double-encode so the payload is a JS string literal, and keep labels
+    # from closing the script tag
+    literal = orjson.dumps(graph).decode().replace("</", "<\\/")
+    page = SIGMA_TEMPLATE.replace("__GRAPH__", literal)
+    return (
+        f'<iframe srcdoc="{html.escape(page)}" '
+        'style="width:100%; height:600px; border:0;"></iframe>'
+    )
+
+def get_entity_network(entity_name: str) -> Union[go.Figure, str]:
+    """
+    Get entity network visualization
+    
+    Returns:
+        Plotly figure, or sigma.js HTML for networks of SIGMA_NODE_THRESHOLD
+        nodes or more
+    """
     try:
-        response = requests.get(f"{API_BASE_URL}/network/{entity_name}")
-        entities = response.json()
+        response = _get(f"{API_BASE_URL}/network/{entity_name}")
+        entities = _json(response)
         
         if not entities:
             fig = go.Figure()
@@ -496,9 +921,7 @@ def get_entity_network(entity_name: str) -> go.Figure:
             return fig
         
         # Build network graph
-        import networkx as nx
-        import numpy as np
-        
+        nx = _get_nx()
         G = nx.Graph()
         
         # Add central node
@@ -509,60 +932,64 @@ def get_entity_network(entity_name: str) -> go.Figure:
             G.add_node(entity['name'], node_type=entity['type'])
             G.add_edge(entity_name, entity['name'])
         
-        # Layout
-        pos = nx.spring_layout(G, k=2, iterations=50)
-        
-        # Create edges
-        edge_x = []
-        edge_y = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-        
-        edge_trace = go.Scatter(
+        # Layout: the network is a star around the central entity, so place
+        # neighbors evenly on a unit circle instead of running a force layout
+        neighbors = [n for n in G.nodes() if n != entity_name]
+        if all(entity_name in edge for edge in G.edges()):
+            xs, ys, edge_x, edge_y = _star_layout(len(neighbors))
+            pos = {entity_name: (0.0, 0.0)}
+            pos.update(zip(neighbors, zip(xs, ys)))
+        else:
+            pos = nx.spring_layout(G, k=2, iterations=50)
+            
+            # Create edges
+            edge_x = []
+            edge_y = []
+            for edge in G.edges():
+                x0, y0 = pos[edge[0]]
+                x1, y1 = pos[edge[1]]
+                edge_x.extend([x0, x1, None])
+                edge_y.extend([y0, y1, None])
+        
+        # WebGL traces stay interactive on dense neighborhoods where SVG bogs down
+        edge_trace = go.Scattergl(
             x=edge_x, y=edge_y,
-            line=dict(width=1, color='#888'),
+            line=_EDGE_STYLE,
             hoverinfo='none',
             mode='lines'
         )
         
         # Create nodes
-        node_x = []
-        node_y = []
-        node_text = []
-        node_color = []
-        node_size = []
-        
-        color_map = {
-            'central': '#FF4444',
-            'PERSON': '#4444FF',
-            'LOCATION': '#44FF44',
-            'ORGANIZATION': '#FF44FF',
-            'CONCEPT': '#FFAA44'
-        }
-        
-        for node in G.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(node)
-            
-            node_type = G.nodes[node].get('node_type', 'CONCEPT')
-            node_color.append(color_map.get(node_type, '#888888'))
-            node_size.append(30 if node_type == 'central' else 15)
+        node_text = list(G.nodes())
+        node_x = [pos[node][0] for node in node_text]
+        node_y = [pos[node][1] for node in node_text]
+        node_types = [G.nodes[node].get('node_type', 'CONCEPT') for node in node_text]
+        node_color = [_COLOR_MAP.get(t, _DEFAULT_COLOR) for t in node_types]
+        node_size = [_CENTRAL_SIZE if t == 'central' else _NEIGHBOR_SIZE for t in node_types]
+        
+        # Large neighborhoods go to a dedicated WebGL graph renderer
+        if len(node_text) >= SIGMA_NODE_THRESHOLD:
+            return render_sigma_html(
+                [
+                    {'key': n, 'label': n, 'x': float(x), 'y': float(y), 'size': size / 3, 'color': color}
+                    for n, x, y, size, color in zip(node_text, node_x, node_y, node_size, node_color)
+                ],
+                list(G.edges())
+            )
         
-        node_trace = go.Scatter(
+        # Per-node text labels are the expensive part to paint on big graphs
+        show_labels = len(node_text) <= LABEL_NODE_LIMIT
+        node_trace = go.Scattergl(
             x=node_x, y=node_y,
-            mode='markers+text',
-            text=node_text,
+            mode='markers+text' if show_labels else 'markers',
+            text=node_text if show_labels else None,
             textposition="top center",
+            hovertext=node_text,
             hoverinfo='text',
             marker=dict(
                 size=node_size,
                 color=node_color,
-                line=dict(width=2, color='white')
+                line=_NODE_OUTLINE
             )
         )
         
@@ -591,30 +1018,62 @@ def get_entity_network(entity_name: str) -> go.Figure:
         )
         return fig
 
+async def get_entity_network_async(entity_name: str):
+    """
+    Build the network view on a worker thread so the event loop stays free
+    
+    Returns:
+        Updates for the Plotly and sigma.js components, showing whichever
+        one was rendered
+    """
+    view = await asyncio.to_thread(get_entity_network, entity_name)
+    if isinstance(view, str):
+        return gr.update(visible=False), gr.update(value=view, visible=True)
+    return gr.update(value=view, visible=True), gr.update(visible=False)
+
 def get_sources() -> pd.DataFrame:
     """Get all sources with credibility"""
     try:
-        response = requests.get(f"{API_BASE_URL}/sources")
-        sources = response.json()
+        sources = fetch_bulk()['sources']
         
         if not sources:
             return pd.DataFrame(columns=['Domain', 'Credibility', 'URL'])
         
-        df = pd.DataFrame([
-            {
-                'Domain': s['domain'],
-                'Credibility': f"{s['credibility']:.2f}",
-                'URL': s.get('url', 'N/A')
-            }
-            for s in sources
-        ])
-        return df.sort_values('Credibility', ascending=False)
+        df = _frame(sources, ['domain', 'credibility', 'url'])
+        df = df.sort_values('credibility', ascending=False)
+        df['credibility'] = df['credibility'].map('{:.2f}'.format)
+        df['url'] = df['url'].fillna('N/A')
+        return df.rename(columns={'domain': 'Domain', 'credibility': 'Credibility', 'url': 'URL'})
     except Exception as e:
         return pd.DataFrame({'Error': [str(e)]})
 
-def create_stats_chart() -> go.Figure:
+# Built overview figures keyed on a hash of the data they plot, so refreshes
+# with unchanged data hand back the same figure instead of rebuilding it
+FIGURE_CACHE_SIZE = 16
+_fig_cache: "OrderedDict[tuple, go.Figure]" = OrderedDict()
+
+def _figure_key(kind: str, payload: Any) -> tuple:
+    """Cache key for a figure built from a JSON-serializable payload"""
+    return kind, hash(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS))
+
+def _cache_figure(key: tuple, fig: go.Figure) -> go.Figure:
+    """Store a figure, evicting the least recently used one when full"""
+    _fig_cache[key] = fig
+    if len(_fig_cache) > FIGURE_CACHE_SIZE:
+        _fig_cache.popitem(last=False)
+    return fig
+
+def _cached_figure(key: tuple) -> Optional[go.Figure]:
+    """Look up a previously built figure"""
+    fig = _fig_cache.get(key)
+    if fig is not None:
+        _fig_cache.move_to_end(key)
+    return fig
+
+def create_stats_chart(stats: Optional[Dict[str, Any]] = None) -> go.Figure:
     """Create statistics visualization"""
-    stats = get_stats()
+    if stats is None:
+        stats = get_stats()
     
     if 'error' in stats:
         fig = go.Figure()
@@ -631,6 +1090,11 @@ def create_stats_chart() -> go.Figure:
         )
         return fig
     
+    key = _figure_key('stats', stats)
+    cached = _cached_figure(key)
+    if cached is not None:
+        return cached
+    
     # Create modern gradient bars
     colors = ['#0066FF', '#00D4FF', '#FF6B00', '#00C853']
     
@@ -675,14 +1139,14 @@ def create_stats_chart() -> go.Figure:
         font=dict(family='Inter', color='#A0AEC0')
     )
     
-    return fig
+    return _cache_figure(key, fig)
 
-def create_entity_type_chart() -> go.Figure:
+def create_entity_type_chart(entities: Optional[List[Dict[str, Any]]] = None) -> go.Figure:
     """Create entity type distribution chart"""
     try:
         # Get all entities
-        response = requests.get(f"{API_BASE_URL}/entities")
-        entities = response.json()
+        if entities is None:
+            entities = fetch_bulk()['entities']
         
         if not entities:
             fig = go.Figure()
@@ -690,15 +1154,17 @@ def create_entity_type_chart() -> go.Figure:
             return fig
         
         # Count by type
-        type_counts = {}
-        for entity in entities:
-            entity_type = entity['type']
-            type_counts[entity_type] = type_counts.get(entity_type, 0) + 1
+        type_counts = Counter(entity['type'] for entity in entities)
+        key = _figure_key('entity_types', sorted(type_counts.items()))
+        cached = _cached_figure(key)
+        if cached is not None:
+            return cached
+        labels, values = zip(*type_counts.items())
         
         fig = go.Figure(data=[
             go.Pie(
-                labels=list(type_counts.keys()),
-                values=list(type_counts.values()),
+                labels=labels,
+                values=values,
                 hole=0.3
             )
         ])
@@ -708,7 +1174,7 @@ def create_entity_type_chart() -> go.Figure:
             height=400
         )
         
-        return fig
+        return _cache_figure(key, fig)
         
     except Exception as e:
         fig = go.Figure()
@@ -718,26 +1184,34 @@ def create_entity_type_chart() -> go.Figure:
 def get_top_entities(limit: int = 20) -> str:
     """Get top entities with most claims"""
     try:
-        response = requests.get(f"{API_BASE_URL}/entities")
-        entities = response.json()
+        entities = fetch_bulk()['entities']
         
         if not entities:
             return "No entities found."
         
         # Get claim counts (this is a simplified version - in production you'd query Neo4j)
         # For now, just show top entities
-        output = f"## Top {min(limit, len(entities))} Entities\n\n"
-        
-        for i, entity in enumerate(entities[:limit], 1):
-            output += f"{i}. **{entity['name']}** ({entity['type']}) - Confidence: {entity['confidence']:.2f}\n"
+        lines = [f"## Top {min(limit, len(entities))} Entities", ""]
+        lines.extend(
+            f"{i}. **{entity['name']}** ({entity['type']}) - Confidence: {entity['confidence']:.2f}"
+            for i, entity in enumerate(entities[:limit], 1)
+        )
         
-        return output
+        return "\n".join(lines) + "\n"
         
     except Exception as e:
         return f"Error: {str(e)}"
 
+def refresh_overview():
+    """Build both overview charts from one bulk fetch"""
+    try:
+        bulk = fetch_bulk()
+    except Exception as e:
+        return create_stats_chart({"error": str(e)}), create_entity_type_chart([])
+    return create_stats_chart(bulk['stats']), create_entity_type_chart(bulk['entities'])
+
 # Create Gradio Interface
-with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as dashboard:
+with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft(), css=CUSTOM_CSS) as dashboard:
     
     gr.Markdown(
         """
@@ -759,7 +1233,7 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
         
         stats_btn = gr.Button("🔄 Refresh Statistics", variant="primary")
         stats_btn.click(
-            fn=lambda: (create_stats_chart(), create_entity_type_chart()),
+            fn=refresh_overview,
             outputs=[stats_chart, entity_chart]
         )
         
@@ -782,11 +1256,18 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
         
         entity_search_btn = gr.Button("🔍 Search Entities", variant="primary")
         entity_results = gr.Dataframe(label="Search Results", wrap=True)
+        entity_offset = gr.State(0)
+        entity_more_btn = gr.Button("⬇️ Load More", variant="secondary")
         
         entity_search_btn.click(
-            fn=search_entities,
+            fn=first_entities_page,
             inputs=[entity_query, entity_type_filter],
-            outputs=entity_results
+            outputs=[entity_results, entity_offset]
+        )
+        entity_more_btn.click(
+            fn=more_entities,
+            inputs=[entity_query, entity_type_filter, entity_results, entity_offset],
+            outputs=[entity_results, entity_offset]
         )
         
         gr.Markdown("## Entity Claims")
@@ -814,11 +1295,18 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
         
         claims_search_btn = gr.Button("🔍 Search Claims", variant="primary")
         claims_results = gr.Dataframe(label="Claims", wrap=True)
+        claims_offset = gr.State(0)
+        claims_more_btn = gr.Button("⬇️ Load More", variant="secondary")
         
         claims_search_btn.click(
-            fn=search_claims,
+            fn=first_claims_page,
             inputs=confidence_slider,
-            outputs=claims_results
+            outputs=[claims_results, claims_offset]
+        )
+        claims_more_btn.click(
+            fn=more_claims,
+            inputs=[confidence_slider, claims_results, claims_offset],
+            outputs=[claims_results, claims_offset]
         )
         
         gr.Markdown("""
@@ -841,11 +1329,13 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
         
         network_btn = gr.Button("🌐 Generate Network", variant="primary")
         network_plot = gr.Plot(label="Entity Network")
+        network_html = gr.HTML(visible=False)
         
         network_btn.click(
-            fn=get_entity_network,
+            fn=get_entity_network_async,
             inputs=network_entity_input,
-            outputs=network_plot
+            outputs=[network_plot, network_html],
+            concurrency_limit=EVENT_CONCURRENCY
         )
         
         gr.Markdown("""
@@ -894,14 +1384,19 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_trends(period):
                 try:
-                    response = requests.get(f"{API_BASE_URL}/analytics/trends?time_period={period}")
+                    response = _get(trends_url(period))
                     if response.status_code == 200:
-                        return response.json()
+                        return _json(response)
                     return {"error": f"Failed to get trends: {response.status_code}"}
                 except Exception as e:
                     return {"error": str(e)}
             
-            trends_btn.click(fn=get_trends, inputs=trend_period, outputs=trends_output)
+            trends_btn.click(
+                fn=get_trends,
+                inputs=trend_period,
+                outputs=trends_output,
+                concurrency_limit=EVENT_CONCURRENCY
+            )
         
         # Anomaly Detection
         with gr.Accordion("⚠️ Anomaly Detection", open=False):
@@ -920,14 +1415,19 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_anomalies(hours):
                 try:
-                    response = requests.get(f"{API_BASE_URL}/analytics/anomalies?hours={int(hours)}")
+                    response = _get(anomalies_url(hours))
                     if response.status_code == 200:
-                        return response.json()
+                        return _json(response)
                     return {"error": f"Failed to get anomalies: {response.status_code}"}
                 except Exception as e:
                     return {"error": str(e)}
             
-            anomalies_btn.click(fn=get_anomalies, inputs=anomaly_hours, outputs=anomalies_output)
+            anomalies_btn.click(
+                fn=get_anomalies,
+                inputs=anomaly_hours,
+                outputs=anomalies_output,
+                concurrency_limit=EVENT_CONCURRENCY
+            )
         
         # Contradictions
         with gr.Accordion("🔴 Contradiction Detection", open=False):
@@ -951,12 +1451,9 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_contradictions(days, entity):
                 try:
-                    url = f"{API_BASE_URL}/analytics/contradictions?days={int(days)}"
-                    if entity:
-                        url += f"&entity_name={entity}"
-                    response = requests.get(url)
+                    response = _get(contradictions_url(days, entity))
                     if response.status_code == 200:
-                        return response.json()
+                        return _json(response)
                     return {"error": f"Failed to get contradictions: {response.status_code}"}
                 except Exception as e:
                     return {"error": str(e)}
@@ -964,7 +1461,8 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             contradictions_btn.click(
                 fn=get_contradictions,
                 inputs=[contradiction_days, contradiction_entity],
-                outputs=contradictions_output
+                outputs=contradictions_output,
+                concurrency_limit=EVENT_CONCURRENCY
             )
         
         # Source Credibility
@@ -989,22 +1487,38 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_credibility(days, source):
                 try:
-                    url = f"{API_BASE_URL}/analytics/credibility?days={int(days)}"
-                    if source:
-                        url += f"&source_name={source}"
-                    response = requests.get(url)
-                    if response.status_code == 200:
-                        return response.json()
-                    return {"error": f"Failed to get credibility: {response.status_code}"}
+                    return fetch_analytics(credibility_url(days, source), "credibility")
                 except Exception as e:
                     return {"error": str(e)}
             
             credibility_btn.click(
                 fn=get_credibility,
                 inputs=[credibility_days, credibility_source],
-                outputs=credibility_output
+                outputs=credibility_output,
+                concurrency_limit=EVENT_CONCURRENCY
             )
         
+        async def refresh_all_analytics(period, hours, days, entity, cred_days, source):
+            """Fetch trends, anomalies, contradictions and credibility concurrently"""
+            return tuple(await asyncio.gather(
+                fetch_analytics_async(trends_url(period), "trends", cached=False),
+                fetch_analytics_async(anomalies_url(hours), "anomalies", cached=False),
+                fetch_analytics_async(contradictions_url(days, entity), "contradictions", cached=False),
+                fetch_analytics_async(credibility_url(cred_days, source), "credibility"),
+            ))
+        
+        refresh_all_btn = gr.Button("🔄 Refresh All Analytics", variant="secondary")
+        refresh_all_btn.click(
+            fn=refresh_all_analytics,
+            inputs=[
+                trend_period, anomaly_hours,
+                contradiction_days, contradiction_entity,
+                credibility_days, credibility_source
+            ],
+            outputs=[trends_output, anomalies_output, contradictions_output, credibility_output],
+            concurrency_limit=EVENT_CONCURRENCY
+        )
+        
         # Entity Timeline
         with gr.Accordion("⏱️ Entity Timeline", open=False):
             gr.Markdown("### Track Entity Evolution Over Time")
@@ -1027,19 +1541,18 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_timeline(entity, days):
                 try:
-                    response = requests.get(
-                        f"{API_BASE_URL}/analytics/entity-timeline/{entity}?days={int(days)}"
+                    return fetch_analytics(
+                        f"{API_BASE_URL}/analytics/entity-timeline/{entity}?days={int(days)}",
+                        "timeline"
                     )
-                    if response.status_code == 200:
-                        return response.json()
-                    return {"error": f"Failed to get timeline: {response.status_code}"}
                 except Exception as e:
                     return {"error": str(e)}
             
             timeline_btn.click(
                 fn=get_timeline,
                 inputs=[timeline_entity, timeline_days],
-                outputs=timeline_output
+                outputs=timeline_output,
+                concurrency_limit=EVENT_CONCURRENCY
             )
         
         # Temporal Stats
@@ -1057,14 +1570,24 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
             
             def get_temporal_stats(period):
                 try:
-                    response = requests.get(f"{API_BASE_URL}/analytics/temporal-stats?time_period={period}")
-                    if response.status_code == 200:
-                        return response.json()
-                    return {"error": f"Failed to get stats: {response.status_code}"}
+                    return fetch_analytics(
+                        f"{API_BASE_URL}/analytics/temporal-stats?time_period={period}",
+                        "stats"
+                    )
                 except Exception as e:
                     return {"error": str(e)}
             
-            stats_btn.click(fn=get_temporal_stats, inputs=stats_period, outputs=stats_output)
+            stats_btn.click(
+                fn=get_temporal_stats,
+                inputs=stats_period,
+                outputs=stats_output,
+                concurrency_limit=EVENT_CONCURRENCY
+            )
+        
+        # Credibility, timeline and temporal stats are cached for ANALYTICS_TTL
+        clear_cache_btn = gr.Button("♻️ Clear Cached Analytics", variant="secondary")
+        clear_cache_status = gr.Markdown()
+        clear_cache_btn.click(fn=clear_analytics_cache, outputs=clear_cache_status)
         
         gr.Markdown("""
         ---
@@ -1113,6 +1636,7 @@ with gr.Blocks(title="OSINT Intelligence Dashboard", theme=gr.themes.Soft()) as
         - `GET /entity/{id}/claims` - Entity claims
         - `GET /network/{name}` - Entity network
         - `GET /sources` - News sources
+        - `GET /dashboard/bulk` - Stats, entities and sources in one call
         
         **Phase 4B Analytics Endpoints:**
         - `GET /analytics/trends` - Temporal trends
@@ -1132,10 +1656,12 @@ if __name__ == "__main__":
     print("🚀 Starting OSINT Intelligence Dashboard...")
     print(f"📡 API URL: {API_BASE_URL}")
     
-    # Launch dashboard
-    dashboard.launch(
+    # Launch dashboard; the queue lets independent callbacks run side by side
+    # instead of holding a request open per click
+    dashboard.queue(default_concurrency_limit=8, max_size=64).launch(
         server_name="0.0.0.0",
         server_port=7860,
+        max_threads=40,
         share=False,
         show_error=True
     )
@@ -3,8 +3,20 @@ Neo4j Graph Database Interactions
 Client, Schema, Queries
 """
 
-from .neo4j_client import Neo4jClient
+import importlib
 
-__all__ = [
-    "Neo4jClient",
-]
+# Exports resolve on first access, so importing a light submodule such as
+# graph.epoch or graph._driver doesn't load the whole client module too
+_EXPORTS = {
+    "Neo4jClient": ".neo4j_client",
+    "AsyncNeo4jClient": ".neo4j_client",
+    "get_driver": "._driver",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,60 @@
+"""
+Shared Neo4j Driver
+One pooled Bolt driver per process, reused by every client and CLI tool
+"""
+
+from neo4j import Driver, GraphDatabase
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from loguru import logger
+import atexit
+import os
+
+
+def pool_config(max_connection_pool_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Driver connection-pool options shared by the sync and async clients
+
+    Args:
+        max_connection_pool_size: Pool size override (defaults to NEO4J_MAX_CONNECTIONS or 50)
+
+    Returns:
+        Keyword arguments for GraphDatabase.driver / AsyncGraphDatabase.driver
+    """
+    return {
+        "max_connection_pool_size": max_connection_pool_size or int(os.getenv("NEO4J_MAX_CONNECTIONS", "50")),
+        "connection_acquisition_timeout": 60,
+        "max_connection_lifetime": 30 * 60,
+        "keep_alive": True,
+        # execute_query retries ServiceUnavailable for this long (driver
+        # default 30s); keep it short so a down database fails fast
+        "max_transaction_retry_time": float(os.getenv("NEO4J_MAX_RETRY_TIME", "5")),
+    }
+
+
+def connection_settings() -> Tuple[str, str, str]:
+    """
+    Connection settings from the environment
+
+    Returns:
+        (uri, username, password)
+    """
+    uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+    username = os.getenv("NEO4J_USERNAME", "neo4j")
+    password = os.getenv("NEO4J_PASSWORD") or "osint_password_2026"
+    return uri, username, password
+
+
+@lru_cache(maxsize=1)
+def get_driver() -> Driver:
+    """
+    Process-wide Neo4j driver, created on first use and closed at exit
+
+    Returns:
+        Shared driver; callers must not close it
+    """
+    uri, username, password = connection_settings()
+    driver = GraphDatabase.driver(uri, auth=(username, password), **pool_config())
+    atexit.register(driver.close)
+    logger.debug(f"Created shared Neo4j driver: {uri}")
+    return driver
@@ -0,0 +1,44 @@
+"""
+Graph Epoch
+Monotonic version counter for the knowledge graph, kept in Redis
+"""
+
+from typing import Optional
+from loguru import logger
+import os
+
+import redis
+from redis.exceptions import RedisError
+
+# Bumped after every ingest batch; caches that include it in their keys are
+# invalidated implicitly whenever the graph changes
+GRAPH_EPOCH_KEY = "graph:epoch"
+
+
+class GraphEpoch:
+    """Reads and bumps the shared graph epoch"""
+    
+    def __init__(self, host: Optional[str] = None, port: Optional[int] = None):
+        """Initialize epoch counter"""
+        self.redis = redis.Redis(
+            host=host or os.getenv("REDIS_HOST", "localhost"),
+            port=port or int(os.getenv("REDIS_PORT", "6379")),
+            socket_timeout=2
+        )
+        
+    def bump(self) -> Optional[int]:
+        """
+        Advance the epoch after a graph write
+        
+        Returns:
+            New epoch, or None if Redis is unavailable
+        """
+        try:
+            return self.redis.incr(GRAPH_EPOCH_KEY)
+        except RedisError as e:
+            logger.warning(f"Failed to bump graph epoch: {e}")
+            return None
+        
+    def close(self):
+        """Close connection"""
+        self.redis.close()
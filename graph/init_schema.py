@@ -4,11 +4,76 @@ Executes schema.cypher and sets up initial graph structure
 """
 
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator
 from loguru import logger
 import os
+import re
 from pathlib import Path
 
 
+# Schema commands touch no data, so they can be applied concurrently
+DDL_PATTERN = re.compile(r"^(CREATE|DROP)\s+(\w+\s+)?(INDEX|CONSTRAINT)\b", re.IGNORECASE)
+
+# Error codes meaning an IF NOT EXISTS rule is already in place
+ALREADY_EXISTS_CODES = {
+    "Neo.ClientError.Schema.EquivalentSchemaRuleAlreadyExists",
+    "Neo.ClientError.Schema.IndexAlreadyExists",
+    "Neo.ClientError.Schema.ConstraintAlreadyExists",
+}
+
+SCHEMA_WORKERS = 4
+
+
+def iter_statements(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Split Cypher source into statements
+    
+    Semicolons and // comments inside quoted strings or backticked names
+    are kept as text; statements may span lines.
+    
+    Args:
+        lines: Source lines (e.g. an open file)
+        
+    Yields:
+        Statements without the trailing semicolon
+    """
+    buffer = []
+    quote = None
+    for line in lines:
+        # Line endings are re-added below, once per source line
+        line = line.rstrip("\r\n")
+        i = 0
+        while i < len(line):
+            ch = line[i]
+            if quote:
+                buffer.append(ch)
+                if ch == "\\" and i + 1 < len(line):
+                    buffer.append(line[i + 1])
+                    i += 1
+                elif ch == quote:
+                    quote = None
+            elif ch in "'\"`":
+                quote = ch
+                buffer.append(ch)
+            elif line.startswith("//", i):
+                break
+            elif ch == ";":
+                statement = "".join(buffer).strip()
+                if statement:
+                    yield statement
+                buffer = []
+            else:
+                buffer.append(ch)
+            i += 1
+        buffer.append("\n")
+    
+    statement = "".join(buffer).strip()
+    if statement:
+        yield statement
+
+
 class SchemaInitializer:
     """Initialize Neo4j graph database schema"""
     
@@ -20,38 +85,46 @@ class SchemaInitializer:
         """Close database connection"""
         self.driver.close()
         
+    def _run_statement(self, statement: str) -> None:
+        """
+        Run one statement in its own managed write transaction
+        
+        Raises:
+            ClientError: On syntax errors, which mean the schema file is broken
+        """
+        try:
+            with self.driver.session() as session:
+                session.execute_write(lambda tx: tx.run(statement).consume())
+            logger.debug(f"Executed: {statement[:100]}...")
+        except ClientError as e:
+            if e.code in ALREADY_EXISTS_CODES:
+                logger.debug(f"Already exists: {statement[:100]}...")
+            elif e.code == "Neo.ClientError.Statement.SyntaxError":
+                raise
+            else:
+                logger.error(f"Statement failed: {statement[:100]}... ({e.code}: {e.message})")
+    
     def execute_cypher_file(self, file_path: Path) -> None:
-        """Execute a Cypher file line by line"""
+        """
+        Execute a Cypher file
+        
+        Schema commands run concurrently on a small thread pool; data
+        statements follow in file order once every index and constraint exists.
+        """
         with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            
-        # Split by semicolon and filter out comments
-        statements = []
-        current_statement = []
+            statements = list(iter_statements(file))
         
-        for line in content.split('\n'):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('//'):
-                continue
-                
-            current_statement.append(line)
-            
-            # Execute when we hit a semicolon
-            if line.endswith(';'):
-                statement = ' '.join(current_statement)
-                statements.append(statement)
-                current_statement = []
+        ddl = [s for s in statements if DDL_PATTERN.match(s)]
+        data = [s for s in statements if not DDL_PATTERN.match(s)]
         
-        # Execute each statement
-        with self.driver.session() as session:
-            for statement in statements:
-                try:
-                    session.run(statement)
-                    logger.debug(f"Executed: {statement[:100]}...")
-                except Exception as e:
-                    logger.warning(f"Statement failed (may already exist): {str(e)[:100]}")
+        with ThreadPoolExecutor(max_workers=SCHEMA_WORKERS) as executor:
+            # list() surfaces the first syntax error
+            list(executor.map(self._run_statement, ddl))
+        
+        for statement in data:
+            self._run_statement(statement)
+        
+        logger.info(f"Executed {len(ddl)} schema and {len(data)} data statements")
                     
     def initialize_schema(self) -> None:
         """Initialize the complete schema"""
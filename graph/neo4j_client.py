@@ -3,10 +3,198 @@ Neo4j Client
 Database operations for graph management
 """
 
-from neo4j import GraphDatabase
-from typing import List, Dict, Any, Optional
+from neo4j import AsyncGraphDatabase, Driver, GraphDatabase, READ_ACCESS, RoutingControl
+from neo4j.exceptions import ClientError
+from typing import List, Dict, Any, Optional, Iterator
 from loguru import logger
-import os
+from graph._driver import connection_settings, get_driver, pool_config
+import asyncio
+
+
+# Each label count is its own subquery, so the planner answers it from the
+# counts store (NodeCountFromCountStore) instead of scanning nodes
+_STATS_QUERY = """
+CALL { MATCH (e:Entity) RETURN count(e) as entities }
+CALL { MATCH (c:Claim) RETURN count(c) as claims }
+CALL { MATCH (s:Source) RETURN count(s) as sources }
+CALL { MATCH (ev:Event) RETURN count(ev) as events }
+RETURN entities, claims, sources, events
+"""
+
+SIMILAR_CLAIMS_QUERY = """
+CALL db.index.fulltext.queryNodes('claim_search_idx', $search) YIELD node AS c, score
+RETURN c.id as id, c.text as text, c.confidence_score as confidence,
+       c.timestamp as timestamp, score
+LIMIT $limit
+"""
+
+NEAREST_CLAIMS_QUERY = """
+CALL db.index.vector.queryNodes('claim_embedding_idx', $limit, $embedding) YIELD node AS c, score
+WHERE score >= $min_score
+RETURN c.id as id, c.text as text, c.confidence_score as confidence,
+       c.timestamp as timestamp, score
+"""
+
+CONTRADICTORY_CLAIMS_QUERY = """
+MATCH (c1:Claim {id: $claim_id})-[r:CONTRADICTS]-(c2:Claim)
+RETURN c2.id as id, c2.text as text, r.confidence as confidence
+"""
+
+ENTITIES_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (e:Entity {id: row.id})
+ON CREATE SET e.first_seen = datetime()
+SET e.name = row.name,
+    e.name_lower = toLower(row.name),
+    e.type = row.type,
+    e.confidence = row.confidence,
+    e.last_updated = datetime()
+"""
+
+CLAIMS_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (c:Claim {id: row.id})
+SET c.text = row.text,
+    c.text_lower = toLower(row.text),
+    c.context = row.context,
+    c.confidence_score = row.confidence,
+    c.embedding = coalesce(row.embedding, c.embedding),
+    c.timestamp = datetime(),
+    c.verification_status = 'UNVERIFIED'
+"""
+
+CLAIM_ENTITY_LINKS_QUERY = """
+UNWIND $rows AS row
+MATCH (c:Claim {id: row.claim_id})
+MATCH (e:Entity {id: row.entity_id})
+MERGE (c)-[:ABOUT]->(e)
+"""
+
+CONTRADICTION_LINKS_QUERY = """
+UNWIND $rows AS row
+MATCH (c1:Claim {id: row.claim1_id})
+MATCH (c2:Claim {id: row.claim2_id})
+MERGE (c1)-[r:CONTRADICTS]-(c2)
+SET r.confidence = row.confidence,
+    r.detected_at = datetime()
+"""
+
+SOURCES_BULK_QUERY = """
+UNWIND $rows AS row
+MERGE (s:Source {url: row.url})
+SET s.domain = row.domain,
+    s.type = row.type,
+    s.credibility_score = row.credibility,
+    s.title = row.title
+"""
+
+
+# Everything one article contributes, as a single statement: one round trip,
+# one plan, one transaction. Unit subqueries keep an empty list in one block
+# from cutting off the blocks after it. Same writes as the *_BULK_QUERY and
+# *_LINKS_QUERY statements above; keep them in sync.
+ARTICLE_WRITE_QUERY = """
+CALL {
+UNWIND $sources AS row
+MERGE (s:Source {url: row.url})
+SET s.domain = row.domain,
+    s.type = row.type,
+    s.credibility_score = row.credibility,
+    s.title = row.title
+}
+CALL {
+UNWIND $entities AS row
+MERGE (e:Entity {id: row.id})
+ON CREATE SET e.first_seen = datetime()
+SET e.name = row.name,
+    e.name_lower = toLower(row.name),
+    e.type = row.type,
+    e.confidence = row.confidence,
+    e.last_updated = datetime()
+}
+CALL {
+UNWIND $claims AS row
+MERGE (c:Claim {id: row.id})
+SET c.text = row.text,
+    c.text_lower = toLower(row.text),
+    c.context = row.context,
+    c.confidence_score = row.confidence,
+    c.embedding = coalesce(row.embedding, c.embedding),
+    c.timestamp = datetime(),
+    c.verification_status = 'UNVERIFIED'
+}
+CALL {
+UNWIND $entity_links AS row
+MATCH (c:Claim {id: row.claim_id})
+MATCH (e:Entity {id: row.entity_id})
+MERGE (c)-[:ABOUT]->(e)
+}
+CALL {
+UNWIND $contradiction_links AS row
+MATCH (c1:Claim {id: row.claim1_id})
+MATCH (c2:Claim {id: row.claim2_id})
+MERGE (c1)-[r:CONTRADICTS]-(c2)
+SET r.confidence = row.confidence,
+    r.detected_at = datetime()
+}
+"""
+
+# Hot read/write statements with sample parameters of the right types.
+# EXPLAINing them once per process seeds Neo4j's plan cache, so the first
+# real ingest or lookup doesn't pay for query planning.
+HOT_QUERIES = [
+    (SIMILAR_CLAIMS_QUERY, {'search': 'warmup', 'limit': 1}),
+    (CONTRADICTORY_CLAIMS_QUERY, {'claim_id': ''}),
+    (ENTITIES_BULK_QUERY, {'rows': [{'id': '', 'name': '', 'type': '', 'confidence': 0.0}]}),
+    (CLAIMS_BULK_QUERY, {'rows': [{'id': '', 'text': '', 'context': '', 'confidence': 0.0, 'embedding': None}]}),
+    (CLAIM_ENTITY_LINKS_QUERY, {'rows': [{'claim_id': '', 'entity_id': ''}]}),
+    (CONTRADICTION_LINKS_QUERY, {'rows': [{'claim1_id': '', 'claim2_id': '', 'confidence': 0.0}]}),
+    (ARTICLE_WRITE_QUERY, {
+        'sources': [{'url': '', 'domain': '', 'type': '', 'credibility': 0.0, 'title': ''}],
+        'entities': [{'id': '', 'name': '', 'type': '', 'confidence': 0.0}],
+        'claims': [{'id': '', 'text': '', 'context': '', 'confidence': 0.0, 'embedding': None}],
+        'entity_links': [{'claim_id': '', 'entity_id': ''}],
+        'contradiction_links': [{'claim1_id': '', 'claim2_id': '', 'confidence': 0.0}],
+    }),
+    (_STATS_QUERY, {}),
+]
+
+# Server URIs whose plan cache this process has already warmed
+_warmed_uris = set()
+
+# Indexes backing the API search and analytics endpoints; all idempotent so
+# they can run on every startup. Kept in sync with graph/schema.cypher.
+SEARCH_INDEXES = [
+    "CREATE TEXT INDEX claim_text_lower_text IF NOT EXISTS FOR (c:Claim) ON (c.text_lower)",
+    "CREATE TEXT INDEX entity_name_lower_text IF NOT EXISTS FOR (e:Entity) ON (e.name_lower)",
+    "CREATE FULLTEXT INDEX entity_search_idx IF NOT EXISTS FOR (e:Entity) ON EACH [e.name, e.description]",
+    "CREATE FULLTEXT INDEX claim_search_idx IF NOT EXISTS FOR (c:Claim) ON EACH [c.text, c.context]",
+    "CREATE INDEX entity_confidence_idx IF NOT EXISTS FOR (e:Entity) ON (e.confidence)",
+    "CREATE INDEX entity_type_confidence_idx IF NOT EXISTS FOR (e:Entity) ON (e.type, e.confidence)",
+    "CREATE INDEX claim_confidence_idx IF NOT EXISTS FOR (c:Claim) ON (c.confidence_score)",
+    "CREATE INDEX claim_timestamp_idx IF NOT EXISTS FOR (c:Claim) ON (c.timestamp)",
+    "CREATE INDEX source_domain_idx IF NOT EXISTS FOR (s:Source) ON (s.domain)",
+    "CREATE INDEX source_credibility_idx IF NOT EXISTS FOR (s:Source) ON (s.credibility_score)",
+]
+
+_LUCENE_SPECIAL_CHARS = set('+-&|!(){}[]^"~*?:\\/')
+
+# Terms of a claim used to look up similar claims in claim_search_idx
+MAX_SIMILARITY_TERMS = 12
+
+# Vector neighbours below this score aren't treated as similar. Neo4j maps
+# cosine to (1 + cos) / 2, so 0.8 means cos >= 0.6.
+MIN_VECTOR_SIMILARITY = 0.8
+
+
+def escape_fulltext(text: str) -> str:
+    """
+    Escape Lucene query syntax so user input is matched literally by a fulltext index
+    
+    Text is lowercased as well: Lucene only treats upper-case AND/OR/NOT as
+    operators, and the indexes' default analyzer lowercases terms anyway.
+    """
+    return "".join("\\" + ch if ch in _LUCENE_SPECIAL_CHARS else ch for ch in text.lower())
 
 
 class Neo4jClient:
@@ -17,26 +205,84 @@ class Neo4jClient:
         uri: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        max_connection_pool_size: Optional[int] = None,
+        driver: Optional[Driver] = None,
     ):
-        """Initialize Neo4j client"""
-        self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        self.username = username or os.getenv("NEO4J_USERNAME", "neo4j")
-        self.password = password or os.getenv("NEO4J_PASSWORD", "osint_password_2026")
+        """
+        Initialize Neo4j client
         
-        if not self.password:
-            logger.warning("Neo4j password not set, using default")
-            self.password = "osint_password_2026"
+        Args:
+            uri: Bolt URI (or use NEO4J_URI env var)
+            username: Username (or use NEO4J_USERNAME env var)
+            password: Password (or use NEO4J_PASSWORD env var)
+            max_connection_pool_size: Pool size for a dedicated driver
+            driver: Driver to reuse; defaults to the shared get_driver() one
+                unless explicit connection settings are given
+        """
+        env_uri, env_username, env_password = connection_settings()
+        self.uri = uri or env_uri
+        self.username = username or env_username
+        self.password = password or env_password
         
-        self.driver = GraphDatabase.driver(
-            self.uri,
-            auth=(self.username, self.password)
-        )
+        # Only a driver this client created is closed by close()
+        dedicated = any([uri, username, password, max_connection_pool_size])
+        self._owns_driver = driver is None and dedicated
+        
+        if driver is not None:
+            self.driver = driver
+        elif dedicated:
+            self.driver = GraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                **pool_config(max_connection_pool_size)
+            )
+        else:
+            self.driver = get_driver()
         
         logger.info(f"Neo4j client connected: {self.uri}")
         
+        if self.uri not in _warmed_uris:
+            self._prepare()
+        
+    def _prepare(self) -> None:
+        """EXPLAIN the hot queries once so their plans are cached server-side"""
+        try:
+            with self.driver.session() as session:
+                for query, params in HOT_QUERIES:
+                    session.run("EXPLAIN " + query, params).consume()
+            _warmed_uris.add(self.uri)
+            logger.debug(f"Warmed {len(HOT_QUERIES)} query plans")
+        except Exception as e:
+            logger.warning(f"Query plan warm-up failed: {e}")
+        
     def close(self):
-        """Close connection"""
-        self.driver.close()
+        """Close connection (a shared driver stays open until exit)"""
+        if self._owns_driver:
+            self.driver.close()
+    
+    def _run(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        routing: RoutingControl = RoutingControl.WRITE
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a query through driver.execute_query
+        
+        The driver manages the session and a retried transaction itself, so
+        no Session object is built per call; READ routing sends the query to
+        followers/read replicas in a cluster.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            routing: RoutingControl.READ or RoutingControl.WRITE
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        records, _, _ = self.driver.execute_query(query, parameters_=parameters or {}, routing_=routing)
+        return [record.data() for record in records]
     
     def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -49,40 +295,87 @@ class Neo4jClient:
         Returns:
             List of result records as dictionaries
         """
+        return self._run(query, parameters)
+    
+    def ensure_indexes(self) -> None:
+        """Create the search indexes if they do not exist yet"""
         with self.driver.session() as session:
-            result = session.run(query, parameters or {})
-            return [dict(record) for record in result]
+            for statement in SEARCH_INDEXES:
+                session.run(statement)
+    
+    def execute_read(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only Cypher query in a managed read transaction
+        
+        Reads are routed to followers/read replicas in a cluster and
+        retried automatically on transient errors.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        return self._run(query, parameters, RoutingControl.READ)
+    
+    def stream_read(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over the records of a read-only Cypher query
+        
+        Records are pulled from the server as the caller consumes them,
+        so large results are never materialized in full. The session stays
+        open until the iterator is exhausted or closed.
+        
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Yields:
+            Result records as dictionaries
+        """
+        with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            for record in session.run(query, parameters or {}):
+                yield record.data()
         
     def find_similar_claims(
         self,
         claim_text: str,
-        limit: int = 10
+        limit: int = 10,
+        embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """
         Find similar existing claims
         
+        Uses the claim_embedding_idx vector index when an embedding is given,
+        and fulltext term matching otherwise or if the index is missing.
+        
         Args:
             claim_text: Claim to search for
             limit: Max results
+            embedding: Claim vector from models.embeddings
             
         Returns:
             List of similar claims
         """
-        query = """
-        MATCH (c:Claim)
-        WHERE c.text CONTAINS $keyword
-        RETURN c.id as id, c.text as text, c.confidence_score as confidence, 
-               c.timestamp as timestamp
-        LIMIT $limit
-        """
+        if embedding is not None:
+            try:
+                return self._run(
+                    NEAREST_CLAIMS_QUERY,
+                    {'embedding': embedding, 'limit': limit, 'min_score': MIN_VECTOR_SIMILARITY},
+                    RoutingControl.READ
+                )
+            except ClientError as e:
+                logger.debug(f"Vector search unavailable, using fulltext: {e.code}")
         
-        # Extract keywords (simple approach)
-        keywords = claim_text.split()[:3]  # First 3 words
-        keyword = " ".join(keywords)
+        # OR the claim's words together; Lucene ranks claims sharing the most
+        # (and rarest) terms first
+        terms = [escape_fulltext(word) for word in claim_text.split() if len(word) > 2]
+        if not terms:
+            return []
+        search = " OR ".join(terms[:MAX_SIMILARITY_TERMS])
         
-        with self.driver.session() as session:
-            result = session.run(query, keyword=keyword, limit=limit)
-            return [dict(record) for record in result]
+        return self._run(SIMILAR_CLAIMS_QUERY, {'search': search, 'limit': limit}, RoutingControl.READ)
             
     def find_contradictory_claims(
         self,
@@ -97,14 +390,7 @@ class Neo4jClient:
         Returns:
             List of contradictory claims
         """
-        query = """
-        MATCH (c1:Claim {id: $claim_id})-[r:CONTRADICTS]-(c2:Claim)
-        RETURN c2.id as id, c2.text as text, r.confidence as confidence
-        """
-        
-        with self.driver.session() as session:
-            result = session.run(query, claim_id=claim_id)
-            return [dict(record) for record in result]
+        return self._run(CONTRADICTORY_CLAIMS_QUERY, {'claim_id': claim_id}, RoutingControl.READ)
             
     def create_entity(self, entity: Dict[str, Any]) -> None:
         """
@@ -115,21 +401,16 @@ class Neo4jClient:
         """
         query = """
         MERGE (e:Entity {id: $id})
+        ON CREATE SET e.first_seen = datetime()
         SET e.name = $name,
+            e.name_lower = toLower($name),
             e.type = $type,
             e.confidence = $confidence,
             e.last_updated = datetime()
         RETURN e.id as id
         """
         
-        with self.driver.session() as session:
-            session.run(
-                query,
-                id=entity['id'],
-                name=entity['name'],
-                type=entity['type'],
-                confidence=entity.get('confidence', 0.8)
-            )
+        self._run(query, self._entity_row(entity))
             
     def create_claim(self, claim: Dict[str, Any]) -> None:
         """
@@ -141,6 +422,7 @@ class Neo4jClient:
         query = """
         MERGE (c:Claim {id: $id})
         SET c.text = $text,
+            c.text_lower = toLower($text),
             c.context = $context,
             c.confidence_score = $confidence,
             c.timestamp = datetime(),
@@ -148,14 +430,7 @@ class Neo4jClient:
         RETURN c.id as id
         """
         
-        with self.driver.session() as session:
-            session.run(
-                query,
-                id=claim['id'],
-                text=claim['text'],
-                context=claim.get('context', ''),
-                confidence=claim.get('confidence', 0.7)
-            )
+        self._run(query, self._claim_row(claim))
             
     def create_source(self, source: Dict[str, Any]) -> None:
         """
@@ -173,15 +448,7 @@ class Neo4jClient:
         RETURN s.url as url
         """
         
-        with self.driver.session() as session:
-            session.run(
-                query,
-                url=source.get('url', ''),
-                domain=source.get('source_name', ''),
-                type=source.get('source_type', 'unknown'),
-                credibility=source.get('credibility_score', 0.5),
-                title=source.get('title', '')
-            )
+        self._run(query, self._source_row(source))
             
     def link_claim_to_entity(self, claim_id: str, entity_id: str) -> None:
         """Link claim to entity"""
@@ -191,8 +458,7 @@ class Neo4jClient:
         MERGE (c)-[:ABOUT]->(e)
         """
         
-        with self.driver.session() as session:
-            session.run(query, claim_id=claim_id, entity_id=entity_id)
+        self._run(query, {'claim_id': claim_id, 'entity_id': entity_id})
             
     def link_claim_contradiction(
         self,
@@ -209,31 +475,210 @@ class Neo4jClient:
             r.detected_at = datetime()
         """
         
-        with self.driver.session() as session:
-            session.run(
-                query,
-                claim1_id=claim1_id,
-                claim2_id=claim2_id,
-                confidence=confidence
-            )
+        self._run(query, {
+            'claim1_id': claim1_id,
+            'claim2_id': claim2_id,
+            'confidence': confidence
+        })
+            
+    # ==================== Bulk Writes ====================
+    # One UNWIND statement per batch: a single round trip and a single cached
+    # plan instead of one MERGE per row.
+    
+    def _write_rows(self, query: str, rows: List[Dict[str, Any]]) -> None:
+        """Run an UNWIND $rows write in a managed write transaction"""
+        if not rows:
+            return
+        
+        self._run(query, {'rows': rows})
+    
+    @staticmethod
+    def _source_row(source: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'url': source.get('url', ''),
+            'domain': source.get('source_name', ''),
+            'type': source.get('source_type', 'unknown'),
+            'credibility': source.get('credibility_score', 0.5),
+            'title': source.get('title', '')
+        }
+    
+    @staticmethod
+    def _entity_row(entity: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': entity['id'],
+            'name': entity['name'],
+            'type': entity['type'],
+            'confidence': entity.get('confidence', 0.8)
+        }
+    
+    @staticmethod
+    def _claim_row(claim: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': claim['id'],
+            'text': claim['text'],
+            'context': claim.get('context', ''),
+            'confidence': claim.get('confidence', 0.7),
+            'embedding': claim.get('embedding')
+        }
+    
+    def write_article(
+        self,
+        source: Optional[Dict[str, Any]],
+        entities: List[Dict[str, Any]],
+        claims: List[Dict[str, Any]],
+        entity_links: List[Dict[str, str]],
+        contradiction_links: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Write an article's source, entities, claims and links in one transaction
+        
+        Args:
+            source: Source dict, or None
+            entities: Entity dicts
+            claims: Claim dicts
+            entity_links: Dicts with claim_id and entity_id
+            contradiction_links: Dicts with claim1_id, claim2_id and confidence
+        """
+        params = {
+            'sources': [self._source_row(source)] if source else [],
+            'entities': [self._entity_row(e) for e in entities],
+            'claims': [self._claim_row(c) for c in claims],
+            'entity_links': entity_links,
+            'contradiction_links': contradiction_links,
+        }
+        
+        self._run(ARTICLE_WRITE_QUERY, params)
+    
+    def create_entities_bulk(self, entities: List[Dict[str, Any]]) -> None:
+        """
+        Create or update many entity nodes
+        
+        Args:
+            entities: Entity dicts
+        """
+        self._write_rows(ENTITIES_BULK_QUERY, [self._entity_row(e) for e in entities])
+    
+    def create_claims_bulk(self, claims: List[Dict[str, Any]]) -> None:
+        """
+        Create many claim nodes
+        
+        Args:
+            claims: Claim dicts
+        """
+        self._write_rows(CLAIMS_BULK_QUERY, [self._claim_row(c) for c in claims])
+    
+    def link_claims_to_entities_bulk(self, links: List[Dict[str, str]]) -> None:
+        """
+        Link many claims to entities
+        
+        Args:
+            links: Dicts with claim_id and entity_id
+        """
+        self._write_rows(CLAIM_ENTITY_LINKS_QUERY, links)
+    
+    def link_claim_contradictions_bulk(self, links: List[Dict[str, Any]]) -> None:
+        """
+        Link many pairs of contradictory claims
+        
+        Args:
+            links: Dicts with claim1_id, claim2_id and confidence
+        """
+        self._write_rows(CONTRADICTION_LINKS_QUERY, links)
             
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics"""
-        query = """
-        OPTIONAL MATCH (e:Entity)
-        WITH count(e) as entities
-        OPTIONAL MATCH (c:Claim)
-        WITH entities, count(c) as claims
-        OPTIONAL MATCH (s:Source)
-        WITH entities, claims, count(s) as sources
-        OPTIONAL MATCH (ev:Event)
-        WITH entities, claims, sources, count(ev) as events
-        RETURN entities, claims, sources, events
+        records = self._run(_STATS_QUERY, routing=RoutingControl.READ)
+        return records[0] if records else {}
+
+
+class AsyncNeo4jClient:
+    """
+    Asyncio Neo4j client
+    
+    Used by the FastAPI endpoints so queries overlap on the event loop
+    instead of blocking it for the full Bolt round-trip.
+    """
+    
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_connection_pool_size: Optional[int] = None,
+    ):
+        """Initialize async Neo4j client"""
+        # Same settings as the sync client, so the two can't point at different servers
+        env_uri, env_username, env_password = connection_settings()
+        self.uri = uri or env_uri
+        self.username = username or env_username
+        self.password = password or env_password
+        
+        self.driver = AsyncGraphDatabase.driver(
+            self.uri,
+            auth=(self.username, self.password),
+            **pool_config(max_connection_pool_size)
+        )
+        
+        logger.info(f"Async Neo4j client connected: {self.uri}")
+    
+    async def close(self):
+        """Close connection"""
+        await self.driver.close()
+    
+    async def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
+        Execute a Cypher query and return results
         
-        with self.driver.session() as session:
-            result = session.run(query)
-            record = result.single()
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            
+        Returns:
+            List of result records as dictionaries
+        """
+        async with self.driver.session() as session:
+            result = await session.run(query, parameters or {})
+            return await result.data()
+    
+    async def warm_up(self, connections: int) -> None:
+        """
+        Pre-open pool connections by running a trivial query on each
+        
+        Args:
+            connections: Number of connections to open concurrently
+        """
+        async def _ping():
+            async with self.driver.session() as session:
+                result = await session.run("RETURN 1")
+                await result.consume()
+        
+        # A failed ping only means that connection opens lazily later, so
+        # it is logged rather than aborting startup
+        results = await asyncio.gather(*[_ping() for _ in range(connections)], return_exceptions=True)
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures:
+            logger.warning(f"{len(failures)}/{connections} Neo4j warm-up pings failed: {failures[0]}")
+        
+        logger.info(f"Warmed {connections - len(failures)} Neo4j connections")
+    
+    async def ensure_indexes(self) -> None:
+        """Create the search indexes if they do not exist yet"""
+        # Missing indexes only slow searches down, so an unreachable database
+        # or a user without schema privileges is logged rather than aborting
+        # startup; graph/schema.cypher (graph/init_schema.py) has them too
+        try:
+            async with self.driver.session() as session:
+                for statement in SEARCH_INDEXES:
+                    result = await session.run(statement)
+                    await result.consume()
+        except Exception as e:
+            logger.warning(f"Could not ensure Neo4j search indexes: {e}")
+    
+    async def get_stats(self) -> Dict[str, int]:
+        """Get database statistics"""
+        async with self.driver.session() as session:
+            result = await session.run(_STATS_QUERY)
+            record = await result.single()
             return dict(record) if record else {}
 
 
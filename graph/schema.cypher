@@ -39,6 +39,13 @@ CREATE INDEX entity_type_idx IF NOT EXISTS FOR (e:Entity) ON (e.type);
 CREATE INDEX entity_name_idx IF NOT EXISTS FOR (e:Entity) ON (e.name);
 CREATE INDEX entity_first_seen_idx IF NOT EXISTS FOR (e:Entity) ON (e.first_seen);
 
+// Case-insensitive CONTAINS search on entity names (name_lower = toLower(name))
+CREATE TEXT INDEX entity_name_lower_text IF NOT EXISTS FOR (e:Entity) ON (e.name_lower);
+
+// Ordered top-N by confidence (API entity search)
+CREATE INDEX entity_confidence_idx IF NOT EXISTS FOR (e:Entity) ON (e.confidence);
+CREATE INDEX entity_type_confidence_idx IF NOT EXISTS FOR (e:Entity) ON (e.type, e.confidence);
+
 // Event Indexes
 CREATE INDEX event_timestamp_idx IF NOT EXISTS FOR (ev:Event) ON (ev.timestamp);
 CREATE INDEX event_type_idx IF NOT EXISTS FOR (ev:Event) ON (ev.type);
@@ -48,6 +55,9 @@ CREATE INDEX claim_timestamp_idx IF NOT EXISTS FOR (c:Claim) ON (c.timestamp);
 CREATE INDEX claim_stance_idx IF NOT EXISTS FOR (c:Claim) ON (c.stance);
 CREATE INDEX claim_confidence_idx IF NOT EXISTS FOR (c:Claim) ON (c.confidence_score);
 
+// Case-insensitive CONTAINS search on claim text (text_lower = toLower(text))
+CREATE TEXT INDEX claim_text_lower_text IF NOT EXISTS FOR (c:Claim) ON (c.text_lower);
+
 // Source Indexes
 CREATE INDEX source_credibility_idx IF NOT EXISTS FOR (s:Source) ON (s.credibility_score);
 CREATE INDEX source_domain_idx IF NOT EXISTS FOR (s:Source) ON (s.domain);
@@ -63,6 +73,11 @@ FOR (c:Claim) ON EACH [c.text, c.context];
 CREATE FULLTEXT INDEX event_search_idx IF NOT EXISTS
 FOR (ev:Event) ON EACH [ev.description, ev.summary];
 
+// Vector Indexes (claim embeddings from models/embeddings.py)
+CREATE VECTOR INDEX claim_embedding_idx IF NOT EXISTS
+FOR (c:Claim) ON (c.embedding)
+OPTIONS {indexConfig: {`vector.dimensions`: 384, `vector.similarity_function`: 'cosine'}};
+
 // ============================================
 // 3. NODE LABELS & PROPERTIES
 // ============================================
@@ -73,6 +88,7 @@ FOR (ev:Event) ON EACH [ev.description, ev.summary];
 // (:Entity {
 //   id: "uuid-v4",
 //   name: "Entity Name",
+//   name_lower: "entity name",
 //   type: "PERSON|ORGANIZATION|LOCATION|CONCEPT|EVENT",
 //   description: "Optional description",
 //   aliases: ["alias1", "alias2"],
@@ -98,6 +114,7 @@ FOR (ev:Event) ON EACH [ev.description, ev.summary];
 // (:Claim {
 //   id: "uuid-v4",
 //   text: "The actual claim text",
+//   text_lower: "the actual claim text",
 //   context: "Surrounding context",
 //   stance: "SUPPORTS|REFUTES|NEUTRAL",
 //   confidence_score: 0.0-1.0,
@@ -184,6 +201,16 @@ SET s.credibility_score = 0.92,
     s.bias_score = -0.1,
     s.type = "NEWS";
 
+// Backfill lowercase search keys for claims written before text_lower existed
+MATCH (c:Claim)
+WHERE c.text_lower IS NULL AND c.text IS NOT NULL
+SET c.text_lower = toLower(c.text);
+
+// Backfill lowercase search keys for entities written before name_lower existed
+MATCH (e:Entity)
+WHERE e.name_lower IS NULL AND e.name IS NOT NULL
+SET e.name_lower = toLower(e.name);
+
 // Create system metadata node
 CREATE (sys:SystemMetadata {
   schema_version: "1.0.0",
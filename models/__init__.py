@@ -2,9 +2,24 @@
 ML Models: NLI, Embeddings, LLM Client
 """
 
-from .llm_client import GroqLLMClient, create_llm_client
+import importlib
 
-__all__ = [
-    "GroqLLMClient",
-    "create_llm_client",
-]
+# Exports resolve on first access, so the Groq SDK and httpx are only
+# imported by code that actually talks to the LLM
+_EXPORTS = {
+    "GroqLLMClient": ".llm_client",
+    "create_llm_client": ".llm_client",
+    "get_llm_client": ".llm_client",
+    "EmbeddingModel": ".embeddings",
+    "get_embedding_model": ".embeddings",
+    "SemanticCache": ".llm_cache",
+    "GroqBatchClient": ".llm_batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,80 @@
+"""
+Sentence Embeddings
+Claim vectors for the Neo4j vector index
+"""
+
+from functools import lru_cache
+from typing import List, Optional
+from loguru import logger
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    logger.warning("sentence-transformers not available - similar claims use fulltext search")
+
+
+# Must match `vector.dimensions` of claim_embedding_idx in graph/schema.cypher
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+EMBEDDING_DIMENSIONS = 384
+
+
+class EmbeddingModel:
+    """Sentence-transformer encoder for claim text"""
+
+    def __init__(self, model_name: str = EMBEDDING_MODEL, batch_size: int = 32):
+        """
+        Initialize embedding model
+
+        Args:
+            model_name: Sentence-transformers model name
+            batch_size: Texts encoded per forward pass
+        """
+        self.model = SentenceTransformer(model_name)
+        self.batch_size = batch_size
+
+        logger.info(f"Initialized embedding model: {model_name}")
+
+    def fits(self, text: str) -> bool:
+        """Whether text is short enough to be encoded without truncation"""
+        return len(self.model.tokenizer.tokenize(text)) <= self.model.max_seq_length - 2
+
+    def encode(self, texts: List[str]) -> List[List[float]]:
+        """
+        Encode texts as unit-length vectors
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            One float list per text (Neo4j stores them as LIST<FLOAT>)
+        """
+        if not texts:
+            return []
+
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        return vectors.tolist()
+
+
+@lru_cache(maxsize=1)
+def get_embedding_model() -> Optional[EmbeddingModel]:
+    """
+    Shared embedding model, loaded once per process
+
+    Returns:
+        EmbeddingModel, or None if sentence-transformers or the model is unavailable
+    """
+    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+        return None
+
+    try:
+        return EmbeddingModel()
+    except Exception as e:
+        logger.warning(f"Failed to load embedding model: {e}")
+        return None
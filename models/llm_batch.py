@@ -0,0 +1,277 @@
+"""
+Groq Batch Client
+Offline chat completions through the Groq Batch API
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+from loguru import logger
+import httpx
+import orjson
+import os
+import time
+
+from models.llm_client import HTTP_LIMITS, extract_json
+
+
+GROQ_API_URL = "https://api.groq.com/openai/v1"
+
+# Batch states after which polling stops
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class GroqBatchClient:
+    """
+    Client for the Groq Batch API
+
+    For backfills where latency doesn't matter: requests are uploaded as one
+    JSONL file and run within the completion window at batch pricing,
+    without using the interactive rate limits.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "llama-3.3-70b-versatile",
+        temperature: float = 0.3,
+        max_tokens: int = 2048,
+        completion_window: str = "24h",
+    ):
+        """
+        Initialize batch client
+
+        Args:
+            api_key: Groq API key (or use GROQ_API_KEY env var)
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate per request
+            completion_window: How long Groq may take to finish a batch
+        """
+        self.api_key = api_key or os.getenv("GROQ_API_KEY")
+        if not self.api_key:
+            raise ValueError("GROQ_API_KEY not found in environment")
+
+        # The pinned groq SDK predates the files/batches endpoints, so they
+        # are called directly
+        self.http = httpx.Client(
+            base_url=GROQ_API_URL,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            limits=HTTP_LIMITS,
+            timeout=120.0
+        )
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.completion_window = completion_window
+
+        logger.info(f"Initialized Groq batch client with model: {model}")
+
+    def build_requests(
+        self,
+        prompts: List[str],
+        custom_ids: List[str],
+        system_prompt: Optional[str] = None,
+    ) -> bytes:
+        """
+        Build the JSONL input file
+
+        Args:
+            prompts: User prompts
+            custom_ids: One unique ID per prompt, echoed back in the results
+            system_prompt: Optional system prompt shared by every request
+
+        Returns:
+            JSONL bytes, one chat completion request per line
+        """
+        lines = []
+        for custom_id, prompt in zip(custom_ids, prompts):
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": messages,
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
+                },
+            }))
+        return b"\n".join(lines) + b"\n"
+
+    def submit(
+        self,
+        prompts: List[str],
+        custom_ids: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """
+        Upload prompts and start a batch job
+
+        Args:
+            prompts: User prompts
+            custom_ids: Unique ID per prompt (defaults to the prompt index)
+            system_prompt: Optional system prompt shared by every request
+
+        Returns:
+            Batch ID
+        """
+        custom_ids = custom_ids or [str(i) for i in range(len(prompts))]
+        data = self.build_requests(prompts, custom_ids, system_prompt)
+
+        upload = self.http.post(
+            "/files",
+            files={"file": ("batch_input.jsonl", data, "application/jsonl")},
+            data={"purpose": "batch"}
+        )
+        upload.raise_for_status()
+
+        response = self.http.post("/batches", json={
+            "input_file_id": upload.json()["id"],
+            "endpoint": "/v1/chat/completions",
+            "completion_window": self.completion_window,
+        })
+        response.raise_for_status()
+
+        batch_id = response.json()["id"]
+        logger.info(f"Submitted batch {batch_id} with {len(prompts)} requests")
+        return batch_id
+
+    def wait(
+        self,
+        batch_id: str,
+        poll_interval: float = 10.0,
+        max_interval: float = 300.0,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll a batch until it finishes, backing off exponentially
+
+        Args:
+            batch_id: Batch ID
+            poll_interval: First delay between polls in seconds
+            max_interval: Longest delay between polls in seconds
+            timeout: Give up after this many seconds (None waits for the window)
+
+        Returns:
+            Final batch object
+
+        Raises:
+            TimeoutError: The batch didn't finish within timeout
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        delay = poll_interval
+
+        while True:
+            response = self.http.get(f"/batches/{batch_id}")
+            response.raise_for_status()
+            batch = response.json()
+
+            status = batch.get("status")
+            if status in TERMINAL_STATUSES:
+                logger.info(f"Batch {batch_id} {status}: {batch.get('request_counts')}")
+                return batch
+
+            if deadline and time.monotonic() + delay > deadline:
+                raise TimeoutError(f"Batch {batch_id} still {status} after {timeout}s")
+
+            logger.debug(f"Batch {batch_id} {status}, checking again in {delay:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, max_interval)
+
+    def download(self, batch: Dict[str, Any]) -> bytes:
+        """
+        Download a finished batch's output file
+
+        Args:
+            batch: Batch object from wait()
+
+        Returns:
+            JSONL bytes, or b"" if the batch produced no output
+        """
+        file_id = batch.get("output_file_id")
+        if not file_id:
+            return b""
+
+        response = self.http.get(f"/files/{file_id}/content")
+        response.raise_for_status()
+        return response.content
+
+    @staticmethod
+    def parse_results(output: bytes) -> Dict[str, Optional[str]]:
+        """
+        Map each custom_id to its completion text
+
+        Args:
+            output: Output JSONL from download()
+
+        Returns:
+            Dict of custom_id -> generated text, or None for failed requests
+        """
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            try:
+                text = response["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                text = None
+            results[record.get("custom_id")] = text
+        return results
+
+    def submit_batch(
+        self,
+        prompts: List[str],
+        output_path: Union[str, Path],
+        custom_ids: Optional[List[str]] = None,
+        system_prompt: Optional[str] = None,
+        **wait_kwargs
+    ) -> Dict[str, Optional[str]]:
+        """
+        Run prompts as one batch job and wait for the results
+
+        Args:
+            prompts: User prompts
+            output_path: Where to keep the raw output JSONL
+            custom_ids: Unique ID per prompt (defaults to the prompt index)
+            system_prompt: Optional system prompt shared by every request
+            **wait_kwargs: Passed to wait()
+
+        Returns:
+            Dict of custom_id -> generated text, or None for failed requests
+        """
+        batch = self.wait(self.submit(prompts, custom_ids, system_prompt), **wait_kwargs)
+        output = self.download(batch)
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(output)
+
+        return self.parse_results(output)
+
+    def submit_batch_json(self, *args, **kwargs) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        submit_batch, parsing each completion as JSON
+
+        Returns:
+            Dict of custom_id -> parsed JSON, or None where generation or parsing failed
+        """
+        parsed = {}
+        for custom_id, text in self.submit_batch(*args, **kwargs).items():
+            try:
+                parsed[custom_id] = extract_json(text) if text else None
+            except ValueError as e:
+                logger.warning(f"Batch result {custom_id} is not valid JSON: {e}")
+                parsed[custom_id] = None
+        return parsed
+
+    def close(self):
+        """Close HTTP connections"""
+        self.http.close()
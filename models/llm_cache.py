@@ -0,0 +1,192 @@
+"""
+LLM Response Cache
+Exact and semantic-similarity reuse of Groq completions
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from loguru import logger
+import hashlib
+import threading
+
+import numpy as np
+import orjson
+
+if TYPE_CHECKING:
+    from models.embeddings import EmbeddingModel
+
+
+
+def _digest(*parts: Any) -> bytes:
+    """Stable 16-byte hash of the parts that make two requests equivalent"""
+    raw = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+class SemanticCache:
+    """
+    Two-level completion cache
+
+    Exact repeats of a request are answered from an LRU keyed on the full
+    request. Callers that opt in with semantic=True also get near-duplicate
+    reuse: the prompt is embedded and compared against recent prompts sent
+    with the same system prompt, model and settings, and a cosine match at
+    or above the threshold reuses that response.
+    
+    Only opt in for prompts with no article or claim payload. A short
+    payload inside a long template embeds close to any other payload in the
+    same template, so it would get another input's answer back.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_vectors: int = 50_000,
+        threshold: float = 0.97,
+        embedder: Optional["EmbeddingModel"] = None,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Exact-match responses kept (least recently used evicted)
+            max_vectors: Prompt embeddings kept (oldest evicted first)
+            threshold: Minimum cosine similarity for a semantic hit
+            embedder: Prompt encoder; defaults to the shared embedding model,
+                loaded on the first semantic lookup. Without one only exact
+                matches are served
+        """
+        self.max_entries = max_entries
+        self.max_vectors = max_vectors
+        self.threshold = threshold
+        self._embedder = embedder
+        self._embedder_loaded = embedder is not None
+
+        self._lock = threading.Lock()
+        self._exact: "OrderedDict[bytes, str]" = OrderedDict()
+
+        # Ring buffer of unit vectors, grown on demand up to max_vectors, with
+        # the request context (as a small int id) and response per row
+        self._vectors = np.empty((0, 0), dtype=np.float32)
+        self._contexts = np.empty(0, dtype=np.int32)
+        self._responses = []
+        self._context_ids: Dict[bytes, int] = {}
+        self._size = 0
+        self._next = 0
+
+        self.hits = {"exact": 0, "semantic": 0}
+        self.misses = 0
+
+    @property
+    def embedder(self) -> Optional["EmbeddingModel"]:
+        """Prompt encoder, loaded (with sentence-transformers) on first use"""
+        if not self._embedder_loaded:
+            from models.embeddings import get_embedding_model
+            self._embedder = get_embedding_model()
+            self._embedder_loaded = True
+        return self._embedder
+
+    def _embed(self, prompt: str) -> Optional[np.ndarray]:
+        """Prompt vector, or None if the prompt can't be compared semantically"""
+        embedder = self.embedder
+        # A prompt longer than the encoder window would be compared on its
+        # prefix only, which for templated prompts is mostly boilerplate
+        if not embedder or not embedder.fits(prompt):
+            return None
+        try:
+            return np.asarray(embedder.encode([prompt])[0], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Failed to embed prompt for LLM cache: {e}")
+            return None
+
+    def get(self, prompt: str, context: Dict[str, Any], semantic: bool = False) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            prompt: User prompt
+            context: Everything else that shapes the response (system
+                prompt, model, temperature, extra API parameters)
+            semantic: Also accept a near-duplicate prompt's response
+
+        Returns:
+            Cached response, or None on a miss
+        """
+        context_key = _digest(context)
+        key = _digest(context_key, prompt)
+
+        with self._lock:
+            response = self._exact.get(key)
+            if response is not None:
+                self._exact.move_to_end(key)
+                self.hits["exact"] += 1
+                return response
+
+        vector = self._embed(prompt) if semantic else None
+        if vector is not None:
+            with self._lock:
+                context_id = self._context_ids.get(context_key, -1)
+                rows = np.flatnonzero(self._contexts[:self._size] == context_id)
+                if rows.size and self._vectors.shape[1] == vector.shape[0]:
+                    scores = self._vectors[rows] @ vector
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        self.hits["semantic"] += 1
+                        return self._responses[rows[best]]
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, prompt: str, context: Dict[str, Any], response: str, semantic: bool = False) -> None:
+        """
+        Store a response
+
+        Args:
+            prompt: User prompt
+            context: Same context dict passed to get()
+            response: Generated text
+            semantic: Also index the prompt for near-duplicate lookups
+        """
+        context_key = _digest(context)
+        key = _digest(context_key, prompt)
+        vector = self._embed(prompt) if semantic else None
+
+        with self._lock:
+            self._exact[key] = response
+            self._exact.move_to_end(key)
+            if len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+
+            if vector is not None:
+                if self._size == len(self._vectors) < self.max_vectors:
+                    self._grow(vector.shape[0])
+                row = self._next
+                context_id = self._context_ids.setdefault(context_key, len(self._context_ids))
+                self._vectors[row] = vector
+                self._contexts[row] = context_id
+                if row < len(self._responses):
+                    self._responses[row] = response
+                else:
+                    self._responses.append(response)
+                self._next = (row + 1) % self.max_vectors
+                self._size = min(self._size + 1, self.max_vectors)
+
+    def _grow(self, dimensions: int) -> None:
+        """Double the vector buffer (caller holds the lock)"""
+        capacity = min(self.max_vectors, max(256, 2 * len(self._vectors)))
+        vectors = np.empty((capacity, dimensions), dtype=np.float32)
+        contexts = np.full(capacity, -1, dtype=np.int32)
+        if self._size:
+            vectors[:self._size] = self._vectors[:self._size]
+            contexts[:self._size] = self._contexts[:self._size]
+        self._vectors, self._contexts = vectors, contexts
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._exact.clear()
+            self._responses.clear()
+            self._context_ids.clear()
+            self._size = 0
+            self._next = 0
@@ -4,11 +4,52 @@ Fast inference using Groq API
 """
 
 from groq import Groq
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 from loguru import logger
+from models.llm_cache import SemanticCache
+import httpx
+import json
 import os
 
 
+# Keep-alive pool shared by every request a client makes to the Groq API
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
+# Queries packed into one generate_json_batch request; answers degrade as
+# the combined prompt approaches the model's effective context
+MAX_BATCH_PROMPTS = 8
+
+BATCH_PROMPT = """Answer each of the {count} queries below independently.
+Return a JSON object {{"results": [...]}} whose "results" array has exactly {count} items,
+where item i is the JSON answer to query [i].
+
+Queries:
+{queries}"""
+
+
+def extract_json(response: str) -> Dict[str, Any]:
+    """
+    Parse the JSON object in a model response
+    
+    Args:
+        response: Generated text, possibly wrapped in prose or code fences
+        
+    Returns:
+        Parsed JSON dict
+        
+    Raises:
+        json.JSONDecodeError: No valid JSON found
+    """
+    # Find JSON in response (between { and })
+    start = response.find('{')
+    end = response.rfind('}') + 1
+    
+    if start >= 0 and end > start:
+        return json.loads(response[start:end])
+    return json.loads(response)
+
+
 class GroqLLMClient:
     """Client for Groq API"""
     
@@ -18,6 +59,7 @@ class GroqLLMClient:
         model: str = "llama-3.3-70b-versatile",
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        cache: Optional[SemanticCache] = None,
     ):
         """
         Initialize Groq client
@@ -27,15 +69,21 @@ class GroqLLMClient:
             model: Model name (llama-3.1-70b-versatile, mixtral-8x7b-32768, etc.)
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache: Response cache consulted by generate/generate_json
+                (exact matches only unless a call passes semantic_cache=True)
         """
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(
+            api_key=self.api_key,
+            http_client=httpx.Client(limits=HTTP_LIMITS, timeout=60.0)
+        )
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
         
         logger.info(f"Initialized Groq client with model: {model}")
         
@@ -45,6 +93,7 @@ class GroqLLMClient:
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        semantic_cache: bool = False,
         **kwargs
     ) -> str:
         """
@@ -55,23 +104,27 @@ class GroqLLMClient:
             system_prompt: Optional system prompt
             temperature: Override default temperature
             max_tokens: Override default max tokens
+            semantic_cache: Allow reusing the response to a near-duplicate
+                prompt; only for prompts without an article or claim payload
             **kwargs: Additional Groq API parameters
             
         Returns:
             Generated text
         """
-        messages = []
+        messages = self._messages(prompt, system_prompt)
         
-        if system_prompt:
-            messages.append({
-                "role": "system",
-                "content": system_prompt
-            })
-            
-        messages.append({
-            "role": "user",
-            "content": prompt
-        })
+        context = {
+            'system_prompt': system_prompt,
+            'model': self.model,
+            'temperature': temperature or self.temperature,
+            'max_tokens': max_tokens or self.max_tokens,
+            **kwargs
+        }
+        if self.cache:
+            cached = self.cache.get(prompt, context, semantic=semantic_cache)
+            if cached is not None:
+                logger.debug("LLM cache hit")
+                return cached
         
         try:
             response = self.client.chat.completions.create(
@@ -85,12 +138,31 @@ class GroqLLMClient:
             result = response.choices[0].message.content
             logger.debug(f"Generated {len(result)} characters")
             
+            if self.cache:
+                self.cache.put(prompt, context, result, semantic=semantic_cache)
             return result
             
         except Exception as e:
             logger.error(f"Groq API error: {e}")
             raise
             
+    @staticmethod
+    def _messages(prompt: str, system_prompt: Optional[str]) -> list[Dict[str, str]]:
+        """Chat messages for a single-turn prompt"""
+        messages = []
+        
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+            
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+        return messages
+        
     def generate_json(
         self,
         prompt: str,
@@ -108,8 +180,6 @@ class GroqLLMClient:
         Returns:
             Parsed JSON dict
         """
-        import json
-        
         if system_prompt:
             system_prompt += "\n\nRespond with valid JSON only."
         else:
@@ -121,23 +191,65 @@ class GroqLLMClient:
             **kwargs
         )
         
-        # Try to extract JSON from response
         try:
-            # Find JSON in response (between { and })
-            start = response.find('{')
-            end = response.rfind('}') + 1
-            
-            if start >= 0 and end > start:
-                json_str = response[start:end]
-                return json.loads(json_str)
-            else:
-                return json.loads(response)
-                
+            return extract_json(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON: {e}")
             logger.debug(f"Response: {response}")
             raise
             
+    def generate_json_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        batch_size: int = MAX_BATCH_PROMPTS,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Answer several JSON prompts per request under one shared system prompt
+        
+        Args:
+            prompts: Independent user prompts
+            system_prompt: Instructions shared by every prompt
+            batch_size: Prompts packed per request (capped at MAX_BATCH_PROMPTS)
+            max_tokens: Output budget per prompt (scaled by the batch size)
+            **kwargs: Additional parameters
+            
+        Returns:
+            One parsed JSON dict per prompt, in order; None where a request
+            failed or its answer was missing
+        """
+        batch_size = max(1, min(batch_size, MAX_BATCH_PROMPTS))
+        per_prompt_tokens = max_tokens or self.max_tokens
+        results: List[Optional[Dict[str, Any]]] = []
+        
+        for i in range(0, len(prompts), batch_size):
+            chunk = prompts[i:i + batch_size]
+            queries = "\n\n".join(f"[{n}] {prompt}" for n, prompt in enumerate(chunk, 1))
+            
+            try:
+                response = self.generate_json(
+                    prompt=BATCH_PROMPT.format(count=len(chunk), queries=queries),
+                    system_prompt=system_prompt,
+                    max_tokens=per_prompt_tokens * len(chunk),
+                    **kwargs
+                )
+                answers = response.get('results', [])
+                if not isinstance(answers, list):
+                    answers = []
+            except Exception as e:
+                logger.error(f"Batch of {len(chunk)} prompts failed: {e}")
+                answers = []
+            
+            if len(answers) != len(chunk):
+                logger.warning(f"Expected {len(chunk)} batch answers, got {len(answers)}")
+            for n in range(len(chunk)):
+                answer = answers[n] if n < len(answers) else None
+                results.append(answer if isinstance(answer, dict) else None)
+        
+        return results
+        
     def chat(
         self,
         messages: list[Dict[str, str]],
@@ -176,14 +288,24 @@ class GroqLLMClient:
 # Convenience function
 def create_llm_client() -> GroqLLMClient:
     """Create LLM client from environment variables"""
+    # Off unless asked for: with sampling, a repeated prompt is expected to
+    # get a fresh answer rather than the cached one
+    use_cache = os.getenv("LLM_CACHE", "false").lower() == "true"
     return GroqLLMClient(
         api_key=os.getenv("GROQ_API_KEY"),
         model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
         temperature=float(os.getenv("GROQ_TEMPERATURE", "0.7")),
         max_tokens=int(os.getenv("GROQ_MAX_TOKENS", "2048")),
+        cache=SemanticCache(threshold=float(os.getenv("LLM_CACHE_THRESHOLD", "0.97"))) if use_cache else None,
     )
 
 
+@lru_cache(maxsize=1)
+def get_llm_client() -> GroqLLMClient:
+    """Process-wide LLM client, so its HTTP connections are reused across callers"""
+    return create_llm_client()
+
+
 if __name__ == "__main__":
     # Test the client
     from dotenv import load_dotenv
@@ -6,7 +6,7 @@ Consumes messages from Kafka topics
 from kafka import KafkaConsumer
 from typing import Optional, Callable, Dict, Any
 from loguru import logger
-import json
+import orjson
 import os
 
 
@@ -20,6 +20,7 @@ class KafkaConsumerClient:
         bootstrap_servers: Optional[str] = None,
         auto_offset_reset: str = 'earliest',
         value_deserializer=None,
+        enable_auto_commit: bool = True,
     ):
         """
         Initialize Kafka consumer
@@ -30,6 +31,8 @@ class KafkaConsumerClient:
             bootstrap_servers: Kafka server address
             auto_offset_reset: Where to start reading (earliest/latest)
             value_deserializer: Function to deserialize values
+            enable_auto_commit: Commit offsets in the background; when False,
+                call commit() once the polled messages are fully handled
         """
         self.bootstrap_servers = bootstrap_servers or os.getenv(
             "KAFKA_BOOTSTRAP_SERVERS", "localhost:29092"
@@ -40,7 +43,7 @@ class KafkaConsumerClient:
         
         # Default JSON deserializer
         if value_deserializer is None:
-            value_deserializer = lambda v: json.loads(v.decode('utf-8'))
+            value_deserializer = orjson.loads
         
         self.consumer = KafkaConsumer(
             *topics,
@@ -49,7 +52,7 @@ class KafkaConsumerClient:
             auto_offset_reset=auto_offset_reset,
             value_deserializer=value_deserializer,
             key_deserializer=lambda k: k.decode('utf-8') if k else None,
-            enable_auto_commit=True,
+            enable_auto_commit=enable_auto_commit,
             max_poll_records=500,
         )
         
@@ -94,6 +97,24 @@ class KafkaConsumerClient:
         finally:
             logger.info(f"Processed {count} messages")
             
+    def poll_batch(self, max_records: int, timeout_ms: int = 1000) -> list[Dict[str, Any]]:
+        """
+        Fetch up to max_records message values in one poll
+        
+        Args:
+            max_records: Max messages to return
+            timeout_ms: How long to wait for messages
+            
+        Returns:
+            Message values, possibly empty
+        """
+        batches = self.consumer.poll(timeout_ms=timeout_ms, max_records=max_records)
+        return [message.value for messages in batches.values() for message in messages]
+        
+    def commit(self):
+        """Commit the offsets of every message polled so far"""
+        self.consumer.commit()
+        
     def close(self):
         """Close consumer connection"""
         self.consumer.close()
@@ -24,6 +24,11 @@ class KafkaTopics:
             "replication": 1,
             "description": "Cleaned and normalized articles"
         },
+        "analyzed-articles": {
+            "partitions": 3,
+            "replication": 1,
+            "description": "Articles with their batch analysis (backfill)"
+        },
         "extracted-claims": {
             "partitions": 2,
             "replication": 1,
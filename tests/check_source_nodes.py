@@ -3,45 +3,53 @@ from graph.neo4j_client import Neo4jClient
 
 client = Neo4jClient()
 
-# Check for Source nodes
-query1 = """
+# All diagnostics in one round trip; `kind` tells the sections apart
+query = """
 MATCH (s:Source)
-RETURN count(s) as source_count
+RETURN 'source_count' as kind, null as label, null as detail, count(s) as count
+UNION ALL
+CALL {
+    MATCH (s:Source)-[r]->(c:Claim)
+    RETURN type(r) as label, count(*) as count
+    LIMIT 5
+}
+RETURN 'source_to_claim' as kind, label, null as detail, count
+UNION ALL
+CALL {
+    MATCH (c:Claim)-[r]->(s:Source)
+    RETURN type(r) as label, count(*) as count
+    LIMIT 5
+}
+RETURN 'claim_to_source' as kind, label, null as detail, count
+UNION ALL
+CALL {
+    MATCH (s:Source)
+    RETURN s.name as label, s.type as detail
+    LIMIT 3
+}
+RETURN 'sample' as kind, label, detail, null as count
 """
-result = client.execute_query(query1, {})
-print(f"Source nodes: {result[0]['source_count']}")
+results = client.execute_query(query, {})
+sections = {}
+for r in results:
+    sections.setdefault(r['kind'], []).append(r)
+
+source_count = sections.get('source_count', [{'count': 0}])[0]['count']
+print(f"Source nodes: {source_count}")
 
 # Check relationships between Source and Claim
-query2 = """
-MATCH (s:Source)-[r]->(c:Claim)
-RETURN type(r) as relationship_type, count(*) as count
-LIMIT 5
-"""
-result = client.execute_query(query2, {})
 print("\nSource->Claim relationships:")
-for r in result:
-    print(f"  {r['relationship_type']}: {r['count']}")
+for r in sections.get('source_to_claim', []):
+    print(f"  {r['label']}: {r['count']}")
 
 # Check reverse direction
-query3 = """
-MATCH (c:Claim)-[r]->(s:Source)
-RETURN type(r) as relationship_type, count(*) as count
-LIMIT 5
-"""
-result = client.execute_query(query3, {})
 print("\nClaim->Source relationships:")
-for r in result:
-    print(f"  {r['relationship_type']}: {r['count']}")
+for r in sections.get('claim_to_source', []):
+    print(f"  {r['label']}: {r['count']}")
 
 # Sample Source node
-query4 = """
-MATCH (s:Source)
-RETURN s.name as name, s.type as type
-LIMIT 3
-"""
-result = client.execute_query(query4, {})
 print("\nSample Source nodes:")
-for r in result:
-    print(f"  {r['name']} ({r['type']})")
+for r in sections.get('sample', []):
+    print(f"  {r['label']} ({r['detail']})")
 
 client.close()
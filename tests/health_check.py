@@ -4,26 +4,25 @@ Verify all services are running correctly
 """
 
 import os
+import threading
+import time
 from dotenv import load_dotenv
-from neo4j import GraphDatabase
-from models.llm_client import create_llm_client
+from graph._driver import get_driver
+from models.llm_client import get_llm_client
 from loguru import logger
 
 load_dotenv()
 
+# Overall budget for all checks; a service that hasn't answered by then fails
+CHECK_TIMEOUT = 6
+
 
 def check_neo4j():
     """Check Neo4j connection"""
     try:
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        username = os.getenv("NEO4J_USERNAME", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD")
-        
-        driver = GraphDatabase.driver(uri, auth=(username, password))
-        with driver.session() as session:
+        with get_driver().session() as session:
             result = session.run("RETURN 1 as test")
             _ = result.single()
-        driver.close()
         
         logger.info("✓ Neo4j: Connected")
         return True
@@ -35,7 +34,7 @@ def check_neo4j():
 def check_groq():
     """Check Groq API"""
     try:
-        client = create_llm_client()
+        client = get_llm_client()
         response = client.generate(
             prompt="Say 'OK' if you can read this.",
             max_tokens=10
@@ -86,13 +85,37 @@ def main():
     logger.info("Agentic OSINT System - Health Check")
     logger.info("=" * 50)
     
-    results = {
-        "Neo4j": check_neo4j(),
-        "Groq API": check_groq(),
-        "Redis": check_redis(),
-        "Kafka": check_kafka(),
+    checks = {
+        "Neo4j": check_neo4j,
+        "Groq API": check_groq,
+        "Redis": check_redis,
+        "Kafka": check_kafka,
     }
     
+    # The checks are independent network round trips, so run them side by
+    # side. Daemon threads let the process exit without joining a hung check
+    # (a ThreadPoolExecutor would wait for it at interpreter shutdown).
+    outcomes = {}
+    threads = {}
+    for name, fn in checks.items():
+        thread = threading.Thread(
+            target=lambda name=name, fn=fn: outcomes.__setitem__(name, fn()),
+            name=f"health-{name}",
+            daemon=True
+        )
+        thread.start()
+        threads[name] = thread
+    
+    deadline = time.monotonic() + CHECK_TIMEOUT
+    results = {}
+    for name, thread in threads.items():
+        thread.join(max(0.0, deadline - time.monotonic()))
+        if thread.is_alive():
+            logger.error(f"✗ {name}: no response within {CHECK_TIMEOUT}s")
+            results[name] = False
+        else:
+            results[name] = outcomes.get(name, False)
+    
     logger.info("=" * 50)
     passed = sum(results.values())
     total = len(results)
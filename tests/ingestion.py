@@ -6,13 +6,21 @@ Coordinates all crawlers and streams data to Kafka
 from crawlers.rss_crawler import RSSCrawler
 from crawlers.reddit_crawler import RedditCrawler
 from crawlers.web_scraper import WebScraper
+from crawlers.http_session import close_session
+from crawlers.schema import Article, Post
 from streaming.producer import KafkaProducerClient
 from streaming.topics import KafkaTopics
 from loguru import logger
 from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import os
 
 
+# Max in-flight article scrapes during enrichment
+ENRICH_CONCURRENCY = 8
+
+
 class DataIngestionOrchestrator:
     """Orchestrate data collection from all sources"""
     
@@ -20,7 +28,9 @@ class DataIngestionOrchestrator:
         """Initialize orchestrator with all crawlers"""
         self.rss_crawler = RSSCrawler(max_articles_per_feed=20)
         self.reddit_crawler = RedditCrawler(max_posts_per_subreddit=20)
-        self.web_scraper = WebScraper()
+        # Enrichment runs at most ENRICH_CONCURRENCY scrapes at once; requests
+        # to the same host are additionally spaced by the scraper's rate limit
+        self.web_scraper = WebScraper(max_concurrency=ENRICH_CONCURRENCY)
         
         # Initialize Kafka
         self.topics = KafkaTopics()
@@ -37,7 +47,7 @@ class DataIngestionOrchestrator:
             logger.error(f"Kafka setup failed: {e}")
             raise
             
-    def collect_rss_feeds(self) -> List[Dict[str, Any]]:
+    def collect_rss_feeds(self) -> List[Article]:
         """Collect articles from RSS feeds"""
         logger.info("=" * 50)
         logger.info("Collecting RSS Feeds")
@@ -47,12 +57,14 @@ class DataIngestionOrchestrator:
         
         # Send to Kafka
         if articles:
-            self.producer.send_batch("raw-feeds", articles)
+            self.producer.send_batch("raw-feeds", [a.to_dict() for a in articles])
+            self.rss_crawler.commit_seen()
             logger.info(f"✓ Sent {len(articles)} RSS articles to Kafka")
+        self.rss_crawler.save_validators()
         
         return articles
         
-    def collect_reddit_posts(self) -> List[Dict[str, Any]]:
+    def collect_reddit_posts(self) -> List[Post]:
         """Collect posts from Reddit"""
         logger.info("=" * 50)
         logger.info("Collecting Reddit Posts")
@@ -62,14 +74,15 @@ class DataIngestionOrchestrator:
         
         # Send to Kafka
         if posts:
-            self.producer.send_batch("raw-feeds", posts)
+            self.producer.send_batch("raw-feeds", [p.to_dict() for p in posts])
+            self.reddit_crawler.commit_seen()
             logger.info(f"✓ Sent {len(posts)} Reddit posts to Kafka")
         
         return posts
         
     def enrich_with_full_content(
         self,
-        articles: List[Dict[str, Any]],
+        articles: List[Article],
         max_to_scrape: int = 10
     ) -> List[Dict[str, Any]]:
         """
@@ -80,7 +93,7 @@ class DataIngestionOrchestrator:
             max_to_scrape: Maximum articles to scrape
             
         Returns:
-            Articles with enriched content
+            Article dicts with enriched content
         """
         logger.info("=" * 50)
         logger.info(f"Enriching {min(len(articles), max_to_scrape)} articles")
@@ -88,24 +101,31 @@ class DataIngestionOrchestrator:
         
         enriched = []
         
-        for i, article in enumerate(articles[:max_to_scrape]):
-            url = article.get('url', '')
-            
-            # Skip if not a valid article URL
-            if not url or url.startswith('https://reddit.com'):
-                continue
-            
-            # Scrape full content
-            scraped = self.web_scraper.scrape_article(url)
-            
+        # Skip entries without a scrapeable article URL
+        candidates = [
+            article for article in articles[:max_to_scrape]
+            if article.url and not article.url.startswith('https://reddit.com')
+        ]
+        
+        # Scrape full content concurrently
+        async def scrape(urls: List[str]) -> List[Any]:
+            try:
+                return await self.web_scraper.scrape_articles(urls)
+            finally:
+                await close_session()
+        
+        scraped_results = asyncio.run(scrape([a.url for a in candidates]))
+        
+        for i, (article, scraped) in enumerate(zip(candidates, scraped_results)):
             if scraped and scraped.get('content'):
                 # Merge scraped content with original article
-                article['full_content'] = scraped['content']
-                article['word_count'] = scraped['word_count']
-                article['scraped_metadata'] = scraped.get('metadata', {})
-                
-                enriched.append(article)
-                logger.info(f"  [{i+1}/{max_to_scrape}] Enriched: {article['title'][:60]}...")
+                enriched.append({
+                    **article.to_dict(),
+                    "full_content": scraped['content'],
+                    "word_count": scraped['word_count'],
+                    "scraped_metadata": scraped.get('metadata', {}),
+                })
+                logger.info(f"  [{i+1}/{len(candidates)}] Enriched: {article.title[:60]}...")
         
         logger.info(f"✓ Enriched {len(enriched)} articles")
         return enriched
@@ -124,9 +144,13 @@ class DataIngestionOrchestrator:
         # Setup Kafka
         self.setup_kafka()
         
-        # Collect from all sources
-        rss_articles = self.collect_rss_feeds()
-        reddit_posts = self.collect_reddit_posts()
+        # Collect from all sources. RSS and Reddit hit unrelated upstreams and
+        # the Kafka producer is thread-safe, so run them side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rss_future = executor.submit(self.collect_rss_feeds)
+            reddit_future = executor.submit(self.collect_reddit_posts)
+            rss_articles = rss_future.result()
+            reddit_posts = reddit_future.result()
         
         # Optionally enrich with full content
         if enrich_content and rss_articles:
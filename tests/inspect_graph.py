@@ -8,6 +8,65 @@ load_dotenv()
 
 from graph.neo4j_client import Neo4jClient
 from loguru import logger
+from typing import List, Tuple
+
+
+# Everything the report shows in one round trip; `kind` tells the sections apart
+INSPECT_QUERY = """
+CALL { MATCH (e:Entity) RETURN count(e) as entities }
+CALL { MATCH (c:Claim) RETURN count(c) as claims }
+CALL { MATCH (s:Source) RETURN count(s) as sources }
+CALL { MATCH (ev:Event) RETURN count(ev) as events }
+RETURN 'stats' as kind, {entities: entities, claims: claims, sources: sources, events: events} as row
+UNION ALL
+CALL {
+    MATCH (e:Entity)
+    RETURN e ORDER BY e.confidence DESC LIMIT 20
+}
+RETURN 'entity' as kind, {id: e.id, name: e.name, type: e.type, confidence: e.confidence} as row
+UNION ALL
+CALL {
+    MATCH (c:Claim)
+    RETURN c ORDER BY c.confidence_score DESC LIMIT 10
+}
+RETURN 'claim' as kind, {id: c.id, text: c.text, confidence: c.confidence_score} as row
+UNION ALL
+CALL {
+    MATCH (s:Source)
+    RETURN s LIMIT 10
+}
+RETURN 'source' as kind, {url: s.url, domain: s.domain, credibility: s.credibility_score, title: s.title} as row
+"""
+
+# Per-type relationship counts come from Neo4j's counts store; grouping
+# MATCH ()-[r]->() by type(r) would scan every relationship instead
+APOC_REL_COUNTS_QUERY = "CALL apoc.meta.stats() YIELD relTypesCount RETURN relTypesCount"
+REL_TYPES_QUERY = "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+
+
+def relationship_counts(client: Neo4jClient) -> List[Tuple[str, int]]:
+    """
+    Count relationships per type without scanning the graph
+    
+    Uses apoc.meta.stats() when APOC is installed, otherwise one typed
+    count per relationship type (each answered from the counts store).
+    
+    Returns:
+        (type, count) pairs, largest first
+    """
+    try:
+        counts = client.execute_query(APOC_REL_COUNTS_QUERY)[0]['relTypesCount']
+    except Exception:
+        types = [r['relationshipType'] for r in client.execute_query(REL_TYPES_QUERY)]
+        if not types:
+            return []
+        query = "\nUNION ALL\n".join(
+            f"MATCH ()-[r:`{t.replace('`', '``')}`]->() RETURN $types[{i}] as rel_type, count(r) as count"
+            for i, t in enumerate(types)
+        )
+        counts = {r['rel_type']: r['count'] for r in client.execute_query(query, {'types': types})}
+    
+    return sorted(((t, c) for t, c in counts.items() if c), key=lambda tc: tc[1], reverse=True)
 
 
 def inspect_graph():
@@ -15,8 +74,12 @@ def inspect_graph():
     client = Neo4jClient()
     
     try:
+        sections = {}
+        for record in client.execute_query(INSPECT_QUERY):
+            sections.setdefault(record['kind'], []).append(record['row'])
+        
         # Get overall stats
-        stats = client.get_stats()
+        stats = sections.get('stats', [{}])[0]
         print(f"\n{'='*60}")
         print(f"Neo4j Knowledge Graph Statistics")
         print(f"{'='*60}")
@@ -31,18 +94,9 @@ def inspect_graph():
             print(f"Entities")
             print(f"{'='*60}")
             
-            query = """
-            MATCH (e:Entity)
-            RETURN e.id as id, e.name as name, e.type as type, e.confidence as confidence
-            ORDER BY e.confidence DESC
-            LIMIT 20
-            """
-            
-            with client.driver.session() as session:
-                result = session.run(query)
-                for i, record in enumerate(result, 1):
-                    print(f"  {i}. {record['name']} ({record['type']}) - confidence: {record['confidence']:.2f}")
-                    print(f"     ID: {record['id']}")
+            for i, record in enumerate(sections.get('entity', []), 1):
+                print(f"  {i}. {record['name']} ({record['type']}) - confidence: {record['confidence']:.2f}")
+                print(f"     ID: {record['id']}")
         
         # Show claims
         if stats.get('claims', 0) > 0:
@@ -50,19 +104,10 @@ def inspect_graph():
             print(f"Claims")
             print(f"{'='*60}")
             
-            query = """
-            MATCH (c:Claim)
-            RETURN c.id as id, c.text as text, c.confidence_score as confidence
-            ORDER BY c.confidence_score DESC
-            LIMIT 10
-            """
-            
-            with client.driver.session() as session:
-                result = session.run(query)
-                for i, record in enumerate(result, 1):
-                    print(f"  {i}. {record['text'][:80]}...")
-                    print(f"     Confidence: {record['confidence']:.2f}")
-                    print(f"     ID: {record['id']}\n")
+            for i, record in enumerate(sections.get('claim', []), 1):
+                print(f"  {i}. {record['text'][:80]}...")
+                print(f"     Confidence: {record['confidence']:.2f}")
+                print(f"     ID: {record['id']}\n")
         
         # Show sources
         if stats.get('sources', 0) > 0:
@@ -70,39 +115,23 @@ def inspect_graph():
             print(f"Sources")
             print(f"{'='*60}")
             
-            query = """
-            MATCH (s:Source)
-            RETURN s.url as url, s.domain as domain, s.credibility_score as credibility, s.title as title
-            LIMIT 10
-            """
-            
-            with client.driver.session() as session:
-                result = session.run(query)
-                for i, record in enumerate(result, 1):
-                    print(f"  {i}. {record['title'] or 'Untitled'}")
-                    print(f"     Domain: {record['domain']}")
-                    print(f"     Credibility: {record['credibility']:.2f}")
-                    print(f"     URL: {record['url']}\n")
+            for i, record in enumerate(sections.get('source', []), 1):
+                print(f"  {i}. {record['title'] or 'Untitled'}")
+                print(f"     Domain: {record['domain']}")
+                print(f"     Credibility: {record['credibility']:.2f}")
+                print(f"     URL: {record['url']}\n")
         
         # Show relationships
         print(f"\n{'='*60}")
         print(f"Relationships")
         print(f"{'='*60}")
         
-        query = """
-        MATCH ()-[r]->()
-        RETURN type(r) as rel_type, count(r) as count
-        ORDER BY count DESC
-        """
-        
-        with client.driver.session() as session:
-            result = session.run(query)
-            relationships = list(result)
-            if relationships:
-                for record in relationships:
-                    print(f"  {record['rel_type']}: {record['count']}")
-            else:
-                print(f"  No relationships found")
+        relationships = relationship_counts(client)
+        if relationships:
+            for rel_type, count in relationships:
+                print(f"  {rel_type}: {count}")
+        else:
+            print(f"  No relationships found")
         
         print(f"\n{'='*60}\n")
         
@@ -0,0 +1,119 @@
+"""
+Seen-Item Filter Tests
+Membership, staging and persistence of SeenFilter
+"""
+
+import struct
+
+from crawlers.dedupe import SeenFilter
+
+
+def test_add_and_contains():
+    seen = SeenFilter(capacity=1000)
+    assert 'a' not in seen
+    assert seen.add('a') is False
+    assert 'a' in seen
+    assert seen.add('a') is True
+    assert 'b' not in seen
+    assert seen.count == 1
+
+
+def test_stage_only_marks_seen_on_commit():
+    seen = SeenFilter(capacity=1000)
+    assert seen.stage('a') is False
+    assert seen.stage('a') is True
+    assert 'a' not in seen
+
+    seen.commit()
+    assert 'a' in seen
+    assert seen.stage('a') is True
+
+
+def test_discard_staged():
+    seen = SeenFilter(capacity=1000)
+    seen.stage('a')
+    seen.discard_staged()
+    seen.commit()
+    assert 'a' not in seen
+    assert seen.stage('a') is False
+
+
+def test_save_load_round_trip(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    seen = SeenFilter(capacity=1000, path=path)
+    for item in ('a', 'b', 'c'):
+        seen.add(item)
+    seen.save()
+
+    loaded = SeenFilter(capacity=1000, path=path)
+    assert loaded.count == 3
+    assert all(item in loaded for item in ('a', 'b', 'c'))
+    assert 'd' not in loaded
+
+
+def test_commit_persists(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    seen = SeenFilter(capacity=1000, path=path)
+    seen.stage('a')
+    seen.commit()
+    assert 'a' in SeenFilter(capacity=1000, path=path)
+
+
+def test_truncated_file_is_ignored(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    seen = SeenFilter(capacity=1000, path=path)
+    seen.add('a')
+    seen.save()
+    path.write_bytes(path.read_bytes()[:-10])
+
+    loaded = SeenFilter(capacity=1000, path=path)
+    assert loaded.count == 0
+    assert 'a' not in loaded
+    assert loaded.add('a') is False
+
+
+def test_truncated_header_is_ignored(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    path.write_bytes(b'\x01\x02')
+
+    loaded = SeenFilter(capacity=1000, path=path)
+    assert loaded.count == 0
+    assert 'a' not in loaded
+
+
+def test_grows_past_capacity():
+    seen = SeenFilter(capacity=100, error_rate=0.01)
+    added = sum(not seen.add(f'item-{i}') for i in range(1000))
+
+    # A false positive on add() counts as already present
+    assert seen.count == added > 980
+    assert len(seen._slices) > 1
+    assert all(f'item-{i}' in seen for i in range(1000))
+    false_positives = sum(f'other-{i}' in seen for i in range(10_000))
+    assert false_positives / 10_000 < 0.02
+
+
+def test_save_load_multiple_slices(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    seen = SeenFilter(capacity=10, path=path)
+    for i in range(50):
+        seen.add(f'item-{i}')
+    seen.save()
+
+    loaded = SeenFilter(capacity=10, path=path)
+    assert len(loaded._slices) == len(seen._slices) > 1
+    assert loaded.count == seen.count
+    assert all(f'item-{i}' in loaded for i in range(50))
+
+
+def test_loads_single_slice_file(tmp_path):
+    path = tmp_path / 'seen.bloom'
+    seen = SeenFilter(capacity=1000)
+    seen.add('a')
+    first = seen._slices[0]
+    path.write_bytes(struct.pack('<QII', first.num_bits, first.num_hashes, first.count) + bytes(first.bits))
+
+    loaded = SeenFilter(capacity=1000, path=path)
+    assert loaded.count == 1
+    assert 'a' in loaded
+    assert loaded.add('b') is False
@@ -6,14 +6,27 @@ Integrates Kafka → Multi-Agent Pipeline → Neo4j
 from dotenv import load_dotenv
 load_dotenv()
 
+from agents.analyzer import AnalyzerAgent
+from agents.collector import CollectorAgent
 from agents.orchestrator import MultiAgentOrchestrator
+from models.llm_batch import GroqBatchClient
 from streaming.consumer import KafkaConsumerClient
 from streaming.producer import KafkaProducerClient
 from loguru import logger
-import json
+import asyncio
 import time
 
 
+# Messages to process in a test run
+MAX_MESSAGES = 5
+
+# Articles run through the pipeline at once (and share one batched analysis request)
+PIPELINE_CONCURRENCY = 8
+
+# Articles drained from Kafka into one Groq Batch API job in --batch mode
+BACKFILL_MESSAGES = 1000
+
+
 def process_from_kafka():
     """
     Consume messages from Kafka and process through agent pipeline
@@ -28,33 +41,55 @@ def process_from_kafka():
         'start_time': time.time()
     }
     
-    def handle_message(message):
-        """Handle each Kafka message"""
+    def handle_article(article_data):
+        """Run one article through the pipeline; True on success"""
+        title = article_data.get('title', 'Untitled')
         try:
-            stats['processed'] += 1
-            
-            # Parse message
-            article_data = json.loads(message.value.decode('utf-8'))
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing Article #{stats['processed']}")
-            logger.info(f"Title: {article_data.get('title', 'Untitled')}")
-            logger.info(f"{'='*60}\n")
+            logger.info(f"Processing: {title}")
             
             # Process through pipeline
             result = orchestrator.process_article(article_data)
             
-            stats['succeeded'] += 1
-            
             # Show summary
-            logger.success(f"✓ Article #{stats['processed']} Complete")
+            logger.success(f"✓ Complete: {title[:60]}")
             logger.info(f"  Entities: {len(result['entities'])}")
             logger.info(f"  Claims: {len(result['claims'])}")
             logger.info(f"  Graph Ops: {len(result['graph_operations'])}\n")
+            return True
             
         except Exception as e:
-            stats['failed'] += 1
-            logger.error(f"✗ Failed to process article: {e}")
+            logger.error(f"✗ Failed to process article '{title[:60]}': {e}")
+            return False
+    
+    async def run_batches():
+        """Poll up to PIPELINE_CONCURRENCY articles at a time and process them together"""
+        while stats['processed'] < MAX_MESSAGES:
+            # poll blocks for up to its timeout, so keep it off the event loop
+            batch = await asyncio.to_thread(
+                consumer.poll_batch,
+                min(PIPELINE_CONCURRENCY, MAX_MESSAGES - stats['processed'])
+            )
+            if not batch:
+                continue
+            
+            stats['processed'] += len(batch)
+            logger.info(f"\n{'='*60}")
+            logger.info(f"Processing {len(batch)} articles ({stats['processed']}/{MAX_MESSAGES})")
+            logger.info(f"{'='*60}\n")
+            
+            # One batched LLM request covers the analysis step of the whole batch
+            await asyncio.to_thread(orchestrator.prefetch_analysis, batch)
+            
+            # The agents block on Groq and Neo4j, so each article gets a worker thread
+            try:
+                results = await asyncio.gather(*[
+                    asyncio.to_thread(handle_article, article) for article in batch
+                ])
+            finally:
+                # Analyses of articles that failed before the analyzer ran
+                orchestrator.clear_prefetched()
+            stats['succeeded'] += sum(results)
+            stats['failed'] += len(results) - sum(results)
     
     # Create consumer
     consumer = KafkaConsumerClient(
@@ -67,11 +102,7 @@ def process_from_kafka():
         logger.info("Listening to topic: raw-feeds")
         logger.info("Press Ctrl+C to stop\n")
         
-        # Start consuming
-        consumer.consume(
-            callback=handle_message,
-            max_messages=5  # Process 5 messages for testing
-        )
+        asyncio.run(run_batches())
         
     except KeyboardInterrupt:
         logger.info("\n⚠️  Stopping consumer...")
@@ -94,6 +125,78 @@ def process_from_kafka():
         logger.info(f"{'='*60}\n")
 
 
+def process_backfill_batch(max_messages: int = BACKFILL_MESSAGES):
+    """
+    Analyze a Kafka backlog offline with one Groq Batch API job
+    
+    Drains up to max_messages articles from raw-feeds, submits their analysis
+    prompts as a single batch, waits for it, and publishes each article with
+    its analysis to analyzed-articles. Offsets are committed only after the
+    results are published, so a failed or expired batch is retried next run.
+    """
+    consumer = KafkaConsumerClient(
+        topics=['raw-feeds'],
+        group_id='batch-backfill',
+        enable_auto_commit=False
+    )
+    producer = KafkaProducerClient()
+    batch_client = GroqBatchClient()
+    collector = CollectorAgent()
+    
+    try:
+        # Drain the backlog until a poll comes back empty
+        articles = []
+        while len(articles) < max_messages:
+            batch = consumer.poll_batch(max_messages - len(articles), timeout_ms=5000)
+            if not batch:
+                break
+            articles.extend(batch)
+        logger.info(f"Drained {len(articles)} articles from raw-feeds")
+        
+        # Same prompt the analyzer agent would send for each article
+        prompts, ids, pending = [], [], {}
+        for i, article in enumerate(articles):
+            text = AnalyzerAgent._prepare_text(collector._prepare_text(article))
+            if not text:
+                continue
+            custom_id = str(article.get('id') or i)
+            if custom_id in pending:
+                continue
+            prompts.append(AnalyzerAgent.ANALYSIS_PROMPT.format(text=text))
+            ids.append(custom_id)
+            pending[custom_id] = article
+        
+        if not prompts:
+            logger.info("Nothing to analyze")
+            consumer.commit()
+            return
+        
+        analyses = batch_client.submit_batch_json(
+            prompts,
+            output_path=f".cache/batches/analysis_{int(time.time())}.jsonl",
+            custom_ids=ids,
+            system_prompt=AnalyzerAgent.SYSTEM_PROMPT
+        )
+        
+        processed = [
+            {'id': custom_id, 'article': pending[custom_id], 'analysis': analysis}
+            for custom_id, analysis in analyses.items()
+            if analysis is not None and custom_id in pending
+        ]
+        if not processed:
+            logger.warning("Batch returned no analyses, leaving offsets uncommitted")
+            return
+        
+        producer.send_batch('analyzed-articles', processed)
+        consumer.commit()
+        logger.success(f"✓ Published {len(processed)}/{len(prompts)} analyzed articles to analyzed-articles")
+        
+    finally:
+        batch_client.close()
+        producer.close()
+        consumer.close()
+
+
 def send_test_article():
     """
     Send a test article to Kafka for processing
@@ -145,6 +248,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == 'send':
         # Send test article
         send_test_article()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--batch':
+        # Offline backfill through the Groq Batch API
+        process_backfill_batch(int(sys.argv[2]) if len(sys.argv) > 2 else BACKFILL_MESSAGES)
     else:
         # Process from Kafka
         process_from_kafka()
@@ -0,0 +1,22 @@
+"""
+Fulltext Escaping Tests
+User input must reach the fulltext indexes as literal terms
+"""
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from graph.neo4j_client import escape_fulltext
+
+
+def test_special_characters_are_escaped():
+    assert escape_fulltext('a+b (c) "d" e:f') == 'a\\+b \\(c\\) \\"d\\" e\\:f'
+
+
+def test_boolean_operators_are_neutralised():
+    assert escape_fulltext('Biden AND NOT Trump OR Xi') == 'biden and not trump or xi'
+
+
+def test_plain_text_is_lowercased():
+    assert escape_fulltext('United Nations') == 'united nations'
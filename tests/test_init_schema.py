@@ -0,0 +1,63 @@
+"""
+Schema Splitter Tests
+Splitting schema.cypher into statements with iter_statements
+"""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("neo4j")
+
+from graph.init_schema import DDL_PATTERN, iter_statements
+
+
+def split(source):
+    return list(iter_statements(source.splitlines(keepends=True)))
+
+
+def test_splits_on_semicolons():
+    assert split("RETURN 1;\nRETURN 2;") == ["RETURN 1", "RETURN 2"]
+
+
+def test_final_statement_without_semicolon():
+    assert split("RETURN 1;\nRETURN 2\n") == ["RETURN 1", "RETURN 2"]
+
+
+def test_multi_line_statement():
+    source = "CREATE INDEX a IF NOT EXISTS\nFOR (n:Node)\nON (n.name);\n"
+    assert split(source) == ["CREATE INDEX a IF NOT EXISTS\nFOR (n:Node)\nON (n.name)"]
+
+
+def test_comments_and_blank_lines_are_dropped():
+    source = "// header\n\nRETURN 1; // trailing\n// RETURN 2;\n"
+    assert split(source) == ["RETURN 1"]
+
+
+def test_semicolon_and_comment_inside_quotes():
+    source = "RETURN 'a;b' AS x, \"http://example.com\" AS y;\nRETURN 2;"
+    assert split(source) == ["RETURN 'a;b' AS x, \"http://example.com\" AS y", "RETURN 2"]
+
+
+def test_semicolon_and_comment_inside_backticks():
+    source = "MATCH (n:`odd;label//x`) RETURN n;\nRETURN 2;"
+    assert split(source) == ["MATCH (n:`odd;label//x`) RETURN n", "RETURN 2"]
+
+
+def test_escaped_quotes():
+    source = "RETURN 'it\\'s; fine' AS x;\nRETURN \"say \\\"hi;\\\"\" AS y;"
+    assert split(source) == ["RETURN 'it\\'s; fine' AS x", "RETURN \"say \\\"hi;\\\"\" AS y"]
+
+
+def test_string_spanning_lines():
+    source = "RETURN 'line one;\nline two' AS x;\nRETURN 2;"
+    assert split(source) == ["RETURN 'line one;\nline two' AS x", "RETURN 2"]
+
+
+def test_schema_file_parses():
+    schema = Path(__file__).parent.parent / "graph" / "schema.cypher"
+    with open(schema) as f:
+        statements = list(iter_statements(f))
+    assert statements
+    assert all(not s.endswith(";") for s in statements)
+    assert any(DDL_PATTERN.match(s) for s in statements)
@@ -0,0 +1,44 @@
+"""
+Groq Batch Client Tests
+Parsing of Batch API output files
+"""
+
+import orjson
+import pytest
+
+pytest.importorskip("groq")
+
+from models.llm_batch import GroqBatchClient
+
+
+def line(custom_id, content=None, error=None):
+    record = {'custom_id': custom_id, 'error': error}
+    if content is not None:
+        record['response'] = {
+            'status_code': 200,
+            'body': {'choices': [{'message': {'role': 'assistant', 'content': content}}]},
+        }
+    return orjson.dumps(record)
+
+
+def test_parse_results_maps_custom_ids():
+    output = b"\n".join([line('a', 'first'), line('b', 'second')]) + b"\n"
+    assert GroqBatchClient.parse_results(output) == {'a': 'first', 'b': 'second'}
+
+
+def test_parse_results_failed_request_is_none():
+    output = b"\n".join([
+        line('ok', 'text'),
+        line('bad', error={'code': 'rate_limit_exceeded'}),
+        orjson.dumps({'custom_id': 'empty', 'response': {'body': {'choices': []}}}),
+    ])
+    assert GroqBatchClient.parse_results(output) == {'ok': 'text', 'bad': None, 'empty': None}
+
+
+def test_parse_results_skips_blank_lines():
+    output = b"\n" + line('a', 'x') + b"\n\n  \n"
+    assert GroqBatchClient.parse_results(output) == {'a': 'x'}
+
+
+def test_parse_results_empty_output():
+    assert GroqBatchClient.parse_results(b"") == {}
@@ -0,0 +1,98 @@
+"""
+LLM Response Cache Tests
+Exact and opt-in semantic reuse in SemanticCache
+"""
+
+import numpy as np
+
+from models.llm_cache import SemanticCache
+
+
+CONTEXT = {'system_prompt': 'sys', 'model': 'm', 'temperature': 0.3}
+
+
+class FakeEmbedder:
+    """Maps known prompts to fixed unit vectors"""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+        self.calls = 0
+        
+    def fits(self, text):
+        return True
+        
+    def encode(self, texts):
+        self.calls += 1
+        return [list(self.vectors[t] / np.linalg.norm(self.vectors[t])) for t in texts]
+
+
+def make_cache(**kwargs):
+    embedder = FakeEmbedder({
+        'a': np.array([1.0, 0.0, 0.0]),
+        'a2': np.array([1.0, 0.01, 0.0]),
+        'b': np.array([0.0, 1.0, 0.0]),
+    })
+    return SemanticCache(embedder=embedder, **kwargs), embedder
+
+
+def test_exact_hit():
+    cache, _ = make_cache()
+    cache.put('a', CONTEXT, 'answer')
+    assert cache.get('a', CONTEXT) == 'answer'
+    assert cache.hits['exact'] == 1
+
+
+def test_context_is_part_of_key():
+    cache, _ = make_cache()
+    cache.put('a', CONTEXT, 'answer')
+    assert cache.get('a', {**CONTEXT, 'temperature': 0.9}) is None
+
+
+def test_semantic_is_opt_in():
+    cache, embedder = make_cache()
+    cache.put('a', CONTEXT, 'answer')
+    assert cache.get('a2', CONTEXT) is None
+    assert embedder.calls == 0
+
+
+def test_semantic_hit_when_opted_in():
+    cache, _ = make_cache()
+    cache.put('a', CONTEXT, 'answer', semantic=True)
+    assert cache.get('a2', CONTEXT, semantic=True) == 'answer'
+    assert cache.get('b', CONTEXT, semantic=True) is None
+    assert cache.hits['semantic'] == 1
+
+
+def test_semantic_hit_requires_same_context():
+    cache, _ = make_cache()
+    cache.put('a', CONTEXT, 'answer', semantic=True)
+    assert cache.get('a2', {**CONTEXT, 'system_prompt': 'other'}, semantic=True) is None
+
+
+def test_embedder_not_loaded_for_exact_lookups():
+    cache = SemanticCache()
+    cache.put('a', CONTEXT, 'answer')
+    assert cache.get('a', CONTEXT) == 'answer'
+    assert not cache._embedder_loaded
+
+
+def test_exact_lru_eviction():
+    cache, _ = make_cache(max_entries=2)
+    cache.put('1', CONTEXT, 'one')
+    cache.put('2', CONTEXT, 'two')
+    cache.get('1', CONTEXT)
+    cache.put('3', CONTEXT, 'three')
+    assert cache.get('2', CONTEXT) is None
+    assert cache.get('1', CONTEXT) == 'one'
+
+
+def test_vector_ring_evicts_oldest():
+    cache, _ = make_cache(max_vectors=1)
+    cache.put('a', CONTEXT, 'first', semantic=True)
+    cache.put('b', CONTEXT, 'second', semantic=True)
+    cache.clear()
+    cache.put('a', CONTEXT, 'first', semantic=True)
+    cache.put('b', CONTEXT, 'second', semantic=True)
+    cache._exact.clear()
+    assert cache.get('a2', CONTEXT, semantic=True) is None
+    assert cache.get('b', CONTEXT, semantic=True) == 'second'
@@ -0,0 +1,66 @@
+"""
+RSS Crawler Tests
+Seen-item handling while parsing feeds
+"""
+
+import pytest
+
+pytest.importorskip("feedparser")
+
+from crawlers.rss_crawler import RSSCrawler
+
+
+FEED = {'name': 'Test', 'url': 'http://example.com/rss', 'category': 'news'}
+
+ITEM = "<item><title>{title}</title><link>http://example.com/{slug}</link><description>x</description></item>"
+
+
+def rss(*items):
+    return ("<?xml version='1.0'?><rss version='2.0'><channel><title>T</title>"
+            + "".join(items) + "</channel></rss>").encode()
+
+
+def make_crawler(tmp_path):
+    return RSSCrawler(
+        feeds=[FEED],
+        state_path=None,
+        seen_path=str(tmp_path / 'seen.bloom'),
+    )
+
+
+def test_committed_articles_are_skipped(tmp_path):
+    crawler = make_crawler(tmp_path)
+    raw = rss(ITEM.format(title='A', slug='a'), ITEM.format(title='B', slug='b'))
+
+    assert [a.title for a in crawler._parse_feed_bytes(raw, FEED)] == ['A', 'B']
+    crawler.commit_seen()
+    assert crawler._parse_feed_bytes(raw, FEED) == []
+
+
+def test_uncommitted_articles_are_emitted_again(tmp_path):
+    crawler = make_crawler(tmp_path)
+    raw = rss(ITEM.format(title='A', slug='a'))
+
+    assert len(crawler._parse_feed_bytes(raw, FEED)) == 1
+    crawler._discard_pending()
+    assert len(crawler._parse_feed_bytes(raw, FEED)) == 1
+
+
+def test_malformed_feed_keeps_entries_before_the_error(tmp_path):
+    crawler = make_crawler(tmp_path)
+    raw = rss(
+        ITEM.format(title='A', slug='a'),
+        ITEM.format(title='B', slug='b'),
+        ITEM.format(title='C & broken', slug='c'),
+    )
+
+    titles = sorted(a.title for a in crawler._parse_feed_bytes(raw, FEED))
+    assert len(titles) == 3
+    assert titles[:2] == ['A', 'B']
+
+
+def test_duplicate_entries_in_one_fetch(tmp_path):
+    crawler = make_crawler(tmp_path)
+    raw = rss(ITEM.format(title='A', slug='a'), ITEM.format(title='A again', slug='a'))
+
+    assert [a.title for a in crawler._parse_feed_bytes(raw, FEED)] == ['A']